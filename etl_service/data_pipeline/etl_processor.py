@@ -12,6 +12,7 @@ from etl_service.data_pipeline.transformer import Transformer
 from etl_service.datastore_adapters.elasticsearch_adapter import ElasticsearchAdapter
 from etl_service.datastore_adapters.postgres_adapter import PostgresAdapter
 from etl_service.datastore_adapters.redis_adapter import RedisAdapter
+from etl_service.utility.change_notifier import RedisChangeNotifier
 from etl_service.utility.logger import setup_logging
 from etl_service.utility.settings import Settings, settings
 from etl_service.utility.state_manager import RedisStateManager, State
@@ -58,6 +59,12 @@ def run_data_pipeline(
                 eks_conn=eks_conn,
                 state=state,
                 batch_size=config.eks.load_batch_size,
+                notifier=RedisChangeNotifier(
+                    redis_adapter=redis_conn,
+                    channel=config.cache.invalidation_channel,
+                    batch_size=config.cache.invalidation_batch_size,
+                    generation_key_prefix=config.cache.generation_key_prefix,
+                ),
             )
             transformer = Transformer(
                 next_node=loader.process(),
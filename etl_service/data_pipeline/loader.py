@@ -4,6 +4,7 @@ from etl_service.data_pipeline.interfaces.data_process_interface import (
     DataProcessInterface,
 )
 from etl_service.datastore_adapters.elasticsearch_adapter import ElasticsearchAdapter
+from etl_service.utility.change_notifier import BaseChangeNotifier
 from etl_service.utility.logger import setup_logging
 from etl_service.utility.state_manager import State
 
@@ -16,10 +17,12 @@ class Loader(DataProcessInterface):
         eks_conn: ElasticsearchAdapter,
         state: State,
         batch_size: int,
+        notifier: BaseChangeNotifier | None = None,
     ):
         self.eks_conn = eks_conn
         self.state = state
         self.batch_size = batch_size
+        self.notifier = notifier
 
     def process(self):
         """
@@ -68,6 +71,10 @@ class Loader(DataProcessInterface):
                     raise_on_exception=True,
                 )
 
+                if self.notifier and data_in:
+                    self.notifier.notify(index=index, ids=[row.get("id") for row in data_in])
+                    logger.debug("Loader: change notification sent: %s, %s documents", index, len(data_in))
+
                 if saved_state:
                     logger.warning(
                         "Loader: Updating current state: `%s` with value: `%s`",
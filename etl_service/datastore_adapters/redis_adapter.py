@@ -72,3 +72,13 @@ class RedisAdapter(DatastoreAdapter):
     @datastore_reconnect
     def set(self, name: KeyT, value: EncodableT, *args, **kwargs) -> None:
         return self._connection.set(name, value, *args, **kwargs)
+
+    @backoff(retry_exceptions=base_adapter_exceptions)
+    @datastore_reconnect
+    def publish(self, channel: str, message: EncodableT) -> int:
+        return self._connection.publish(channel, message)
+
+    @backoff(retry_exceptions=base_adapter_exceptions)
+    @datastore_reconnect
+    def incr(self, name: KeyT, amount: int = 1) -> int:
+        return self._connection.incr(name, amount)
@@ -2,7 +2,7 @@ from typing import Optional, Union
 
 from pydantic import Field
 
-from etl_service.models.mixins import IdMixin, NameMixin
+from etl_service.models.mixins import IdMixin, NameMixin, UpdatedAtMixin
 from etl_service.utility.logger import setup_logging
 
 logger = setup_logging()
@@ -16,7 +16,7 @@ class Genre(IdMixin, NameMixin):
     """Defines genre model"""
 
 
-class Filmwork(IdMixin):
+class Filmwork(IdMixin, UpdatedAtMixin):
     """Defines filmwork model"""
 
     rating: Union[str, float, None] = Field(default=None, serialization_alias="imdb_rating")
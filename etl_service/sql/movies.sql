@@ -3,7 +3,7 @@ SELECT
     fw.rating as rating,
     fw.title,
     fw.description,
-    fw.updated_at,
+    GREATEST(fw.updated_at, MAX(g.updated_at), MAX(p.updated_at)) as updated_at,
     COALESCE(
         json_agg(DISTINCT g.name),'[]') as genres_names,
     COALESCE(
@@ -73,5 +73,5 @@ WHERE
 GROUP BY
     fw.id
 ORDER BY
-    fw.updated_at
+    updated_at
  ;
\ No newline at end of file
@@ -0,0 +1,39 @@
+import json
+import time
+from abc import ABC, abstractmethod
+
+from etl_service.datastore_adapters.redis_adapter import RedisAdapter
+from etl_service.utility.support_functions import split_into_chunks
+
+
+class BaseChangeNotifier(ABC):
+    """Base class for change notifier."""
+
+    @abstractmethod
+    def notify(self, index: str, ids: list[str]) -> None:
+        """Notify consumers that documents of the index have changed."""
+
+
+class RedisChangeNotifier(BaseChangeNotifier):
+    """
+    Bumps the generation of the changed index and publishes it with the IDs of
+    changed documents to a Redis pub/sub channel.
+
+    The movies API subscribes to the channel to evict cached documents. The generation
+    is part of its query cache keys, so bumping it invalidates all cached queries over the index.
+    The time of the change is stored next to the generation and serves as `Last-Modified`
+    of the API responses built from the index.
+    """
+
+    def __init__(self, redis_adapter: RedisAdapter, channel: str, batch_size: int, generation_key_prefix: str):
+        self.redis_adapter = redis_adapter
+        self.channel = channel
+        self.batch_size = batch_size
+        self.generation_key_prefix = generation_key_prefix
+
+    def notify(self, index: str, ids: list[str]) -> None:
+        generation, modified = self.redis_adapter.incr(f"{self.generation_key_prefix}{index}"), time.time()
+        self.redis_adapter.set(f"{self.generation_key_prefix}{index}:modified", modified)
+        for ids_chunk in split_into_chunks(ids, self.batch_size):
+            message = {"index": index, "ids": ids_chunk, "generation": generation, "modified": modified}
+            self.redis_adapter.publish(self.channel, json.dumps(message))
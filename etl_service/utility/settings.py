@@ -19,6 +19,14 @@ class RedisSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="REDIS_")
 
 
+class CacheSettings(BaseSettings):
+    invalidation_channel: str = Field(default="cache:invalidation")
+    invalidation_batch_size: int = Field(default=1000)
+    generation_key_prefix: str = Field(default="cache:generation:")
+
+    model_config = SettingsConfigDict(env_prefix="CACHE_")
+
+
 class DatabaseSettings(BaseSettings):
     db: SecretStr = Field(...)
     user: SecretStr = Field(...)
@@ -58,6 +66,7 @@ class Settings(BaseSettings):
     eks: ElasticSearchSettings = Field(default=ElasticSearchSettings())
     general: GeneralSettings = Field(default=GeneralSettings())
     redis: RedisSettings = Field(default=RedisSettings())
+    cache: CacheSettings = Field(default=CacheSettings())
 
     model_config = SettingsConfigDict(validate_default=True)
 
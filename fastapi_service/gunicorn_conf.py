@@ -1,4 +1,16 @@
+import os
+
 bind = "0.0.0.0:9090"
 workers = 5
 threads = 2
 worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def child_exit(server, worker):
+    """
+    Drop the metrics of an exited worker when Prometheus multiprocess mode is on.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,8 +1,14 @@
 from fastapi.routing import APIRouter
 
 from fastapi_service.src.api.v1 import router as v1_router
+from fastapi_service.src.api.cache import router as cache_router
+from fastapi_service.src.api.elasticsearch import router as elasticsearch_router
 from fastapi_service.src.api.healthcheck import router as healthcheck_router
+from fastapi_service.src.api.metrics import router as metrics_router
 
 router = APIRouter()
 router.include_router(v1_router, prefix="/v1")
 router.include_router(healthcheck_router)
+router.include_router(cache_router)
+router.include_router(elasticsearch_router)
+router.include_router(metrics_router)
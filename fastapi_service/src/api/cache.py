@@ -0,0 +1,50 @@
+import secrets
+from http import HTTPStatus
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import ORJSONResponse
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.services.film.warmer import film_cache_warmer
+from fastapi_service.src.services.genre.catalogue import genre_catalogue
+from fastapi_service.src.services.redis.cache import get_cache_stats
+from fastapi_service.src.services.redis.generation import index_generations
+from fastapi_service.src.services.redis.popularity import popularity_tracker
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+CACHED_INDICES = (settings.eks.films_index, settings.eks.genres_index, settings.eks.persons_index)
+
+
+@router.get("/stats", summary="Cache hit/miss counters of the current worker")
+async def cache_stats() -> ORJSONResponse:
+    return ORJSONResponse(
+        status_code=200,
+        content={
+            **get_cache_stats(),
+            "genre_catalogue": {"enabled": settings.cache.genre_catalogue_enabled, **genre_catalogue.as_dict()},
+            "popularity": {"enabled": settings.cache.popularity_enabled, **popularity_tracker.as_dict()},
+            "warmup": {"enabled": settings.cache.warmup_enabled, **film_cache_warmer.as_dict()},
+        },
+    )
+
+
+@router.post("/generations/{index}", summary="Invalidate all cached queries over an index")
+async def bump_index_generation(index: str, x_cache_admin_token: str = Header(default="")) -> ORJSONResponse:
+    """
+    Bump the generation of an index, e.g. after it was reindexed outside the ETL service.
+
+    Requires the `X-Cache-Admin-Token` header to match `CACHE_ADMIN_TOKEN`;
+    the endpoint is disabled when no token is configured.
+    """
+    admin_token = settings.cache.admin_token.get_secret_value() if settings.cache.admin_token else ""
+    if not admin_token or not secrets.compare_digest(x_cache_admin_token.encode(), admin_token.encode()):
+        raise HTTPException(status_code=HTTPStatus.FORBIDDEN, detail="Invalid cache admin token")
+    if index not in CACHED_INDICES:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=f"Unknown index: {index}")
+
+    generation = await index_generations.bump(index)
+    return ORJSONResponse(
+        status_code=200,
+        content={"index": index, "generation": generation},
+    )
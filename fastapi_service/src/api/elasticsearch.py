@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.db.elasticsearch import get_elastic
+from fastapi_service.src.services.elasticsearch.breaker import es_breaker
+from fastapi_service.src.services.elasticsearch.msearch import get_multi_search_batcher
+
+router = APIRouter(prefix="/elasticsearch", tags=["elasticsearch"])
+
+
+@router.get("/stats", summary="Multi-search batching and circuit breaker counters of the current worker")
+async def elasticsearch_stats() -> ORJSONResponse:
+    msearch: dict[str, object] = {"enabled": settings.eks.msearch_enabled}
+    if settings.eks.msearch_enabled:
+        msearch.update(get_multi_search_batcher(await get_elastic()).stats.as_dict())
+    return ORJSONResponse(
+        status_code=200,
+        content={
+            "msearch": msearch,
+            "breaker": {"enabled": settings.eks.breaker_enabled, **es_breaker.as_dict()},
+        },
+    )
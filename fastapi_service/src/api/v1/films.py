@@ -1,13 +1,34 @@
+from datetime import datetime
 from enum import Enum
 from http import HTTPStatus
-from typing import Annotated, cast
+from typing import Annotated, Any, AsyncIterator, cast
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
-from fastapi_service.src.api.v1.models_response.film import DefaultFilmResponse, DetailedFilmResponse
-from fastapi_service.src.api.v1.parameters.pagination import PaginationParameters, fetch_pagination_parameters
-from fastapi_service.src.api.v1.transformers.film_transromer import DefaultFilmTransformer, DetailedFilmTransformer
+from fastapi_service.src.api.v1.models_response.film import (
+    DefaultFilmResponse,
+    DetailedFilmResponse,
+    FacetedFilmsResponse,
+    FilmBatchItemResponse,
+)
+from fastapi_service.src.api.v1.parameters.batch import BatchParameters
+from fastapi_service.src.api.v1.parameters.pagination import (
+    NEXT_CURSOR_HEADER,
+    CursorPaginationParameters,
+    PaginationParameters,
+    fetch_cursor_pagination_parameters,
+    fetch_pagination_parameters,
+)
+from fastapi_service.src.api.v1.transformers.film_transromer import (
+    DefaultFilmTransformer,
+    DetailedFilmTransformer,
+    FilmFacetsTransformer,
+)
 from fastapi_service.src.core.exceptions import BadRequestError
+from fastapi_service.src.core.timing import TimedORJSONResponse
+from fastapi_service.src.models.film import FilmFacets, FilmListItem
 from fastapi_service.src.services.film import FilmService, get_film_service
 
 router = APIRouter(prefix="/films", tags=["films"])
@@ -19,54 +40,86 @@ class SortOrder(str, Enum):
 
 
 get_pagination_parameters = Depends(fetch_pagination_parameters)
+get_cursor_pagination_parameters = Depends(fetch_cursor_pagination_parameters)
 get_film_service_dep = Depends(get_film_service)
 
 
 @router.get(
     "",
     summary="Retrieve a list of films based on parameters",
-    response_model=list[DefaultFilmResponse],
+    response_model=list[DefaultFilmResponse] | FacetedFilmsResponse,
     status_code=status.HTTP_200_OK,
 )
 async def get_films(
     sort: list[SortOrder] = Query([SortOrder.IMDB_RATING_DESC]),
     genre: str | None = Query(None),
-    pagination: PaginationParameters = get_pagination_parameters,
+    facets: bool = Query(False),
+    pagination: CursorPaginationParameters = get_cursor_pagination_parameters,
     film_service: FilmService = get_film_service_dep,
-) -> list[DefaultFilmResponse]:
+) -> TimedORJSONResponse:
     """
     Retrieve a list of films based on sorting, genre, and pagination parameters.
+    With `facets`, the films are returned with their counts by genre, rating and director.
     """
+    if facets and pagination.cursor:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Facets are not available with a cursor")
+
+    headers = {}
     try:
-        films = await film_service.get_films(
-            sort=[item.value for item in sort],
-            genre=genre,
-            page_number=pagination.page,
-            page_size=pagination.size
-        )
+        if facets:
+            films, film_facets = await film_service.get_films_with_facets(
+                sort=[item.value for item in sort],
+                genre=genre,
+                page_number=pagination.page,
+                page_size=pagination.size,
+            )
+            return _faceted_response(films, film_facets)
+        elif pagination.cursor:
+            films, next_cursor = await film_service.get_films_page(
+                sort=[item.value for item in sort], genre=genre, page_size=pagination.size, cursor=pagination.cursor
+            )
+            if next_cursor:
+                headers[NEXT_CURSOR_HEADER] = next_cursor
+        else:
+            films = await film_service.get_films(
+                sort=[item.value for item in sort],
+                genre=genre,
+                page_number=pagination.page,
+                page_size=pagination.size
+            )
     except BadRequestError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=e.message)
 
     transformer = DefaultFilmTransformer()
-    return transformer.to_response_list(films)
+    return TimedORJSONResponse(content=transformer.to_content_list(films), headers=headers)
 
 
 @router.get(
     "/search",
     summary="Full-text search for films",
-    response_model=list[DefaultFilmResponse],
+    response_model=list[DefaultFilmResponse] | FacetedFilmsResponse,
     status_code=status.HTTP_200_OK,
 )
 async def search_films(
     query: str,
     sort: list[SortOrder] = Query([SortOrder.IMDB_RATING_DESC]),
+    facets: bool = Query(False),
     pagination: PaginationParameters = get_pagination_parameters,
     film_service: FilmService = get_film_service_dep,
-) -> list[DefaultFilmResponse]:
+) -> TimedORJSONResponse:
     """
     Perform a full-text search for films based on query, sorting, and pagination parameters.
+    With `facets`, the films are returned with the counts of all matching films by genre, rating and director.
     """
     try:
+        if facets:
+            films, film_facets = await film_service.search_films_with_facets(
+                query=query,
+                sort=[item.value for item in sort],
+                page_number=pagination.page,
+                page_size=pagination.size,
+            )
+            return _faceted_response(films, film_facets)
         films = await film_service.search_films(
             query=query,
             sort=[item.value for item in sort],
@@ -77,7 +130,85 @@ async def search_films(
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=e.message)
 
     transformer = DefaultFilmTransformer()
-    return transformer.to_response_list(films)
+    return TimedORJSONResponse(content=transformer.to_content_list(films))
+
+
+def _faceted_response(films: list[FilmListItem], facets: FilmFacets) -> TimedORJSONResponse:
+    return TimedORJSONResponse(
+        content={
+            "films": DefaultFilmTransformer().to_content_list(films),
+            "facets": FilmFacetsTransformer().to_content(facets),
+        }
+    )
+
+
+@router.get(
+    "/export",
+    summary="Export films as NDJSON",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_films(
+    fields: Annotated[list[str] | None, Query()] = None,
+    updated_since: Annotated[datetime | None, Query()] = None,
+    film_service: FilmService = get_film_service_dep,
+) -> StreamingResponse:
+    """
+    Stream the documents of all films, one JSON object per line.
+
+    `fields` selects the fields of the documents to export and `updated_since`
+    exports only the films updated at or after the given time, so partners can
+    sync incrementally. The first batch is fetched before the response starts,
+    so invalid parameters and an unavailable Elasticsearch are reported with
+    their status code; a failure in a later batch cuts the stream short.
+    """
+    batches = film_service.export_films(fields=fields, updated_since=updated_since)
+    try:
+        first_batch = await anext(batches, [])
+    except BadRequestError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=e.message)
+
+    return StreamingResponse(_ndjson(first_batch, batches), media_type="application/x-ndjson")
+
+
+async def _ndjson(
+    first_batch: list[dict[str, Any]], batches: AsyncIterator[list[dict[str, Any]]]
+) -> AsyncIterator[bytes]:
+    """
+    Render batches of documents as NDJSON chunks, one chunk per batch.
+    """
+    yield b"".join(orjson.dumps(document, option=orjson.OPT_APPEND_NEWLINE) for document in first_batch)
+    async for documents in batches:
+        yield b"".join(orjson.dumps(document, option=orjson.OPT_APPEND_NEWLINE) for document in documents)
+
+
+@router.post(
+    "/batch",
+    summary="Retrieve detailed information about several films",
+    response_model=list[FilmBatchItemResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def get_films_batch(
+    batch: BatchParameters, film_service: FilmService = get_film_service_dep
+) -> list[FilmBatchItemResponse]:
+    """
+    Retrieve detailed information about several films by their IDs.
+    Films are returned in the order of the requested IDs, with `found` set to false for missing films.
+    """
+    try:
+        films = await film_service.get_films_by_ids(batch.ids)
+    except BadRequestError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=e.message)
+
+    transformer = DetailedFilmTransformer()
+    return [
+        FilmBatchItemResponse(
+            uuid=film_id,
+            found=film is not None,
+            film=transformer.to_response(film) if film is not None else None,
+        )
+        for film_id, film in zip(batch.ids, films, strict=True)
+    ]
 
 
 @router.get(
@@ -3,14 +3,19 @@ from http import HTTPStatus
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from fastapi_service.src.api.v1.models_response.genre import DefaultGenreResponse, DetailedGenreResponse
-from fastapi_service.src.api.v1.parameters.pagination import PaginationParameters, fetch_pagination_parameters
+from fastapi_service.src.api.v1.parameters.pagination import (
+    NEXT_CURSOR_HEADER,
+    CursorPaginationParameters,
+    fetch_cursor_pagination_parameters,
+)
 from fastapi_service.src.api.v1.transformers.genre_transformer import DefaultGenreTransformer, DetailedGenreTransformer
 from fastapi_service.src.core.exceptions import BadRequestError
+from fastapi_service.src.core.timing import TimedORJSONResponse
 from fastapi_service.src.services.genre import GenreService, get_genre_service
 
 router = APIRouter(prefix="/genres", tags=["genres"])
 
-get_pagination_parameters = Depends(fetch_pagination_parameters)
+get_cursor_pagination_parameters = Depends(fetch_cursor_pagination_parameters)
 get_genre_service_dep = Depends(get_genre_service)
 
 
@@ -18,19 +23,27 @@ get_genre_service_dep = Depends(get_genre_service)
     "", summary="Retrieve a list of genres", response_model=list[DefaultGenreResponse], status_code=status.HTTP_200_OK
 )
 async def get_genres(
-    pagination: PaginationParameters = get_pagination_parameters,
+    pagination: CursorPaginationParameters = get_cursor_pagination_parameters,
     genre_service: GenreService = get_genre_service_dep,
-) -> list[DefaultGenreResponse]:
+) -> TimedORJSONResponse:
     """
     Retrieve a list of genres based on pagination parameters.
     """
+    headers = {}
     try:
-        genres = await genre_service.fetch_genres(page_number=pagination.page, page_size=pagination.size)
+        if pagination.cursor:
+            genres, next_cursor = await genre_service.fetch_genres_page(
+                page_size=pagination.size, cursor=pagination.cursor
+            )
+            if next_cursor:
+                headers[NEXT_CURSOR_HEADER] = next_cursor
+        else:
+            genres = await genre_service.fetch_genres(page_number=pagination.page, page_size=pagination.size)
     except BadRequestError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=e.message)
 
     transformer = DefaultGenreTransformer()
-    return transformer.to_response_list(genres)
+    return TimedORJSONResponse(content=transformer.to_content_list(genres), headers=headers)
 
 
 @router.get(
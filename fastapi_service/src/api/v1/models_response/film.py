@@ -1,3 +1,5 @@
+from pydantic import BaseModel
+
 from fastapi_service.src.api.v1.models_response.genre import DefaultGenreResponse
 from fastapi_service.src.api.v1.models_response.mixins import NameMixin, TitleMixin, UUIDMixin
 
@@ -16,3 +18,32 @@ class DetailedFilmResponse(DefaultFilmResponse):
     actors: list[DefaultFilmPersonResponse]
     writers: list[DefaultFilmPersonResponse]
     directors: list[DefaultFilmPersonResponse]
+
+
+class FilmBatchItemResponse(UUIDMixin):
+    found: bool
+    film: DetailedFilmResponse | None
+
+
+class GenreFacetResponse(NameMixin):
+    count: int
+
+
+class RatingFacetResponse(BaseModel):
+    imdb_rating: float
+    count: int
+
+
+class DirectorFacetResponse(UUIDMixin, NameMixin):
+    count: int
+
+
+class FilmFacetsResponse(BaseModel):
+    genres: list[GenreFacetResponse]
+    imdb_rating: list[RatingFacetResponse]
+    directors: list[DirectorFacetResponse]
+
+
+class FacetedFilmsResponse(BaseModel):
+    films: list[DefaultFilmResponse]
+    facets: FilmFacetsResponse
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+from fastapi_service.src.api.v1.models_response.mixins import TitleMixin, UUIDMixin
+
+
+class FilmSuggestionResponse(UUIDMixin, TitleMixin):
+    pass
+
+
+class PersonSuggestionResponse(UUIDMixin):
+    full_name: str
+
+
+class SuggestResponse(BaseModel):
+    films: list[FilmSuggestionResponse]
+    persons: list[PersonSuggestionResponse]
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+from fastapi_service.src.core.config import settings
+
+
+class BatchParameters(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=settings.api.batch_max_size)
@@ -1,8 +1,10 @@
-from fastapi import Query
+from fastapi import Depends, Query
 from pydantic import BaseModel
 
 from fastapi_service.src.core.config import settings
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class PaginationParameters(BaseModel):
     page: int
@@ -14,3 +16,23 @@ def fetch_pagination_parameters(
     size: int = Query(settings.api.default_page_size, gt=0, alias="page_size"),
 ) -> PaginationParameters:
     return PaginationParameters(page=page, size=size)
+
+
+get_pagination_parameters = Depends(fetch_pagination_parameters)
+
+
+class CursorPaginationParameters(PaginationParameters):
+    cursor: str | None
+
+
+def fetch_cursor_pagination_parameters(
+    pagination: PaginationParameters = get_pagination_parameters,
+    cursor: str | None = Query(
+        None,
+        description=(
+            "Opaque cursor for deep pagination. Pass `*` to start from the first page, then the value of "
+            "the `X-Next-Cursor` response header to get the next page. `page_number` is ignored with a cursor."
+        ),
+    ),
+) -> CursorPaginationParameters:
+    return CursorPaginationParameters(page=pagination.page, size=pagination.size, cursor=cursor)
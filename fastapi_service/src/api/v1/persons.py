@@ -1,13 +1,19 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from fastapi_service.src.api.v1.models_response.person import (
     DefaultFilmPersonResponse,
     DefaultPersonResponse,
     DetailedPersonResponse,
 )
-from fastapi_service.src.api.v1.parameters.pagination import PaginationParameters, fetch_pagination_parameters
+from fastapi_service.src.api.v1.parameters.pagination import (
+    NEXT_CURSOR_HEADER,
+    CursorPaginationParameters,
+    PaginationParameters,
+    fetch_cursor_pagination_parameters,
+    fetch_pagination_parameters,
+)
 from fastapi_service.src.api.v1.transformers.person_transformer import (
     DefaultPersonFilmTransformer,
     DefaultPersonTransformer,
@@ -20,6 +26,7 @@ router = APIRouter(prefix="/persons", tags=["persons"])
 
 
 get_pagination_parameters = Depends(fetch_pagination_parameters)
+get_cursor_pagination_parameters = Depends(fetch_cursor_pagination_parameters)
 get_person_service_dep = Depends(get_person_service)
 
 
@@ -31,16 +38,24 @@ get_person_service_dep = Depends(get_person_service)
 )
 async def search_person_by_query(
     query: str,
-    pagination: PaginationParameters = get_pagination_parameters,
+    response: Response,
+    pagination: CursorPaginationParameters = get_cursor_pagination_parameters,
     person_service: PersonService = get_person_service_dep,
 ) -> list[DefaultPersonResponse]:
     """
     Perform a full-text search for persons based on query and pagination parameters.
     """
     try:
-        persons = await person_service.search_persons(
-            query=query, page_number=pagination.page, page_size=pagination.size
-        )
+        if pagination.cursor:
+            persons, next_cursor = await person_service.search_persons_page(
+                query=query, page_size=pagination.size, cursor=pagination.cursor
+            )
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        else:
+            persons = await person_service.search_persons(
+                query=query, page_number=pagination.page, page_size=pagination.size
+            )
     except BadRequestError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=e.message)
 
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, Query, status
+
+from fastapi_service.src.api.v1.models_response.suggest import SuggestResponse
+from fastapi_service.src.api.v1.transformers.suggest_transformer import SuggestTransformer
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.timing import TimedORJSONResponse
+from fastapi_service.src.services.suggest import SuggestService, get_suggest_service
+
+router = APIRouter(prefix="/suggest", tags=["suggest"])
+
+get_suggest_service_dep = Depends(get_suggest_service)
+
+
+@router.get(
+    "",
+    summary="Suggest films and persons for a search box",
+    response_model=SuggestResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def suggest(
+    query: str = Query(min_length=1, max_length=100),
+    size: int = Query(settings.api.suggest_default_size, ge=1, le=settings.api.suggest_max_size),
+    suggest_service: SuggestService = get_suggest_service_dep,
+) -> TimedORJSONResponse:
+    """
+    Suggest films by title and persons by full name as the user types.
+    Cheaper than the full-text search endpoints: matches a single prefix-indexed
+    field and returns only IDs and titles or names.
+    """
+    suggestions = await suggest_service.suggest(prefix=query, size=size)
+
+    transformer = SuggestTransformer()
+    return TimedORJSONResponse(content=transformer.to_content(suggestions))
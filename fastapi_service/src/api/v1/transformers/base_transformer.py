@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from fastapi_service.src.core.timing import timed
+
 
 class BaseTransformer(ABC):
     @abstractmethod
@@ -18,4 +20,25 @@ class BaseTransformer(ABC):
         :return: List of transformed objects.
 
         """
-        return [self.to_response(model) for model in model_list]
+        with timed("model"):
+            return [self.to_response(model) for model in model_list]
+
+    def to_content(self, model: Any) -> dict[str, Any]:
+        """
+        Transform the data into a plain dict ready to be rendered by ORJSONResponse.
+        Transformers on hot paths override it to build the dict without a response model.
+        """
+        return self.to_response(model).model_dump()
+
+    def to_content_list(self, model_list: list[Any]) -> list[dict[str, Any]]:
+        """
+        Transform the data into plain dicts ready to be rendered by ORJSONResponse.
+
+        Endpoints returning the content directly skip the response model validation
+        FastAPI would otherwise run on every item.
+
+        :param model_list: List of BaseModel objects to transform.
+        :return: List of transformed dicts.
+        """
+        with timed("model"):
+            return [self.to_content(model) for model in model_list]
@@ -1,25 +1,34 @@
+from typing import Any
+
 from fastapi_service.src.api.v1.models_response.film import (
     DefaultFilmPersonResponse,
     DefaultFilmResponse,
     DetailedFilmResponse,
+    DirectorFacetResponse,
+    FilmFacetsResponse,
+    GenreFacetResponse,
+    RatingFacetResponse,
 )
 from fastapi_service.src.api.v1.models_response.genre import DefaultGenreResponse
 from fastapi_service.src.api.v1.transformers.base_transformer import BaseTransformer
-from fastapi_service.src.models.film import Film, FilmGenre, FilmPerson
+from fastapi_service.src.models.film import Film, FilmFacets, FilmGenre, FilmListItem, FilmPerson
 
 
 class DefaultFilmTransformer(BaseTransformer):
     """
-    Transform a Film object into a DefaultFilmResponse object.
+    Transform a FilmListItem object into a DefaultFilmResponse object.
     """
 
-    def to_response(self, film: Film) -> DefaultFilmResponse:
+    def to_response(self, film: FilmListItem) -> DefaultFilmResponse:
         return DefaultFilmResponse(
             uuid=film.id,
             title=film.title,
             imdb_rating=film.imdb_rating,
         )
 
+    def to_content(self, film: FilmListItem) -> dict[str, Any]:
+        return {"uuid": film.id, "title": film.title, "imdb_rating": film.imdb_rating}
+
 
 class DetailedFilmTransformer(BaseTransformer):
     """
@@ -45,3 +54,21 @@ class DetailedFilmTransformer(BaseTransformer):
     @staticmethod
     def _transform_person(person: FilmPerson) -> DefaultFilmPersonResponse:
         return DefaultFilmPersonResponse(uuid=person.id, name=person.name)
+
+
+class FilmFacetsTransformer(BaseTransformer):
+    """
+    Transform a FilmFacets object into a FilmFacetsResponse object.
+    """
+
+    def to_response(self, facets: FilmFacets) -> FilmFacetsResponse:
+        return FilmFacetsResponse(
+            genres=[GenreFacetResponse(name=genre.name, count=genre.count) for genre in facets.genres],
+            imdb_rating=[
+                RatingFacetResponse(imdb_rating=rating.imdb_rating, count=rating.count) for rating in facets.imdb_rating
+            ],
+            directors=[
+                DirectorFacetResponse(uuid=director.id, name=director.name, count=director.count)
+                for director in facets.directors
+            ],
+        )
@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi_service.src.api.v1.models_response.genre import DefaultGenreResponse, DetailedGenreResponse
 from fastapi_service.src.api.v1.transformers.base_transformer import BaseTransformer
 from fastapi_service.src.models.genre import Genre
@@ -11,6 +13,9 @@ class DefaultGenreTransformer(BaseTransformer):
     def to_response(self, genre: Genre) -> DefaultGenreResponse:
         return DefaultGenreResponse(uuid=genre.id, name=genre.name)
 
+    def to_content(self, genre: Genre) -> dict[str, Any]:
+        return {"uuid": genre.id, "name": genre.name}
+
 
 class DetailedGenreTransformer(BaseTransformer):
     """
@@ -0,0 +1,29 @@
+from typing import Any
+
+from fastapi_service.src.api.v1.models_response.suggest import (
+    FilmSuggestionResponse,
+    PersonSuggestionResponse,
+    SuggestResponse,
+)
+from fastapi_service.src.api.v1.transformers.base_transformer import BaseTransformer
+from fastapi_service.src.models.suggestion import Suggestions
+
+
+class SuggestTransformer(BaseTransformer):
+    """
+    Transforms a Suggestions object into a SuggestResponse object
+    """
+
+    def to_response(self, suggestions: Suggestions) -> SuggestResponse:
+        return SuggestResponse(
+            films=[FilmSuggestionResponse(uuid=film.id, title=film.title) for film in suggestions.films],
+            persons=[
+                PersonSuggestionResponse(uuid=person.id, full_name=person.full_name) for person in suggestions.persons
+            ],
+        )
+
+    def to_content(self, suggestions: Suggestions) -> dict[str, Any]:
+        return {
+            "films": [{"uuid": film.id, "title": film.title} for film in suggestions.films],
+            "persons": [{"uuid": person.id, "full_name": person.full_name} for person in suggestions.persons],
+        }
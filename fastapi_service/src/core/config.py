@@ -1,8 +1,8 @@
 import os
-from typing import Any
+from typing import Any, Literal
 
 from dotenv import load_dotenv
-from pydantic import AnyHttpUrl, Field, RedisDsn, SecretStr
+from pydantic import AnyHttpUrl, Field, RedisDsn, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 env_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".env")
@@ -17,14 +17,86 @@ class RedisSettings(BaseSettings):
     password: SecretStr = Field(...)
     dsn: RedisDsn = Field(...)
     cache_expiration: int = Field(default=(60 * 5))
+    max_connections: int = Field(default=100)
+    pool_timeout: float = Field(default=2.0)
+    socket_keepalive: bool = Field(default=True)
+    socket_timeout: float = Field(default=5.0)
+    socket_connect_timeout: float = Field(default=2.0)
+    health_check_interval: int = Field(default=30)
+    protocol: int = Field(default=2)
 
     model_config = SettingsConfigDict(env_prefix="REDIS_")
 
+    @field_validator("protocol")
+    @classmethod
+    def validate_protocol(cls, value: int) -> int:
+        if value not in (2, 3):
+            raise ValueError("Redis protocol must be 2 (RESP2) or 3 (RESP3)")
+        return value
+
+
+class CacheSettings(BaseSettings):
+    local_enabled: bool = Field(default=False)
+    local_max_entries: int = Field(default=10_000)
+    local_max_bytes: int = Field(default=64 * 1024 * 1024)
+    local_ttl: float = Field(default=10.0)
+    single_flight: bool = Field(default=True)
+    lock_enabled: bool = Field(default=False)
+    lock_ttl: float = Field(default=5.0)
+    lock_poll_interval: float = Field(default=0.05)
+    early_refresh_beta: float = Field(default=1.0)
+    model_stale_ttl: int = Field(default=(60 * 5))
+    query_stale_ttl: int = Field(default=60)
+    negative_ttl: int = Field(default=30)
+    write_behind: bool = Field(default=True)
+    write_batch_size: int = Field(default=256)
+    invalidation_enabled: bool = Field(default=True)
+    invalidation_channel: str = Field(default="cache:invalidation")
+    generation_key_prefix: str = Field(default="cache:generation:")
+    generation_refresh_interval: float = Field(default=5.0)
+    admin_token: SecretStr | None = Field(default=None)
+    serializer: Literal["json", "msgpack"] = Field(default="json")
+    compression: Literal["none", "zstd", "lz4"] = Field(default="none")
+    compression_threshold: int = Field(default=1024)
+    compression_level: int = Field(default=3)
+    response_enabled: bool = Field(default=True)
+    response_ttl: int = Field(default=60)
+    films_max_age: int = Field(default=60)
+    genres_max_age: int = Field(default=300)
+    persons_max_age: int = Field(default=60)
+    suggest_ttl: int = Field(default=30)
+    facets_ttl: int = Field(default=(60 * 60))
+    genre_catalogue_enabled: bool = Field(default=True)
+    genre_catalogue_refresh_interval: float = Field(default=60.0)
+    genre_catalogue_max_size: int = Field(default=1000)
+    popularity_enabled: bool = Field(default=True)
+    popularity_key_prefix: str = Field(default="cache:popularity:")
+    popularity_window: int = Field(default=(60 * 60))
+    popularity_max_members: int = Field(default=10_000)
+    popularity_flush_interval: float = Field(default=5.0)
+    warmup_enabled: bool = Field(default=True)
+    warmup_top_n: int = Field(default=100)
+    warmup_concurrency: int = Field(default=4)
+    warmup_interval: float = Field(default=0.0)
+    warmup_lock_name: str = Field(default="cache:warmup:lock")
+
+    model_config = SettingsConfigDict(env_prefix="CACHE_")
+
 
 class ElasticSearchSettings(BaseSettings):
     host: SecretStr = Field(...)
     port: int = Field(default=9200)
     dsn: AnyHttpUrl = Field(default="http://elasticsearch:9200")
+    hosts: list[AnyHttpUrl] = Field(default=[])
+    connections_per_node: int = Field(default=10)
+    http_compress: bool = Field(default=False)
+    request_timeout: float = Field(default=10.0)
+    max_retries: int = Field(default=3)
+    retry_on_timeout: bool = Field(default=True)
+    sniff_on_start: bool = Field(default=False)
+    sniff_on_node_failure: bool = Field(default=False)
+    min_delay_between_sniffing: float = Field(default=60.0)
+    warmup_connections: int = Field(default=4)
     films_index: str = Field(default="movies")
     genres_index: str = Field(default="genres")
     persons_index: str = Field(default="people")
@@ -32,6 +104,18 @@ class ElasticSearchSettings(BaseSettings):
     page_number: int = Field(default=1)
     query: dict[str, Any] = Field(default={})
     sort: list[str] = Field(default=[])
+    pit_keep_alive: str = Field(default="1m")
+    export_batch_size: int = Field(default=500)
+    msearch_enabled: bool = Field(default=False)
+    msearch_window: float = Field(default=0.002)
+    msearch_max_size: int = Field(default=32)
+    breaker_enabled: bool = Field(default=True)
+    breaker_failure_threshold: int = Field(default=5)
+    breaker_recovery_timeout: float = Field(default=10.0)
+    timeout_min: float = Field(default=0.5)
+    timeout_max: float = Field(default=5.0)
+    heavy_timeout_min: float = Field(default=2.0)
+    heavy_timeout_max: float = Field(default=10.0)
 
     model_config = SettingsConfigDict(env_prefix="ELASTICSEARCH_")
 
@@ -39,6 +123,13 @@ class ElasticSearchSettings(BaseSettings):
 class ApiSettings(BaseSettings):
     default_page_number: int = 1
     default_page_size: int = 50
+    batch_max_size: int = 100
+    suggest_default_size: int = 5
+    suggest_max_size: int = 10
+    facet_size: int = 10
+    facet_rating_interval: float = 1.0
+    request_budget: float = 3.0
+    timing_sample_rate: float = 0.05
     prefix: str = Field(default="/api")
 
     model_config = SettingsConfigDict(env_prefix="API_")
@@ -67,6 +158,7 @@ class Settings(BaseSettings):
     eks: ElasticSearchSettings = Field(default=ElasticSearchSettings())
     general: GeneralSettings = Field(default=GeneralSettings())
     redis: RedisSettings = Field(default=RedisSettings())
+    cache: CacheSettings = Field(default=CacheSettings())
     api: ApiSettings = Field(default=ApiSettings())
     uvicorn: UvicornSettings = Field(default=UvicornSettings())
 
@@ -0,0 +1,45 @@
+import time
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def remaining_budget() -> float | None:
+    """
+    Return the time in seconds left until the deadline of the current request,
+    None outside of a request or in background tasks detached from it.
+    """
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class DeadlineMiddleware:
+    """
+    Sets a deadline of every HTTP request from a latency budget.
+
+    Calls to backends made while handling the request are cut off once the
+    deadline has passed, so a slow backend cannot hold requests indefinitely.
+    """
+
+    def __init__(self, app: ASGIApp, *, budget: float):
+        """
+        :param app: ASGI application
+        :param budget: time in seconds a request may spend waiting for backends
+        """
+        self.app = app
+        self.budget = budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_deadline.set(time.monotonic() + self.budget)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_deadline.reset(token)
@@ -47,6 +47,24 @@ class BadRequestError(BaseError):
     pass
 
 
+class ServiceUnavailableError(BaseError):
+    """Exception representing a 503 status code, raised when a backend cannot answer in time.
+
+    Attributes:
+        retry_after (int | None): Seconds after which the client may retry.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        body: Any = None,
+        errors: tuple[Exception, ...] | None = None,
+        retry_after: int | None = None,
+    ):
+        super().__init__(message=message, status_code=503, body=body, errors=errors)
+        self.retry_after = retry_after
+
+
 class ElasticsearchConnectionError(ConnectionError):
     """Elasticsearch connection error."""
 
@@ -80,6 +98,18 @@ async def bad_request_exception_handler(request: Request, exc: BadRequestError)
     raise exc
 
 
+async def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailableError) -> JSONResponse:
+    if isinstance(exc, ServiceUnavailableError):
+        logger.warning(f"ServiceUnavailableError: {exc}")
+        headers = {"Retry-After": str(exc.retry_after)} if exc.retry_after is not None else None
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"message": exc.message},
+            headers=headers,
+        )
+    raise exc
+
+
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     logger.error(f"Unhandled exception: {exc}")
     return JSONResponse(
@@ -96,4 +126,5 @@ def register_exception_handlers(app: FastAPI) -> None:
     """
     app.add_exception_handler(NotFoundError, not_found_exception_handler)
     app.add_exception_handler(BadRequestError, bad_request_exception_handler)
+    app.add_exception_handler(ServiceUnavailableError, service_unavailable_exception_handler)
     app.add_exception_handler(Exception, generic_exception_handler)
@@ -0,0 +1,148 @@
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from fastapi.responses import ORJSONResponse
+from prometheus_client import Histogram
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_DURATION = Histogram(
+    "api_request_duration_seconds",
+    "Duration of HTTP requests",
+    ["handler", "method", "status"],
+)
+REQUEST_SPAN_DURATION = Histogram(
+    "api_request_span_duration_seconds",
+    "Time sampled HTTP requests spent in each span, e.g. cache lookups or Elasticsearch calls",
+    ["handler", "span"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+class RequestTimings:
+    """
+    Time spent by a request in each span.
+
+    The durations of a span recorded several times, e.g. by concurrent cache
+    lookups, are summed, so the sum of all spans may exceed the request duration.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: dict[str, float] = defaultdict(float)
+
+    def add(self, span: str, duration: float) -> None:
+        self.spans[span] += duration
+
+    def server_timing(self) -> str:
+        """
+        Render the spans and the time elapsed so far as a `Server-Timing` header.
+        """
+        entries = [f"{span};dur={duration * 1e3:.2f}" for span, duration in self.spans.items()]
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1e3:.2f}")
+        return ", ".join(entries)
+
+
+# Set for sampled requests only, so recording a span in the others costs a context variable lookup.
+request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def record_timing(span: str, duration: float) -> None:
+    """
+    Add a duration to a span of the current request if it is sampled.
+
+    :param span: span name, e.g. `es`
+    :param duration: duration in seconds
+    """
+    timings = request_timings.get()
+    if timings is not None:
+        timings.add(span, duration)
+
+
+@contextmanager
+def timed(span: str) -> Iterator[None]:
+    """
+    Record the duration of the block as a span of the current request if it is sampled.
+    """
+    timings = request_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(span, time.perf_counter() - started)
+
+
+class TimedORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse recording the rendering of its content as the `serialize` span.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialize"):
+            return super().render(content)
+
+
+class ServerTimingMiddleware:
+    """
+    Measures HTTP requests and reports where sampled ones spent their time.
+
+    The duration of every request is observed in a Prometheus histogram by handler.
+    A `sample_rate` fraction of the requests also collects the spans recorded while
+    handling it, e.g. cache lookups, Elasticsearch calls and serialization. They are
+    sent in the `Server-Timing` response header and observed in a histogram by
+    handler and span once the response is complete.
+    """
+
+    def __init__(self, app: ASGIApp, *, sample_rate: float):
+        """
+        :param app: ASGI application
+        :param sample_rate: fraction of requests whose spans are collected, from 0 to 1
+        """
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings() if random.random() < self.sample_rate else None
+        token = request_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if timings is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_timings.reset(token)
+            handler = self._handler(scope)
+            REQUEST_DURATION.labels(handler, scope["method"], str(status)).observe(time.perf_counter() - started)
+            if timings is not None:
+                for span, duration in timings.spans.items():
+                    REQUEST_SPAN_DURATION.labels(handler, span).observe(duration)
+
+    @staticmethod
+    def _handler(scope: Scope) -> str:
+        """
+        Name of the endpoint that handled the request, set in the scope by the router;
+        requests answered before routing, e.g. from the response cache, have none.
+        """
+        endpoint = scope.get("endpoint")
+        return getattr(endpoint, "__name__", "none")
@@ -3,7 +3,14 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI
 
+from fastapi_service.src.core.config import settings
 from fastapi_service.src.db import elasticsearch, redis
+from fastapi_service.src.services.film import get_film_service
+from fastapi_service.src.services.film.warmer import film_cache_warmer
+from fastapi_service.src.services.genre.catalogue import genre_catalogue
+from fastapi_service.src.services.redis.invalidation import cache_invalidation_listener
+from fastapi_service.src.services.redis.pipeline import cache_writer
+from fastapi_service.src.services.redis.popularity import popularity_tracker
 
 
 @asynccontextmanager
@@ -13,6 +20,19 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     """
     await elasticsearch.es_open()
     await redis.redis_open()
+    if settings.cache.invalidation_enabled:
+        await cache_invalidation_listener.start()
+    if settings.cache.genre_catalogue_enabled:
+        await genre_catalogue.start()
+    if settings.cache.popularity_enabled:
+        await popularity_tracker.start()
+    if settings.cache.warmup_enabled:
+        await film_cache_warmer.start(get_film_service(await elasticsearch.get_elastic()))
     yield
-    await redis.redis.close()
+    await film_cache_warmer.stop()
+    await popularity_tracker.stop()
+    await genre_catalogue.stop()
+    await cache_invalidation_listener.stop()
+    await cache_writer.flush()
+    await redis.redis_close()
     await elasticsearch.es_close()
@@ -1,3 +1,5 @@
+import asyncio
+
 from elasticsearch import AsyncElasticsearch
 
 from fastapi_service.src.core.config import settings
@@ -16,9 +18,37 @@ async def es_open() -> None:
     global es
     if es is None:
         es = AsyncElasticsearch(
-            hosts=[settings.eks.dsn.unicode_string()],
+            hosts=[host.unicode_string() for host in settings.eks.hosts or [settings.eks.dsn]],
+            connections_per_node=settings.eks.connections_per_node,
+            http_compress=settings.eks.http_compress,
+            request_timeout=settings.eks.request_timeout,
+            max_retries=settings.eks.max_retries,
+            retry_on_timeout=settings.eks.retry_on_timeout,
+            sniff_on_start=settings.eks.sniff_on_start,
+            sniff_on_node_failure=settings.eks.sniff_on_node_failure,
+            min_delay_between_sniffing=settings.eks.min_delay_between_sniffing,
         )
         logger.info("Elasticsearch client has been initialized.")
+        await es_warmup(es, settings.eks.warmup_connections)
+
+
+async def es_warmup(client: AsyncElasticsearch, connections: int) -> None:
+    """
+    Open connections of the pool ahead of the first request by pinging Elasticsearch concurrently.
+    Failures are logged only, the pool connects lazily anyway.
+
+    :param client: Elasticsearch client
+    :param connections: number of concurrent pings, 0 to skip the warm-up
+    """
+    if connections <= 0:
+        return
+
+    results = await asyncio.gather(*(client.ping() for _ in range(connections)), return_exceptions=True)
+    available = sum(result is True for result in results)
+    if available:
+        logger.info(f"Elasticsearch connection pool has been warmed up with {available} connections.")
+    else:
+        logger.warning("Elasticsearch connection pool warm-up failed, connections will be opened on demand.")
 
 
 async def es_close() -> None:
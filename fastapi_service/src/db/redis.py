@@ -1,4 +1,6 @@
-from redis.asyncio import Redis
+from typing import Any
+
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
 
 from fastapi_service.src.core.config import settings
 from fastapi_service.src.core.exceptions import RedisConnectionError
@@ -7,20 +9,52 @@ from fastapi_service.src.core.logger import setup_logging
 logger = setup_logging(logger_name=__name__)
 
 redis: Redis | None = None
+redis_pubsub: Redis | None = None
+
+
+def _connection_kwargs() -> dict[str, Any]:
+    return {
+        "host": settings.redis.host,
+        "port": settings.redis.port,
+        "username": settings.redis.user.get_secret_value(),
+        "password": settings.redis.password.get_secret_value(),
+        "db": settings.redis.db_number,
+        "socket_keepalive": settings.redis.socket_keepalive,
+        "socket_connect_timeout": settings.redis.socket_connect_timeout,
+        "health_check_interval": settings.redis.health_check_interval,
+        "protocol": settings.redis.protocol,
+    }
 
 
 async def redis_open() -> None:
     """
-    Open Redis connection
+    Open Redis connections.
+    Requests wait up to `pool_timeout` seconds for a free connection when all
+    `max_connections` are in use instead of failing.
+
+    Subscriptions get a pool of their own without `socket_timeout`: a subscriber
+    waits for messages indefinitely, and its liveness is checked every
+    `health_check_interval` seconds instead.
     """
-    global redis
-    redis = Redis(
-        host=settings.redis.host,
-        port=settings.redis.port,
-        username=settings.redis.user.get_secret_value(),
-        password=settings.redis.password.get_secret_value(),
-        db=settings.redis.db_number,
+    global redis, redis_pubsub
+    pool = BlockingConnectionPool(
+        max_connections=settings.redis.max_connections,
+        timeout=settings.redis.pool_timeout,
+        socket_timeout=settings.redis.socket_timeout,
+        **_connection_kwargs(),
     )
+    redis = Redis.from_pool(pool)
+    redis_pubsub = Redis.from_pool(ConnectionPool(socket_timeout=None, **_connection_kwargs()))
+
+
+async def redis_close() -> None:
+    """
+    Close Redis connections.
+    """
+    if redis is not None:
+        await redis.aclose()
+    if redis_pubsub is not None:
+        await redis_pubsub.aclose()
 
 
 async def get_redis() -> Redis:
@@ -32,3 +66,14 @@ async def get_redis() -> Redis:
         logger.critical("Redis is not initialized")
         raise RedisConnectionError("Redis client has not been initialized.")
     return redis
+
+
+async def get_pubsub_redis() -> Redis:
+    """
+    Get Redis instance for subscriptions, whose reads never time out
+    :return Redis instance
+    """
+    if redis_pubsub is None:
+        logger.critical("Redis is not initialized")
+        raise RedisConnectionError("Redis client has not been initialized.")
+    return redis_pubsub
@@ -1,16 +1,18 @@
 import uvicorn
 from fastapi import FastAPI
-from fastapi.responses import ORJSONResponse
 
 from fastapi_service.src.api import router as api_router
 from fastapi_service.src.core import config, exceptions, logger, utils
+from fastapi_service.src.core.deadline import DeadlineMiddleware
+from fastapi_service.src.core.timing import ServerTimingMiddleware, TimedORJSONResponse
+from fastapi_service.src.services.redis.response_cache import CachedRoute, ResponseCacheMiddleware
 
 log_config = logger.get_log_config()
 
 
 app = FastAPI(
     lifespan=utils.lifespan,
-    default_response_class=ORJSONResponse,
+    default_response_class=TimedORJSONResponse,
     title=config.settings.general.project_name,
     version=config.settings.general.version,
     docs_url=config.settings.general.docs_url,
@@ -19,6 +21,33 @@ app = FastAPI(
 
 app.include_router(api_router, prefix=config.settings.api.prefix)
 
+app.add_middleware(
+    ResponseCacheMiddleware,
+    routes={
+        f"{config.settings.api.prefix}/v1/films": CachedRoute(
+            index=config.settings.eks.films_index, max_age=config.settings.cache.films_max_age
+        ),
+        f"{config.settings.api.prefix}/v1/genres": CachedRoute(
+            index=config.settings.eks.genres_index, max_age=config.settings.cache.genres_max_age
+        ),
+        f"{config.settings.api.prefix}/v1/persons": CachedRoute(
+            index=config.settings.eks.persons_index, max_age=config.settings.cache.persons_max_age
+        ),
+        f"{config.settings.api.prefix}/v1/persons/{{person_id}}/films": CachedRoute(
+            index=config.settings.eks.persons_index,
+            max_age=config.settings.cache.persons_max_age,
+            related_indexes=(config.settings.eks.films_index,),
+        ),
+    },
+    ttl=config.settings.cache.response_ttl,
+    store=config.settings.cache.response_enabled,
+    exclude=(f"{config.settings.api.prefix}/v1/films/export",),
+)
+
+app.add_middleware(DeadlineMiddleware, budget=config.settings.api.request_budget)
+
+app.add_middleware(ServerTimingMiddleware, sample_rate=config.settings.api.timing_sample_rate)
+
 exceptions.register_exception_handlers(app=app)
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
-from pydantic import Field
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 
 from fastapi_service.src.models.mixins import IdMixin, NameMixin, ORJSONMixin
 
@@ -11,11 +13,16 @@ class FilmGenre(IdMixin, NameMixin):
     """Defines film genre model"""
 
 
-class FilmShort(ORJSONMixin, IdMixin):
-    """Defines film short model"""
+class FilmListItem(ORJSONMixin, IdMixin):
+    """Defines film list item model, the fields shown in film lists"""
 
     imdb_rating: float | None = Field(None)
     title: str
+
+
+class FilmShort(FilmListItem):
+    """Defines film short model"""
+
     description: str | None = Field("")
 
 
@@ -33,3 +40,32 @@ class Film(FilmShort):
 
     writers: list[FilmPerson]
     writers_names: list[str]
+
+    updated_at: datetime | None = Field(None)
+
+
+class GenreFacet(NameMixin):
+    """Defines genre facet model, the number of films of a genre"""
+
+    count: int
+
+
+class RatingFacet(BaseModel):
+    """Defines rating facet model, the number of films rated from `imdb_rating` up to the next bucket"""
+
+    imdb_rating: float
+    count: int
+
+
+class DirectorFacet(IdMixin, NameMixin):
+    """Defines director facet model, the number of films of a director"""
+
+    count: int
+
+
+class FilmFacets(ORJSONMixin):
+    """Defines film facets model, the counts of the films matching a query by genre, rating and director"""
+
+    genres: list[GenreFacet]
+    imdb_rating: list[RatingFacet]
+    directors: list[DirectorFacet]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+from fastapi_service.src.models.mixins import IdMixin, TitleMixin
+
+
+class FilmSuggestion(IdMixin, TitleMixin):
+    """Defines film suggestion model"""
+
+
+class PersonSuggestion(IdMixin):
+    """Defines person suggestion model"""
+
+    full_name: str
+
+
+class Suggestions(BaseModel):
+    """Defines search box suggestions model"""
+
+    films: list[FilmSuggestion]
+    persons: list[PersonSuggestion]
@@ -0,0 +1,219 @@
+import asyncio
+import math
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, TypeVar
+
+from elasticsearch import ApiError, TransportError
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.deadline import remaining_budget
+from fastapi_service.src.core.exceptions import ServiceUnavailableError
+from fastapi_service.src.core.logger import setup_logging
+
+logger = setup_logging(logger_name=__name__)
+
+T = TypeVar("T")
+
+
+class Operation(str, Enum):
+    READ = "read"
+    AGGREGATE = "aggregate"
+    SCAN = "scan"
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class AdaptiveTimeout:
+    """
+    Timeout of backend calls adapted to their observed latency.
+
+    Computed like the TCP retransmission timeout (RFC 6298): a smoothed latency
+    plus four times its smoothed deviation, clamped to [minimum, maximum].
+    Until the first call completes the timeout is `maximum`.
+    """
+
+    def __init__(self, *, minimum: float, maximum: float, alpha: float = 0.125, beta: float = 0.25):
+        """
+        :param minimum: lower bound of the timeout in seconds
+        :param maximum: upper bound of the timeout in seconds
+        :param alpha: smoothing factor of the latency
+        :param beta: smoothing factor of the latency deviation
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.alpha = alpha
+        self.beta = beta
+        self.latency: float | None = None
+        self.deviation = 0.0
+
+    def observe(self, latency: float) -> None:
+        """
+        Record the latency of a successful call.
+
+        :param latency: call duration in seconds
+        """
+        if self.latency is None:
+            self.latency, self.deviation = latency, latency / 2
+            return
+        self.deviation = (1 - self.beta) * self.deviation + self.beta * abs(self.latency - latency)
+        self.latency = (1 - self.alpha) * self.latency + self.alpha * latency
+
+    @property
+    def value(self) -> float:
+        if self.latency is None:
+            return self.maximum
+        return min(max(self.latency + 4 * self.deviation, self.minimum), self.maximum)
+
+
+class CircuitBreaker:
+    """
+    Guards calls to Elasticsearch with deadlines and a circuit breaker.
+
+    Every call is cut off after the adaptive timeout of its operation class or when
+    the deadline of the current request passes, whichever comes first. Each class
+    learns its own latency, so cheap reads do not pull the timeout of aggregations
+    and point in time scans down to their floor. Connection errors, 5xx responses
+    and timeouts of reads count as failures; timeouts of the heavy classes only say
+    that the query is slow and do not. Other responses, e.g. 404, show that
+    Elasticsearch is up and reset the count.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls fail
+    fast with ServiceUnavailableError for `recovery_timeout` seconds, so requests
+    are answered from the cache or with 503 instead of piling up. Then a single
+    probe call is let through (half-open): its success closes the circuit, its
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        recovery_timeout: float,
+        timeout: AdaptiveTimeout,
+        operation_timeouts: dict[Operation, AdaptiveTimeout] | None = None,
+    ):
+        """
+        :param failure_threshold: number of consecutive failures that opens the circuit
+        :param recovery_timeout: time in seconds the circuit stays open before a probe
+        :param timeout: adaptive timeout of reads and of the operations without a timeout of their own
+        :param operation_timeouts: adaptive timeouts of the heavy operation classes
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.timeout = timeout
+        self.operation_timeouts = operation_timeouts or {}
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    async def call(self, func: Callable[[], Awaitable[T]], operation: Operation = Operation.READ) -> T:
+        """
+        Call Elasticsearch through the breaker.
+
+        :param func: coroutine factory making the call
+        :param operation: class of the call, whose latency sets its timeout
+        :return: result of the call
+        :raises ServiceUnavailableError: if the circuit is open, the call timed out or Elasticsearch is unreachable
+        """
+        probe = self._admit()
+        adaptive = self.operation_timeouts.get(operation, self.timeout)
+        try:
+            timeout, cut_by_deadline = adaptive.value, False
+            remaining = remaining_budget()
+            if remaining is not None:
+                if remaining <= 0:
+                    raise ServiceUnavailableError(message="Request deadline exceeded")
+                timeout, cut_by_deadline = min(timeout, remaining), remaining < timeout
+
+            started = time.monotonic()
+            try:
+                result = await asyncio.wait_for(func(), timeout)
+            except asyncio.TimeoutError as e:
+                self.timeouts += 1
+                if not cut_by_deadline and operation == Operation.READ:
+                    self._record_failure()
+                raise ServiceUnavailableError(message="Elasticsearch timed out", errors=(e,)) from e
+            except TransportError as e:
+                self._record_failure()
+                raise ServiceUnavailableError(message="Elasticsearch is unavailable", errors=(e,)) from e
+            except ApiError as e:
+                if e.status_code >= 500:
+                    self._record_failure()
+                    raise ServiceUnavailableError(message="Elasticsearch is unavailable", errors=(e,)) from e
+                self._record_success(adaptive, time.monotonic() - started)
+                raise
+
+            self._record_success(adaptive, time.monotonic() - started)
+            return result
+        finally:
+            if probe:
+                self._probing = False
+
+    def _admit(self) -> bool:
+        """
+        Check whether a call may go through; returns True for the probe of a half-open circuit.
+        """
+        if self.state == CircuitState.CLOSED:
+            return False
+
+        if self.state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self.state = CircuitState.HALF_OPEN
+
+        if self.state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        self.rejected += 1
+        retry_after = self.recovery_timeout - (time.monotonic() - self._opened_at)
+        raise ServiceUnavailableError(
+            message="Elasticsearch circuit is open", retry_after=math.ceil(max(retry_after, 1))
+        )
+
+    def _record_success(self, timeout: AdaptiveTimeout, latency: float) -> None:
+        timeout.observe(latency)
+        self.failures = 0
+        if self.state != CircuitState.CLOSED:
+            logger.info("Elasticsearch circuit breaker closed.")
+            self.state = CircuitState.CLOSED
+
+    def _record_failure(self) -> None:
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                logger.warning(f"Elasticsearch circuit breaker opened after {self.failures} consecutive failures.")
+                self.opened += 1
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "timeout": round(self.timeout.value, 4),
+            "operation_timeouts": {
+                operation.value: round(timeout.value, 4) for operation, timeout in self.operation_timeouts.items()
+            },
+        }
+
+
+es_breaker = CircuitBreaker(
+    failure_threshold=settings.eks.breaker_failure_threshold,
+    recovery_timeout=settings.eks.breaker_recovery_timeout,
+    timeout=AdaptiveTimeout(minimum=settings.eks.timeout_min, maximum=settings.eks.timeout_max),
+    operation_timeouts={
+        operation: AdaptiveTimeout(minimum=settings.eks.heavy_timeout_min, maximum=settings.eks.heavy_timeout_max)
+        for operation in (Operation.AGGREGATE, Operation.SCAN)
+    },
+)
@@ -1,6 +1,28 @@
-from typing import Any, Protocol
+from typing import Any, Awaitable, Callable, NamedTuple, Protocol, TypeVar
 
-from elasticsearch import AsyncElasticsearch
+from elasticsearch import ApiError, AsyncElasticsearch
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.timing import record_timing, timed
+from fastapi_service.src.services.elasticsearch.breaker import Operation, es_breaker
+from fastapi_service.src.services.elasticsearch.msearch import get_multi_search_batcher
+
+T = TypeVar("T")
+
+
+class SearchAfterPage(NamedTuple):
+    """
+    Page of a point in time search.
+
+    Attributes:
+        documents (list[dict[str, Any]]): Sources of the found documents.
+        pit_id (str): Point in time ID to use for the next page.
+        search_after (list[Any] | None): Sort values of the last hit, None if the page is empty.
+    """
+
+    documents: list[dict[str, Any]]
+    pit_id: str
+    search_after: list[Any] | None
 
 
 class ElasticsearchClientProtocol(Protocol):
@@ -14,11 +36,68 @@ class ElasticsearchClientProtocol(Protocol):
         """
         ...
 
+    async def mget(self, index: str, ids: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Get documents by IDs from the Elasticsearch index in one request.
+        Returns sources in the order of `ids`, None for missing documents.
+        """
+        ...
+
     async def search(
-        self, index: str, query: dict[str, Any], sort: list[str], size: int, from_: int
+        self,
+        index: str,
+        query: dict[str, Any],
+        sort: list[str],
+        size: int,
+        from_: int,
+        source_includes: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search documents in the Elasticsearch index.
+        Returns only the `source_includes` fields of the documents when given.
+        """
+        ...
+
+    async def aggregate(self, index: str, query: dict[str, Any] | None, aggregations: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run aggregations over the documents matching the query, without fetching any document.
+        """
+        ...
+
+    async def search_inner_hits(
+        self, index: str, query: dict[str, Any], path: str, size: int, from_: int, sort: list[str] | None = None
+    ) -> list[dict[str, Any]] | None:
+        """
+        Get one page of the nested `path` objects of the first document matching the query,
+        without the source of the document itself.
+        Returns None if no document matches.
+        """
+        ...
+
+    async def open_point_in_time(self, index: str, keep_alive: str) -> str:
+        """
+        Open a point in time that freezes the current state of the index for paging.
+        """
+        ...
+
+    async def close_point_in_time(self, pit_id: str) -> None:
+        """
+        Close a point in time before its keep alive expires.
+        """
+        ...
+
+    async def search_after(
+        self,
+        query: dict[str, Any] | None,
+        sort: list[str],
+        size: int,
+        pit_id: str,
+        keep_alive: str,
+        search_after: list[Any] | None,
+        source_includes: list[str] | None = None,
+    ) -> SearchAfterPage:
+        """
+        Search the next page of documents of a point in time after the given sort values.
         """
         ...
 
@@ -30,13 +109,161 @@ class ElasticsearchClient:
 
     def __init__(self, elastic: AsyncElasticsearch):
         self._elastic = elastic
+        self._batcher = get_multi_search_batcher(elastic) if settings.eks.msearch_enabled else None
+        self._breaker = es_breaker if settings.eks.breaker_enabled else None
+
+    async def _call(self, func: Callable[[], Awaitable[T]], operation: Operation = Operation.READ) -> T:
+        """
+        Make a call to Elasticsearch through the circuit breaker when it is enabled.
+        `operation` selects the adaptive timeout the breaker bounds the call with.
+        Records the wall time of the call and the `took` time reported by Elasticsearch
+        as the `es` and `es-took` spans of the current request.
+        """
+        with timed("es"):
+            result = await (func() if self._breaker is None else self._breaker.call(func, operation))
+        if "took" in result:
+            record_timing("es-took", result["took"] / 1000)
+        return result
 
     async def get(self, index: str, id_: str) -> dict[str, Any]:
-        response = await self._elastic.get(index=index, id=id_)
+        response = await self._call(lambda: self._elastic.get(index=index, id=id_))
         return response.body
 
+    async def mget(self, index: str, ids: list[str]) -> list[dict[str, Any] | None]:
+        response = await self._call(lambda: self._elastic.mget(index=index, ids=ids))
+        documents = []
+        for doc in response["docs"]:
+            if "error" in doc:
+                raise ApiError(message=str(doc["error"]), meta=response.meta, body=doc)
+            documents.append(doc["_source"] if doc.get("found") else None)
+        return documents
+
     async def search(
-        self, index: str, query: dict[str, Any], sort: list[str], size: int, from_: int
+        self,
+        index: str,
+        query: dict[str, Any],
+        sort: list[str],
+        size: int,
+        from_: int,
+        source_includes: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        response = await self._elastic.search(index=index, query=query, sort=sort, size=size, from_=from_)
+        if self._batcher is not None:
+            body = self._search_body(query=query, sort=sort, size=size, from_=from_, source_includes=source_includes)
+            response = await self._call(lambda: self._batcher.search(index, body))
+        else:
+            response = await self._call(
+                lambda: self._elastic.search(
+                    index=index, query=query, sort=sort, size=size, from_=from_, source_includes=source_includes
+                )
+            )
         return [hit["_source"] for hit in response["hits"]["hits"] if "_source" in hit]
+
+    @staticmethod
+    def _search_body(
+        *,
+        query: dict[str, Any] | None,
+        sort: list[str] | None,
+        size: int | None,
+        from_: int | None,
+        source_includes: list[str] | None,
+    ) -> dict[str, Any]:
+        """
+        Build the request body of a search, which is what `_msearch` takes instead of
+        query string parameters. Sort criteria in the `field:order` form become objects.
+        """
+        body: dict[str, Any] = {}
+        if query:
+            body["query"] = query
+        if sort:
+            body["sort"] = ElasticsearchClient._sort_body(sort)
+        if size is not None:
+            body["size"] = size
+        if from_ is not None:
+            body["from"] = from_
+        if source_includes is not None:
+            body["_source"] = {"includes": source_includes}
+        return body
+
+    async def aggregate(self, index: str, query: dict[str, Any] | None, aggregations: dict[str, Any]) -> dict[str, Any]:
+        body: dict[str, Any] = {"size": 0, "aggs": aggregations, "track_total_hits": False}
+        if query:
+            body["query"] = query
+        if self._batcher is not None:
+            response = await self._call(lambda: self._batcher.search(index, body), Operation.AGGREGATE)
+        else:
+            response = await self._call(lambda: self._elastic.search(index=index, **body), Operation.AGGREGATE)
+        return response.get("aggregations", {})
+
+    async def search_inner_hits(
+        self, index: str, query: dict[str, Any], path: str, size: int, from_: int, sort: list[str] | None = None
+    ) -> list[dict[str, Any]] | None:
+        inner_hits: dict[str, Any] = {"size": size, "from": from_}
+        if sort:
+            inner_hits["sort"] = self._sort_body(sort)
+        body = {
+            "query": {
+                "bool": {
+                    "filter": query,
+                    "should": {
+                        "nested": {"path": path, "query": {"match_all": {}}, "inner_hits": inner_hits},
+                    },
+                }
+            },
+            "size": 1,
+            "_source": False,
+        }
+        if self._batcher is not None:
+            response = await self._call(lambda: self._batcher.search(index, body))
+        else:
+            response = await self._call(lambda: self._elastic.search(index=index, **body))
+
+        hits = response["hits"]["hits"]
+        if not hits:
+            return None
+        inner = hits[0].get("inner_hits", {}).get(path)
+        return [hit["_source"] for hit in inner["hits"]["hits"]] if inner else []
+
+    @staticmethod
+    def _sort_body(sort: list[str]) -> list[str | dict[str, str]]:
+        """
+        Convert sort criteria in the `field:order` form into their request body form.
+        """
+        return [{field: order} if order else field for field, _, order in (item.partition(":") for item in sort)]
+
+    async def open_point_in_time(self, index: str, keep_alive: str) -> str:
+        response = await self._call(
+            lambda: self._elastic.open_point_in_time(index=index, keep_alive=keep_alive), Operation.SCAN
+        )
+        return response["id"]
+
+    async def close_point_in_time(self, pit_id: str) -> None:
+        await self._call(lambda: self._elastic.close_point_in_time(id=pit_id), Operation.SCAN)
+
+    async def search_after(
+        self,
+        query: dict[str, Any] | None,
+        sort: list[str],
+        size: int,
+        pit_id: str,
+        keep_alive: str,
+        search_after: list[Any] | None,
+        source_includes: list[str] | None = None,
+    ) -> SearchAfterPage:
+        response = await self._call(
+            lambda: self._elastic.search(
+                query=query,
+                sort=sort,
+                size=size,
+                pit={"id": pit_id, "keep_alive": keep_alive},
+                search_after=search_after,
+                source_includes=source_includes,
+                track_total_hits=False,
+            ),
+            Operation.SCAN,
+        )
+        hits = response["hits"]["hits"]
+        return SearchAfterPage(
+            documents=[hit["_source"] for hit in hits if "_source" in hit],
+            pit_id=response.get("pit_id", pit_id),
+            search_after=hits[-1]["sort"] if hits else None,
+        )
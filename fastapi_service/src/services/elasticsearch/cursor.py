@@ -0,0 +1,74 @@
+import base64
+import binascii
+from http import HTTPStatus
+from typing import Any
+
+import orjson
+
+from fastapi_service.src.core.exceptions import BadRequestError
+
+FIRST_PAGE_CURSOR = "*"
+
+
+def encode_cursor(index: str, pit_id: str, search_after: list[Any]) -> str:
+    """
+    Encode the position of the next page into an opaque URL-safe cursor.
+
+    :param index: searched index
+    :param pit_id: point in time ID
+    :param search_after: sort values of the last hit of the current page
+    :return: cursor
+    """
+    data = orjson.dumps({"index": index, "pit_id": pit_id, "search_after": search_after})
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, index: str) -> tuple[str, list[Any]]:
+    """
+    Decode a cursor returned with a previous page of the same index.
+
+    :param cursor: cursor
+    :param index: searched index
+    :return: point in time ID and sort values to search after
+    :raises BadRequestError: if the cursor is malformed or belongs to another index
+    """
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if data["index"] != index:
+            raise ValueError(f"cursor belongs to index {data['index']}")
+        return str(data["pit_id"]), list(data["search_after"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise BadRequestError(message="Invalid cursor", status_code=HTTPStatus.BAD_REQUEST, body=cursor, errors=(e,))
+
+
+def encode_offset_cursor(index: str, offset: int) -> str:
+    """
+    Encode the position of the next page of documents served from memory into a cursor.
+
+    :param index: index the documents come from
+    :param offset: position of the first document of the next page
+    :return: cursor
+    """
+    data = orjson.dumps({"index": index, "offset": offset})
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_offset_cursor(cursor: str, index: str) -> int:
+    """
+    Decode a cursor returned with a previous page of documents served from memory.
+
+    :param cursor: cursor
+    :param index: index the documents come from
+    :return: position of the first document of the page
+    :raises BadRequestError: if the cursor is malformed or belongs to another index
+    """
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if data["index"] != index:
+            raise ValueError(f"cursor belongs to index {data['index']}")
+        offset = int(data["offset"])
+        if offset < 0:
+            raise ValueError(f"negative offset {offset}")
+        return offset
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise BadRequestError(message="Invalid cursor", status_code=HTTPStatus.BAD_REQUEST, body=cursor, errors=(e,))
@@ -2,13 +2,18 @@ from typing import Any
 
 from elasticsearch import NotFoundError
 
-from fastapi_service.src.core.exceptions import BadRequestError
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.exceptions import BadRequestError, ServiceUnavailableError
 from fastapi_service.src.core.logger import setup_logging
 from fastapi_service.src.services.elasticsearch.client import ElasticsearchClientProtocol
 from fastapi_service.src.services.redis.cache import ModelCacheDecorator
 
 logger = setup_logging(logger_name=__name__)
 
+model_cache = ModelCacheDecorator(
+    key="model_id", stale_ttl=settings.cache.model_stale_ttl, negative_ttl=settings.cache.negative_ttl
+)
+
 
 class ModelService:
     """
@@ -18,18 +23,12 @@ class ModelService:
     def __init__(self, client: ElasticsearchClientProtocol):
         self.client = client
 
-    @ModelCacheDecorator(key="model_id")
     async def get_model_by_id(self, *, index: str, model_id: str) -> dict[str, Any] | None:
-        return await self._fetch_model(index=index, model_id=model_id)
-
-    async def _fetch_model(self, index: str, model_id: str) -> dict[str, Any] | None:
         try:
-            document = await self.client.get(index=index, id_=model_id)
-            return document["_source"]
+            return await self._get_cached_model(index=index, model_id=model_id)
 
-        except NotFoundError:
-            logger.info(msg=f"Model with ID {model_id} not found in index {index}.")
-            return None
+        except ServiceUnavailableError:
+            raise
 
         except BadRequestError:
             logger.exception(msg=f"Failed to fetch model with ID {model_id} from index {index}.")
@@ -38,3 +37,41 @@ class ModelService:
         except Exception as e:
             logger.exception(msg=f"Failed to fetch model with ID {model_id} from index {index}. {e.__traceback__}")
             return None
+
+    async def get_models_by_ids(self, *, index: str, model_ids: list[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Fetch several models by their IDs with one cache round trip and at most one index request.
+
+        :param index: index name
+        :param model_ids: unique model IDs
+        :return: models by ID, None for missing models
+        """
+        try:
+            return await model_cache.cached_models(
+                model_ids, lambda missing_ids: self.client.mget(index=index, ids=missing_ids)
+            )
+
+        except ServiceUnavailableError:
+            raise
+
+        except Exception:
+            logger.exception(msg=f"Failed to fetch {len(model_ids)} models from index {index}.")
+            return dict.fromkeys(model_ids)
+
+    @model_cache
+    async def _get_cached_model(self, *, index: str, model_id: str) -> dict[str, Any] | None:
+        return await self._fetch_model(index=index, model_id=model_id)
+
+    async def _fetch_model(self, index: str, model_id: str) -> dict[str, Any] | None:
+        """
+        Fetch a model from the index.
+        Returns None if the model does not exist and raises on any other failure,
+        so that failures are not cached as missing models.
+        """
+        try:
+            document = await self.client.get(index=index, id_=model_id)
+            return document["_source"]
+
+        except NotFoundError:
+            logger.info(msg=f"Model with ID {model_id} not found in index {index}.")
+            return None
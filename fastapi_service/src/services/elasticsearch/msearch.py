@@ -0,0 +1,144 @@
+import asyncio
+import dataclasses
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any, NamedTuple
+
+from elasticsearch import ApiError, AsyncElasticsearch
+from elasticsearch.exceptions import HTTP_EXCEPTIONS
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.logger import setup_logging
+
+logger = setup_logging(logger_name=__name__)
+
+
+class MultiSearchStats:
+    """
+    Counters of the searches sent in multi-search batches.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.batches = 0
+        self.searches = 0
+        self.full_batches = 0
+        self.failed_batches = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        average_size = self.searches / self.batches if self.batches else 0.0
+        return {
+            "batches": self.batches,
+            "searches": self.searches,
+            "full_batches": self.full_batches,
+            "failed_batches": self.failed_batches,
+            "average_batch_size": round(average_size, 2),
+            "fill_rate": round(average_size / self.max_size, 4) if self.max_size else 0.0,
+        }
+
+
+class _PendingSearch(NamedTuple):
+    index: str
+    body: dict[str, Any]
+    future: asyncio.Future[dict[str, Any]]
+
+
+class MultiSearchBatcher:
+    """
+    Collects searches issued concurrently by a worker and sends them to Elasticsearch as one `_msearch`.
+
+    The first search of a batch opens a window of `window` seconds; every search
+    arriving within it joins the batch, which is sent when the window closes or
+    `max_size` searches have been collected. The responses are fanned back out to
+    the awaiting callers, so a caller pays at most `window` of extra latency for a
+    fraction of the HTTP round trips.
+
+    A failed search of a batch raises the same ApiError subclass as a standalone
+    search would, e.g. NotFoundError for a missing index; a failed request fails
+    all searches of the batch.
+    """
+
+    def __init__(self, elastic: AsyncElasticsearch, *, window: float, max_size: int):
+        """
+        :param elastic: Elasticsearch client
+        :param window: time in seconds to wait for more searches after the first one of a batch
+        :param max_size: maximum number of searches in a batch
+        """
+        self._elastic = elastic
+        self.window = window
+        self.max_size = max_size
+        self.stats = MultiSearchStats(max_size)
+        self._pending: list[_PendingSearch] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._requests: set[asyncio.Task[None]] = set()
+
+    async def search(self, index: str, body: dict[str, Any]) -> dict[str, Any]:
+        """
+        Add a search to the current batch and wait for its response.
+
+        :param index: index name
+        :param body: search request body
+        :return: search response
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.append(_PendingSearch(index, body, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        request = asyncio.ensure_future(self._send(batch))
+        self._requests.add(request)
+        request.add_done_callback(self._requests.discard)
+
+    async def _send(self, batch: list[_PendingSearch]) -> None:
+        self.stats.batches += 1
+        self.stats.searches += len(batch)
+        if len(batch) >= self.max_size:
+            self.stats.full_batches += 1
+
+        searches: list[dict[str, Any]] = []
+        for search in batch:
+            searches.extend(({"index": search.index}, search.body))
+
+        try:
+            response = await self._elastic.msearch(searches=searches)
+        except Exception as e:
+            self.stats.failed_batches += 1
+            logger.warning(f"Multi-search of {len(batch)} searches failed: {e}")
+            for search in batch:
+                if not search.future.done():
+                    search.future.set_exception(e)
+            return
+
+        for search, item in zip(batch, response["responses"], strict=True):
+            if search.future.done():
+                continue
+            if "error" in item:
+                status = item.get("status", HTTPStatus.INTERNAL_SERVER_ERROR)
+                error_class = HTTP_EXCEPTIONS.get(status, ApiError)
+                meta = dataclasses.replace(response.meta, status=status)
+                search.future.set_exception(error_class(message=str(item["error"]), meta=meta, body=item))
+            else:
+                search.future.set_result(item)
+
+
+@lru_cache()
+def get_multi_search_batcher(elastic: AsyncElasticsearch) -> MultiSearchBatcher:
+    """
+    Provider for the MultiSearchBatcher shared by all services of the worker.
+    """
+    return MultiSearchBatcher(elastic, window=settings.eks.msearch_window, max_size=settings.eks.msearch_max_size)
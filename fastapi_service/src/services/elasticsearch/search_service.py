@@ -1,11 +1,15 @@
-from typing import Any
+import asyncio
+from http import HTTPStatus
+from typing import Any, AsyncIterator
 
 from elasticsearch import NotFoundError
 
 from fastapi_service.src.core.config import settings
-from fastapi_service.src.core.exceptions import BadRequestError
+from fastapi_service.src.core.deadline import request_deadline
+from fastapi_service.src.core.exceptions import BadRequestError, ServiceUnavailableError
 from fastapi_service.src.core.logger import setup_logging
 from fastapi_service.src.services.elasticsearch.client import ElasticsearchClientProtocol
+from fastapi_service.src.services.elasticsearch.cursor import FIRST_PAGE_CURSOR, decode_cursor, encode_cursor
 from fastapi_service.src.services.redis.cache import QueryCacheDecorator
 
 logger = setup_logging(logger_name=__name__)
@@ -15,7 +19,6 @@ class SearchService:
     def __init__(self, client: ElasticsearchClientProtocol):
         self.client = client
 
-    @QueryCacheDecorator()
     async def search_models(
         self,
         *,
@@ -24,9 +27,320 @@ class SearchService:
         page_size: int,
         query_match: dict[str, Any] | None = None,
         sort: list[str] | None = None,
+        source_includes: list[str] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Search documents in the index, reading through the query cache.
+
+        :param source_includes: fields of the documents to fetch, all fields if None
+        """
+        try:
+            return await self._search_cached_models(
+                index=index,
+                page_number=page_number,
+                page_size=page_size,
+                query_match=query_match,
+                sort=sort,
+                source_includes=source_includes,
+            )
+
+        except ServiceUnavailableError:
+            raise
+
+        except BadRequestError as e:
+            logger.error(f"Failed to search in index {index} {e}")
+            return None
+
+        except Exception as e:
+            logger.exception(f"Failed to search in index {index}: {e}")
+            return None
+
+    async def search_models_after(
+        self,
+        *,
+        index: str,
+        page_size: int,
+        cursor: str,
+        query_match: dict[str, Any] | None = None,
+        sort: list[str] | None = None,
+        source_includes: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Search documents page by page with `search_after` over a point in time.
+
+        The point in time is opened with the first page, so later pages are not shifted
+        by documents written in the meantime, and closed again if the first page fails.
+        Cursor pages are not cached.
+
+        :param index: index name
+        :param page_size: number of documents per page
+        :param cursor: FIRST_PAGE_CURSOR for the first page or the cursor returned with the previous page
+        :param query_match: search query
+        :param sort: sort criteria, relevance if empty
+        :param source_includes: fields of the documents to fetch, all fields if None
+        :return: documents and the cursor of the next page, None after the last page
+        :raises BadRequestError: if the cursor is invalid or has expired
+        """
+        keep_alive = settings.eks.pit_keep_alive
+        opened_pit_id, page = None, None
+        try:
+            if cursor == FIRST_PAGE_CURSOR:
+                opened_pit_id = await self.client.open_point_in_time(index=index, keep_alive=keep_alive)
+                pit_id, search_after = opened_pit_id, None
+            else:
+                pit_id, search_after = decode_cursor(cursor, index)
+
+            page = await self.client.search_after(
+                query=query_match,
+                sort=self.format_sort_criteria(sort) or ["_score"],
+                size=page_size,
+                pit_id=pit_id,
+                keep_alive=keep_alive,
+                search_after=search_after,
+                source_includes=source_includes,
+            )
+
+        except NotFoundError as e:
+            raise BadRequestError(
+                message="Cursor has expired", status_code=HTTPStatus.BAD_REQUEST, body=cursor, errors=(e,)
+            )
+
+        except (BadRequestError, ServiceUnavailableError):
+            raise
+
+        except Exception as e:
+            logger.exception(f"Failed to search in index {index} after cursor: {e}")
+            return [], None
+
+        finally:
+            if page is None and opened_pit_id is not None:
+                await self._close_point_in_time(index, opened_pit_id)
+
+        if len(page.documents) < page_size or page.search_after is None:
+            await self._close_point_in_time(index, page.pit_id)
+            return page.documents, None
+
+        return page.documents, encode_cursor(index, page.pit_id, page.search_after)
+
+    async def scan_models(
+        self,
+        *,
+        index: str,
+        batch_size: int,
+        query_match: dict[str, Any] | None = None,
+        source_includes: list[str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Walk all documents matching the query in batches with `search_after` over a point in time.
+
+        Documents come in `_shard_doc` order, the cheapest one to resume a point in time
+        from, so only one batch is held in memory however many documents match. Batches
+        are not cached. The point in time is closed once the walk ends or is abandoned.
+
+        The walk outlives the deadline of the request, so each batch is bounded
+        by the timeout of the circuit breaker only.
+
+        :param index: index name
+        :param batch_size: number of documents per batch
+        :param query_match: search query, all documents if None
+        :param source_includes: fields of the documents to fetch, all fields if None
+        :return: non-empty batches of documents
+        """
+        request_deadline.set(None)
+        keep_alive = settings.eks.pit_keep_alive
+        pit_id = await self.client.open_point_in_time(index=index, keep_alive=keep_alive)
+        search_after = None
+        try:
+            while True:
+                page = await self.client.search_after(
+                    query=query_match,
+                    sort=["_shard_doc"],
+                    size=batch_size,
+                    pit_id=pit_id,
+                    keep_alive=keep_alive,
+                    search_after=search_after,
+                    source_includes=source_includes,
+                )
+                pit_id = page.pit_id
+                if page.documents:
+                    yield page.documents
+                if len(page.documents) < batch_size or page.search_after is None:
+                    return
+                search_after = page.search_after
+        finally:
+            await self._close_point_in_time(index, pit_id)
+
+    async def _close_point_in_time(self, index: str, pit_id: str) -> None:
+        """
+        Close a point in time, logging a failure instead of raising it.
+
+        Shielded, so the point in time is closed even when the client disconnects.
+        """
+        try:
+            await asyncio.shield(self.client.close_point_in_time(pit_id))
+        except Exception as e:
+            logger.warning(f"Failed to close point in time of index {index}: {e}")
+
+    async def aggregate_models(
+        self, *, index: str, aggregations: dict[str, Any], query_match: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Run aggregations over the documents matching the query, reading through the facet cache.
+
+        Aggregations change only when the index does, so they are cached for longer
+        than search pages and their key leaves out paging and sorting: every page of
+        a query shares one entry.
+
+        :param index: index name
+        :param aggregations: aggregations by name
+        :param query_match: search query, all documents if None
+        :return: aggregation results by name, None if the aggregations fail
+        """
+        try:
+            return await self._aggregate_cached_models(index=index, aggregations=aggregations, query_match=query_match)
+
+        except ServiceUnavailableError:
+            raise
+
+        except Exception as e:
+            logger.exception(f"Failed to aggregate index {index}: {e}")
+            return None
+
+    @QueryCacheDecorator(ttl=settings.cache.facets_ttl, stale_ttl=settings.cache.query_stale_ttl)
+    async def _aggregate_cached_models(
+        self, *, index: str, aggregations: dict[str, Any], query_match: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self.client.aggregate(index=index, query=query_match, aggregations=aggregations)
+
+    async def suggest_models(self, *, index: str, field: str, prefix: str, size: int) -> list[dict[str, Any]]:
+        """
+        Find documents whose `field` matches a search box prefix, reading through a short-lived cache.
+
+        Matches the `search_as_you_type` subfield `<field>.suggest` and fetches only
+        the ID and the matched field of the documents.
+
+        :param index: index name
+        :param field: text field with a `suggest` subfield
+        :param prefix: text typed so far
+        :param size: maximum number of documents
+        :return: documents, empty if none match or the search fails
+        """
+        try:
+            return await self._suggest_cached_models(index=index, field=field, prefix=prefix, size=size) or []
+
+        except ServiceUnavailableError:
+            raise
+
+        except Exception as e:
+            logger.exception(f"Failed to suggest from index {index}: {e}")
+            return []
+
+    async def search_nested_models(
+        self,
+        *,
+        index: str,
+        model_id: str,
+        path: str,
+        page_number: int,
+        page_size: int,
+        sort: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch one page of the nested `path` objects of a document, reading through the query cache.
+
+        Only the requested page is read from the inner hits of the document,
+        so the response is bounded by the page size however many objects it nests.
+
+        :param index: index name
+        :param model_id: document ID
+        :param path: path of the nested objects
+        :param page_number: page number
+        :param page_size: number of nested objects per page
+        :param sort: sort criteria of the nested objects, their order in the document if empty
+        :return: nested objects, empty if the document does not exist or the search fails
+        """
+        try:
+            return (
+                await self._search_cached_nested_models(
+                    index=index,
+                    model_id=model_id,
+                    path=path,
+                    page_number=page_number,
+                    page_size=page_size,
+                    sort=sort,
+                )
+                or []
+            )
+
+        except ServiceUnavailableError:
+            raise
+
+        except Exception as e:
+            logger.exception(f"Failed to fetch nested {path} of document {model_id} from index {index}: {e}")
+            return []
+
+    @QueryCacheDecorator(stale_ttl=settings.cache.query_stale_ttl, negative_ttl=settings.cache.negative_ttl)
+    async def _search_cached_nested_models(
+        self,
+        *,
+        index: str,
+        model_id: str,
+        path: str,
+        page_number: int,
+        page_size: int,
+        sort: list[str] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        try:
+            return await self.client.search_inner_hits(
+                index=index,
+                query={"term": {"id": model_id}},
+                path=path,
+                size=page_size,
+                from_=self.calculate_offset(page_number, page_size),
+                sort=self.format_sort_criteria(sort),
+            )
+
+        except NotFoundError as e:
+            logger.info(f"No documents found in index {index} {e}")
+            return None
+
+    @QueryCacheDecorator(ttl=settings.cache.suggest_ttl)
+    async def _suggest_cached_models(
+        self, *, index: str, field: str, prefix: str, size: int
     ) -> list[dict[str, Any]] | None:
         return await self._perform_search(
-            index=index, query=query_match, page_number=page_number, page_size=page_size, sort=sort
+            index=index,
+            query={
+                "multi_match": {
+                    "query": prefix,
+                    "type": "bool_prefix",
+                    "fields": [f"{field}.suggest", f"{field}.suggest._2gram", f"{field}.suggest._3gram"],
+                }
+            },
+            page_number=1,
+            page_size=size,
+            sort=None,
+            source_includes=["id", field],
+        )
+
+    @QueryCacheDecorator(stale_ttl=settings.cache.query_stale_ttl, negative_ttl=settings.cache.negative_ttl)
+    async def _search_cached_models(
+        self,
+        *,
+        index: str,
+        page_number: int,
+        page_size: int,
+        query_match: dict[str, Any] | None = None,
+        sort: list[str] | None = None,
+        source_includes: list[str] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        return await self._perform_search(
+            index=index,
+            query=query_match,
+            page_number=page_number,
+            page_size=page_size,
+            sort=sort,
+            source_includes=source_includes,
         )
 
     async def _perform_search(
@@ -36,7 +350,13 @@ class SearchService:
         page_number: int = settings.eks.page_number,
         page_size: int = settings.eks.page_size,
         sort: list[str] = settings.eks.sort,
+        source_includes: list[str] | None = None,
     ) -> list[dict[str, Any]] | None:
+        """
+        Search documents in the index.
+        Returns None if the index does not exist and raises on any other failure,
+        so that failures are not cached as empty results.
+        """
         try:
             documents = await self.client.search(
                 index=index,
@@ -44,6 +364,7 @@ class SearchService:
                 sort=self.format_sort_criteria(sort),
                 size=page_size,
                 from_=self.calculate_offset(page_number, page_size),
+                source_includes=source_includes,
             )
             return documents
 
@@ -51,14 +372,6 @@ class SearchService:
             logger.info(f"No documents found in index {index} {e}")
             return None
 
-        except BadRequestError as e:
-            logger.error(f"Failed to search in index {index} {e}")
-            return None
-
-        except Exception as e:
-            logger.exception(f"Failed to search in index {index}: {e}")
-            return None
-
     @staticmethod
     def calculate_offset(page_number: int | None, page_size: int | None) -> int | None:
         if page_number is not None and page_size is not None:
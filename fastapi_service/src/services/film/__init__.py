@@ -4,11 +4,13 @@ from typing import Annotated
 from elasticsearch import AsyncElasticsearch
 from fastapi import Depends
 
+from fastapi_service.src.core.config import settings
 from fastapi_service.src.db.elasticsearch import get_elastic
 from fastapi_service.src.services.elasticsearch.client import ElasticsearchClient
 from fastapi_service.src.services.elasticsearch.model_service import ModelService
 from fastapi_service.src.services.elasticsearch.search_service import SearchService
 from fastapi_service.src.services.film.service import FilmService
+from fastapi_service.src.services.redis.popularity import popularity_tracker
 
 
 @lru_cache()
@@ -21,4 +23,5 @@ def get_film_service(
     elasticsearch_client_instance = ElasticsearchClient(elasticsearch_client)
     model_service = ModelService(elasticsearch_client_instance)
     search_service = SearchService(elasticsearch_client_instance)
-    return FilmService(model_service=model_service, search_service=search_service)
+    popularity = popularity_tracker if settings.cache.popularity_enabled else None
+    return FilmService(model_service=model_service, search_service=search_service, popularity=popularity)
@@ -1,35 +1,152 @@
-from typing import Any
+import asyncio
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, AsyncIterator
+
+import orjson
+from pydantic import TypeAdapter
 
 from fastapi_service.src.core.config import settings
-from fastapi_service.src.models.film import Film
+from fastapi_service.src.core.exceptions import BadRequestError
+from fastapi_service.src.models.film import DirectorFacet, Film, FilmFacets, FilmListItem, GenreFacet, RatingFacet
 from fastapi_service.src.services.elasticsearch.model_service import ModelService
 from fastapi_service.src.services.elasticsearch.search_service import SearchService
+from fastapi_service.src.services.redis.popularity import PopularityTracker
+
+FILM_LIST_FIELDS = list(FilmListItem.model_fields)
+FILM_LIST_ADAPTER = TypeAdapter(list[FilmListItem])
+FILM_EXPORT_FIELDS = frozenset(Film.model_fields)
+FILM_FACETS = {
+    "genres": {"terms": {"field": "genres_names.raw", "size": settings.api.facet_size}},
+    "imdb_rating": {
+        "histogram": {"field": "imdb_rating", "interval": settings.api.facet_rating_interval, "min_doc_count": 1}
+    },
+    # Director names are analyzed text, so directors are counted by the ID of the nested objects
+    # and named after the source of one of them, e.g. {"id": ..., "name": ...}.
+    "directors": {
+        "nested": {"path": "directors"},
+        "aggs": {
+            "ids": {
+                "terms": {"field": "directors.id", "size": settings.api.facet_size},
+                "aggs": {"name": {"top_hits": {"size": 1}}},
+            }
+        },
+    },
+}
+
+FILM_ACCESS = "film"
+FILM_LIST_ACCESS = "films"
+FILM_SEARCH_ACCESS = "search"
+
+
+def encode_access(**params: Any) -> str:
+    """
+    Serialize the parameters of a film list or search, a member of the popularity sets.
+    """
+    return orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()
+
+
+def decode_access(member: str) -> dict[str, Any]:
+    return orjson.loads(member)
 
 
 class FilmService:
     """
     Contains business logic for working with films.
+
+    With a popularity tracker, film lookups, lists and searches are counted for
+    the cache warmer, see `FilmCacheWarmer`.
     """
 
-    def __init__(self, model_service: ModelService, search_service: SearchService):
+    def __init__(
+        self,
+        model_service: ModelService,
+        search_service: SearchService,
+        popularity: PopularityTracker | None = None,
+    ):
         self.model_service = model_service
         self.search_service = search_service
+        self.popularity = popularity
 
     async def get_films(
         self, *, page_size: int, page_number: int, sort: list[str] | None = None, genre: str | None = None
-    ) -> list[Film]:
+    ) -> list[FilmListItem]:
         """
         Retrieve a list of films based on the given parameters.
         May return an empty list if no films are found.
         """
-        query_match = None
+        if self.popularity is not None:
+            self.popularity.record(
+                FILM_LIST_ACCESS,
+                encode_access(page_size=page_size, page_number=page_number, sort=sort, genre=genre),
+            )
+        return await self._search_films(
+            page_size=page_size, page_number=page_number, sort=sort, query_match=self._genre_query(genre)
+        )
 
-        if genre:
-            query_match = {"terms": {"genres_names": genre}}
+    async def get_films_with_facets(
+        self, *, page_size: int, page_number: int, sort: list[str] | None = None, genre: str | None = None
+    ) -> tuple[list[FilmListItem], FilmFacets]:
+        """
+        Retrieve a list of films like `get_films` with the facets of all the films of the genre.
+        The page and the facets are searched concurrently and cached separately.
+        """
+        films, facets = await asyncio.gather(
+            self.get_films(page_size=page_size, page_number=page_number, sort=sort, genre=genre),
+            self._get_facets(self._genre_query(genre)),
+        )
+        return films, facets
 
-        return await self._search_films(
-            page_size=page_size, page_number=page_number, sort=sort, query_match=query_match
+    async def get_films_page(
+        self, *, page_size: int, cursor: str, sort: list[str] | None = None, genre: str | None = None
+    ) -> tuple[list[FilmListItem], str | None]:
+        """
+        Retrieve a page of films after a cursor, see `SearchService.search_models_after`.
+        Returns the films and the cursor of the next page, None after the last page.
+        """
+        data, next_cursor = await self.search_service.search_models_after(
+            index=settings.eks.films_index,
+            page_size=page_size,
+            cursor=cursor,
+            query_match=self._genre_query(genre),
+            sort=sort,
+            source_includes=FILM_LIST_FIELDS,
         )
+        return FILM_LIST_ADAPTER.validate_python(data), next_cursor
+
+    async def export_films(
+        self, *, fields: list[str] | None = None, updated_since: datetime | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Walk all films in batches of their documents, see `SearchService.scan_models`.
+
+        :param fields: fields of the documents to export, all fields if empty
+        :param updated_since: export only the films updated at or after this time
+        :raises BadRequestError: if a field is unknown
+        """
+        unknown = sorted(set(fields or ()) - FILM_EXPORT_FIELDS)
+        if unknown:
+            raise BadRequestError(
+                message=f"Unknown fields: {', '.join(unknown)}", status_code=HTTPStatus.BAD_REQUEST, body=fields
+            )
+
+        query_match = None
+        if updated_since is not None:
+            query_match = {"range": {"updated_at": {"gte": updated_since.isoformat()}}}
+
+        async for documents in self.search_service.scan_models(
+            index=settings.eks.films_index,
+            batch_size=settings.eks.export_batch_size,
+            query_match=query_match,
+            source_includes=fields or None,
+        ):
+            yield documents
+
+    @staticmethod
+    def _genre_query(genre: str | None) -> dict[str, Any] | None:
+        if genre:
+            return {"terms": {"genres_names": genre}}
+        return None
 
     async def search_films(
         self,
@@ -38,15 +155,42 @@ class FilmService:
         page_number: int,
         query: str,
         sort: list[str] | None = None,
-    ) -> list[Film]:
+    ) -> list[FilmListItem]:
         """
         Retrieve a list of films based on a search query.
         May return an empty list if no films match the query.
         """
-        query_match = None
+        if self.popularity is not None:
+            self.popularity.record(
+                FILM_SEARCH_ACCESS,
+                encode_access(page_size=page_size, page_number=page_number, query=query, sort=sort),
+            )
+        return await self._search_films(
+            page_size=page_size, page_number=page_number, sort=sort, query_match=self._search_query(query)
+        )
 
+    async def search_films_with_facets(
+        self,
+        *,
+        page_size: int,
+        page_number: int,
+        query: str,
+        sort: list[str] | None = None,
+    ) -> tuple[list[FilmListItem], FilmFacets]:
+        """
+        Retrieve a list of films like `search_films` with the facets of all the films matching the query.
+        The page and the facets are searched concurrently and cached separately.
+        """
+        films, facets = await asyncio.gather(
+            self.search_films(page_size=page_size, page_number=page_number, query=query, sort=sort),
+            self._get_facets(self._search_query(query)),
+        )
+        return films, facets
+
+    @staticmethod
+    def _search_query(query: str) -> dict[str, Any] | None:
         if query:
-            query_match = {
+            return {
                 "multi_match": {
                     "query": query,
                     "fuzziness": "auto",
@@ -60,16 +204,45 @@ class FilmService:
                     ],
                 }
             }
+        return None
 
-        return await self._search_films(
-            page_size=page_size, page_number=page_number, sort=sort, query_match=query_match
+    async def _get_facets(self, query_match: dict[str, Any] | None) -> FilmFacets:
+        """
+        Count the films matching the query by genre, rating and director.
+        The counts are empty if the aggregations fail.
+        """
+        aggregations = await self.search_service.aggregate_models(
+            index=settings.eks.films_index, aggregations=FILM_FACETS, query_match=query_match
+        )
+        if not aggregations:
+            return FilmFacets(genres=[], imdb_rating=[], directors=[])
+
+        return FilmFacets(
+            genres=[
+                GenreFacet(name=bucket["key"], count=bucket["doc_count"])
+                for bucket in aggregations["genres"]["buckets"]
+            ],
+            imdb_rating=[
+                RatingFacet(imdb_rating=bucket["key"], count=bucket["doc_count"])
+                for bucket in aggregations["imdb_rating"]["buckets"]
+            ],
+            directors=[
+                DirectorFacet(
+                    id=bucket["key"],
+                    name=bucket["name"]["hits"]["hits"][0]["_source"]["name"],
+                    count=bucket["doc_count"],
+                )
+                for bucket in aggregations["directors"]["ids"]["buckets"]
+            ],
         )
 
     async def _search_films(
         self, *, page_size: int, page_number: int, sort: list[str] | None, query_match: dict[str, Any] | None
-    ) -> list[Film]:
+    ) -> list[FilmListItem]:
         """
         Helper method to perform search queries on the Elasticsearch index.
+        Fetches only the fields of the film list items and validates the whole page
+        in one call of a compiled TypeAdapter.
         """
 
         data = await self.search_service.search_models(
@@ -78,20 +251,36 @@ class FilmService:
             page_size=page_size,
             query_match=query_match,
             sort=sort,
+            source_includes=FILM_LIST_FIELDS,
         )
 
         if not data:
             return []
 
-        return [Film(**row) for row in data]
+        return FILM_LIST_ADAPTER.validate_python(data)
 
     async def get_film_by_id(self, film_id: str) -> Film | None:
         """
         Retrieve a film by its ID (UUID).
         May return None if the film is not found.
         """
+        if self.popularity is not None:
+            self.popularity.record(FILM_ACCESS, film_id)
         data = await self.model_service.get_model_by_id(index=settings.eks.films_index, model_id=film_id)
         if not data:
             return None
 
         return Film(**data)
+
+    async def get_films_by_ids(self, film_ids: list[str]) -> list[Film | None]:
+        """
+        Retrieve several films by their IDs (UUIDs) in the order of `film_ids`.
+        Contains None for every film that is not found.
+        """
+        if self.popularity is not None:
+            for film_id in film_ids:
+                self.popularity.record(FILM_ACCESS, film_id)
+        data = await self.model_service.get_models_by_ids(
+            index=settings.eks.films_index, model_ids=list(dict.fromkeys(film_ids))
+        )
+        return [Film(**data[film_id]) if data.get(film_id) else None for film_id in film_ids]
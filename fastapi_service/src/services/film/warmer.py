@@ -0,0 +1,190 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.logger import setup_logging
+from fastapi_service.src.db.redis import get_redis
+from fastapi_service.src.services.film.service import (
+    FILM_ACCESS,
+    FILM_LIST_ACCESS,
+    FILM_SEARCH_ACCESS,
+    FilmService,
+    decode_access,
+    encode_access,
+)
+from fastapi_service.src.services.redis.popularity import PopularityTracker, popularity_tracker, popularity_tracking
+
+logger = setup_logging(logger_name=__name__)
+
+TOP_RATED_SORT = ["-imdb_rating"]
+
+
+class FilmCacheWarmer:
+    """
+    Pre-populates the film caches with the most popular films, lists and searches.
+
+    Runs at startup, so that the first requests after a deploy or a Redis flush
+    find the caches warm, and then every `interval` seconds if it is positive.
+    The top `top_n` entries of each kind recorded by the popularity tracker are
+    replayed through FilmService: films are fetched in batches of `batch_size`,
+    lists and searches one by one. At most `concurrency` calls run at a time, so
+    warming cannot overwhelm Elasticsearch; already cached entries cost a cache
+    read only.
+
+    The ranking lives in the same Redis as the caches, so a flush or a restart of
+    Redis loses it along with them. Kinds with no ranking then fall back to the
+    `top_n` best rated films from Elasticsearch and the first page of the default
+    film list.
+
+    A Redis lock held for `interval` seconds lets only one worker warm at a time.
+    Warming is not counted as popularity.
+    """
+
+    def __init__(
+        self,
+        *,
+        popularity: PopularityTracker,
+        top_n: int,
+        concurrency: int,
+        batch_size: int,
+        interval: float,
+        lock_name: str,
+    ):
+        """
+        :param popularity: tracker of the accesses to replay
+        :param top_n: number of the most popular films, lists and searches to warm each
+        :param concurrency: maximum number of concurrent calls
+        :param batch_size: number of films fetched per call
+        :param interval: time in seconds between runs, 0 to warm at startup only
+        :param lock_name: Redis key of the lock held by the warming worker
+        """
+        self.popularity = popularity
+        self.top_n = top_n
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.interval = interval
+        self.lock_name = lock_name
+        self.runs = 0
+        self.warmed = 0
+        self.failed = 0
+        self.last_duration: float | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self, film_service: FilmService) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(film_service))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, film_service: FilmService) -> None:
+        while True:
+            try:
+                if await self._acquire():
+                    await self.warm(film_service)
+            except (RedisError, ConnectionError) as e:
+                logger.warning(f"Failed to warm film caches: {e}")
+            if self.interval <= 0:
+                return
+            await asyncio.sleep(self.interval)
+
+    async def _acquire(self) -> bool:
+        adapter = await get_redis()
+        ttl = max(int(self.interval), 60)
+        return bool(await adapter.set(self.lock_name, 1, nx=True, ex=ttl))
+
+    async def warm(self, film_service: FilmService) -> None:
+        """
+        Replay the most popular film accesses through the service.
+
+        :param film_service: service whose caches to warm
+        """
+        token = popularity_tracking.set(False)
+        try:
+            await self._warm(film_service)
+        finally:
+            popularity_tracking.reset(token)
+
+    async def _warm(self, film_service: FilmService) -> None:
+        started = time.monotonic()
+        film_ids = await self.popularity.top(FILM_ACCESS, self.top_n)
+        lists = await self.popularity.top(FILM_LIST_ACCESS, self.top_n)
+        searches = await self.popularity.top(FILM_SEARCH_ACCESS, self.top_n)
+        if not film_ids:
+            film_ids = await self._top_rated_film_ids(film_service)
+        if not lists:
+            lists = [
+                encode_access(
+                    page_size=settings.api.default_page_size,
+                    page_number=settings.api.default_page_number,
+                    sort=TOP_RATED_SORT,
+                    genre=None,
+                )
+            ]
+
+        calls: list[Callable[[], Awaitable[Any]]] = []
+        for offset in range(0, len(film_ids), self.batch_size):
+            batch = film_ids[offset : offset + self.batch_size]
+            calls.append(partial(film_service.get_films_by_ids, batch))
+        for member in lists:
+            calls.append(partial(film_service.get_films, **decode_access(member)))
+        for member in searches:
+            calls.append(partial(film_service.search_films, **decode_access(member)))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def call(func: Callable[[], Awaitable[Any]]) -> None:
+            async with semaphore:
+                try:
+                    await func()
+                    self.warmed += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning(f"Failed to warm a film cache entry: {e}")
+
+        await asyncio.gather(*(call(func) for func in calls))
+        self.runs += 1
+        self.last_duration = time.monotonic() - started
+        logger.info(
+            f"Warmed film caches with {len(film_ids)} films, {len(lists)} lists and {len(searches)} searches "
+            f"in {self.last_duration:.2f} s."
+        )
+
+    async def _top_rated_film_ids(self, film_service: FilmService) -> list[str]:
+        """
+        Return the IDs of the best rated films, the stand-in for a lost ranking of film accesses.
+        """
+        try:
+            films = await film_service.get_films(page_size=self.top_n, page_number=1, sort=TOP_RATED_SORT)
+        except Exception as e:
+            logger.warning(f"Failed to fetch the best rated films to warm: {e}")
+            return []
+        return [film.id for film in films]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "warmed": self.warmed,
+            "failed": self.failed,
+            "last_duration": round(self.last_duration, 3) if self.last_duration is not None else None,
+        }
+
+
+film_cache_warmer = FilmCacheWarmer(
+    popularity=popularity_tracker,
+    top_n=settings.cache.warmup_top_n,
+    concurrency=settings.cache.warmup_concurrency,
+    batch_size=settings.api.batch_max_size,
+    interval=settings.cache.warmup_interval,
+    lock_name=settings.cache.warmup_lock_name,
+)
@@ -4,10 +4,12 @@ from typing import Annotated
 from elasticsearch import AsyncElasticsearch
 from fastapi import Depends
 
+from fastapi_service.src.core.config import settings
 from fastapi_service.src.db.elasticsearch import get_elastic
 from fastapi_service.src.services.elasticsearch.client import ElasticsearchClient
 from fastapi_service.src.services.elasticsearch.model_service import ModelService
 from fastapi_service.src.services.elasticsearch.search_service import SearchService
+from fastapi_service.src.services.genre.catalogue import genre_catalogue
 from fastapi_service.src.services.genre.service import GenreService
 
 
@@ -21,4 +23,5 @@ def get_genre_service(
     elasticsearch_client_instance = ElasticsearchClient(elasticsearch_client)
     model_service = ModelService(elasticsearch_client_instance)
     search_service = SearchService(elasticsearch_client_instance)
-    return GenreService(model_service=model_service, search_service=search_service)
+    catalogue = genre_catalogue if settings.cache.genre_catalogue_enabled else None
+    return GenreService(model_service=model_service, search_service=search_service, catalogue=catalogue)
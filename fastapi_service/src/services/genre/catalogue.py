@@ -0,0 +1,138 @@
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
+from elasticsearch import NotFoundError
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.logger import setup_logging
+from fastapi_service.src.db.elasticsearch import get_elastic
+from fastapi_service.src.models.genre import Genre
+from fastapi_service.src.services.elasticsearch.client import ElasticsearchClient
+from fastapi_service.src.services.redis.invalidation import cache_invalidation_listener
+
+logger = setup_logging(logger_name=__name__)
+
+
+class GenreSnapshot(NamedTuple):
+    """
+    Immutable copy of the whole genres index.
+
+    Attributes:
+        genres (tuple[Genre, ...]): Genres sorted by name and ID, like GENRE_DEFAULT_SORT sorts them in Elasticsearch.
+        by_id (Mapping[str, Genre]): Genres by ID.
+        loaded_at (float): Time the snapshot was loaded at.
+    """
+
+    genres: tuple[Genre, ...]
+    by_id: Mapping[str, Genre]
+    loaded_at: float
+
+
+class GenreCatalogue:
+    """
+    Holds the genres of the worker in memory.
+
+    There are only a few hundred genres, so the whole index is loaded into an
+    immutable snapshot at startup and reloaded every `refresh_interval` seconds
+    and whenever the ETL service announces a change of the index. Readers get the
+    current snapshot without any I/O; a reload swaps it atomically, so a reader
+    never sees a partially loaded catalogue.
+
+    A failed reload keeps the previous snapshot. Until a non-empty snapshot has
+    been loaded, `snapshot` is None and genres are read from Elasticsearch.
+    """
+
+    def __init__(self, *, index: str, refresh_interval: float, max_size: int):
+        """
+        :param index: genres index name
+        :param refresh_interval: time in seconds between reloads
+        :param max_size: maximum number of genres to load
+        """
+        self.index = index
+        self.refresh_interval = refresh_interval
+        self.max_size = max_size
+        self.reloads = 0
+        self.failed_reloads = 0
+        self._snapshot: GenreSnapshot | None = None
+        self._changed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def snapshot(self) -> GenreSnapshot | None:
+        return self._snapshot
+
+    async def start(self) -> None:
+        if self._task is None:
+            cache_invalidation_listener.subscribe(self.index, self._changed.set)
+            await self.reload()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=self.refresh_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+            await self.reload()
+
+    async def reload(self) -> None:
+        """
+        Load the genres index into a new snapshot, keeping the current one on failure.
+        """
+        self.reloads += 1
+        try:
+            client = ElasticsearchClient(await get_elastic())
+            documents = await client.search(
+                index=self.index, query=None, sort=["_doc"], size=self.max_size, from_=0, source_includes=None
+            )
+        except NotFoundError:
+            logger.info(f"Index {self.index} does not exist, genres are read from Elasticsearch.")
+            self._snapshot = None
+            return
+        except Exception as e:
+            self.failed_reloads += 1
+            logger.warning(f"Failed to load genre catalogue: {e}")
+            return
+
+        if len(documents) >= self.max_size:
+            logger.warning(f"Genre catalogue is truncated to {self.max_size} genres.")
+
+        genres = tuple(sorted((Genre(**document) for document in documents), key=lambda g: (g.name, g.id)))
+        self._snapshot = (
+            GenreSnapshot(
+                genres=genres,
+                by_id=MappingProxyType({genre.id: genre for genre in genres}),
+                loaded_at=time.time(),
+            )
+            if genres
+            else None
+        )
+        logger.debug(f"Loaded {len(genres)} genres into the catalogue.")
+
+    def as_dict(self) -> dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "genres": len(snapshot.genres) if snapshot else 0,
+            "loaded_at": snapshot.loaded_at if snapshot else None,
+            "reloads": self.reloads,
+            "failed_reloads": self.failed_reloads,
+        }
+
+
+genre_catalogue = GenreCatalogue(
+    index=settings.eks.genres_index,
+    refresh_interval=settings.cache.genre_catalogue_refresh_interval,
+    max_size=settings.cache.genre_catalogue_max_size,
+)
@@ -1,17 +1,37 @@
+from pydantic import TypeAdapter
+
 from fastapi_service.src.core.config import settings
 from fastapi_service.src.models.genre import Genre
+from fastapi_service.src.services.elasticsearch.cursor import (
+    FIRST_PAGE_CURSOR,
+    decode_offset_cursor,
+    encode_offset_cursor,
+)
 from fastapi_service.src.services.elasticsearch.model_service import ModelService
 from fastapi_service.src.services.elasticsearch.search_service import SearchService
+from fastapi_service.src.services.genre.catalogue import GenreCatalogue
+
+GENRE_LIST_ADAPTER = TypeAdapter(list[Genre])
+# Order of genre lists without a sort, the order of the catalogue snapshot too.
+GENRE_DEFAULT_SORT = ["name.raw", "id"]
 
 
 class GenreService:
     """
     Contains business logic for working with genres.
+
+    Genre lists without a sort are ordered by name and ID. With a catalogue,
+    those lists, their pages and genre details are served from its in-memory
+    snapshot in the same order; searches and other sort orders still go to
+    Elasticsearch.
     """
 
-    def __init__(self, model_service: ModelService, search_service: SearchService):
+    def __init__(
+        self, model_service: ModelService, search_service: SearchService, catalogue: GenreCatalogue | None = None
+    ):
         self.model_service = model_service
         self.search_service = search_service
+        self.catalogue = catalogue
 
     async def fetch_genres(
         self,
@@ -24,14 +44,42 @@ class GenreService:
         Retrieve a list of genres based on the given parameters.
         May return an empty list if no genres are found.
         """
+        snapshot = self.catalogue.snapshot if self.catalogue and not sort else None
+        if snapshot is not None:
+            offset = (page_number - 1) * page_size
+            return list(snapshot.genres[offset : offset + page_size])
+
         data = await self.search_service.search_models(
-            index=settings.eks.genres_index, page_number=page_number, page_size=page_size, sort=sort
+            index=settings.eks.genres_index,
+            page_number=page_number,
+            page_size=page_size,
+            sort=sort or GENRE_DEFAULT_SORT,
         )
 
         if not data:
             return []
 
-        return [Genre(**row) for row in data]
+        return GENRE_LIST_ADAPTER.validate_python(data)
+
+    async def fetch_genres_page(
+        self, *, page_size: int, cursor: str, sort: list[str] | None = None
+    ) -> tuple[list[Genre], str | None]:
+        """
+        Retrieve a page of genres after a cursor, see `SearchService.search_models_after`.
+        Returns the genres and the cursor of the next page, None after the last page.
+        """
+        snapshot = self.catalogue.snapshot if self.catalogue and not sort else None
+        if snapshot is not None:
+            index = settings.eks.genres_index
+            offset = 0 if cursor == FIRST_PAGE_CURSOR else decode_offset_cursor(cursor, index)
+            end = offset + page_size
+            next_cursor = encode_offset_cursor(index, end) if end < len(snapshot.genres) else None
+            return list(snapshot.genres[offset:end]), next_cursor
+
+        data, next_cursor = await self.search_service.search_models_after(
+            index=settings.eks.genres_index, page_size=page_size, cursor=cursor, sort=sort or GENRE_DEFAULT_SORT
+        )
+        return GENRE_LIST_ADAPTER.validate_python(data), next_cursor
 
     async def search_genres(
         self,
@@ -67,13 +115,17 @@ class GenreService:
         if not data:
             return []
 
-        return [Genre(**row) for row in data]
+        return GENRE_LIST_ADAPTER.validate_python(data)
 
     async def get_genre_by_id(self, genre_id: str) -> Genre | None:
         """
         Retrieve a genre by its ID (UUID).
         Returns None if the genre is not found.
         """
+        snapshot = self.catalogue.snapshot if self.catalogue else None
+        if snapshot is not None:
+            return snapshot.by_id.get(genre_id)
+
         data = await self.model_service.get_model_by_id(index=settings.eks.genres_index, model_id=genre_id)
         if not data:
             return None
@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi_service.src.core.config import settings
 from fastapi_service.src.models.film import FilmShort
 from fastapi_service.src.models.person import Person
@@ -34,41 +36,19 @@ class PersonService:
         sort: list[str] | None = None,
     ) -> list[FilmShort]:
         """
-        Retrieve a list of films associated with a person.
+        Retrieve a page of the films associated with a person.
+        The films are read from the filmography nested in the person document, ratings included.
         """
-        query_match = {
-            "bool": {
-                "must": {"term": {"id": person_id}},
-                "filter": {
-                    "nested": {
-                        "path": "films",
-                        "query": {"match_all": {}},
-                        "inner_hits": {
-                            "size": page_size,
-                            "from": self.search_service.calculate_offset(page_number, page_size),
-                        },
-                    }
-                },
-            }
-        }
-
-        data = await self.search_service.search_models(
+        person_films = await self.search_service.search_nested_models(
             index=settings.eks.persons_index,
-            query_match=query_match,
+            model_id=person_id,
+            path="films",
             page_number=page_number,
             page_size=page_size,
             sort=sort,
         )
 
-        if not data:
-            return []
-
-        data_films = data[0].get("films")
-
-        if not data_films:
-            return []
-
-        return [FilmShort(**row) for row in data_films]
+        return [FilmShort(id=row["id"], title=row["title"], imdb_rating=row.get("imdb_rating")) for row in person_films]
 
     async def fetch_persons(
         self,
@@ -102,18 +82,7 @@ class PersonService:
         Retrieve a list of persons based on a search query.
         May return an empty list if no persons match the query.
         """
-        query_match = (
-            {
-                "multi_match": {
-                    "query": query,
-                    "fuzziness": "AUTO",
-                    "fields": ["full_name^3"],
-                    "operator": "and",
-                }
-            }
-            if query
-            else None
-        )
+        query_match = self._full_name_query(query)
 
         data = await self.search_service.search_models(
             index=settings.eks.persons_index,
@@ -127,3 +96,33 @@ class PersonService:
             return []
 
         return [Person(**row) for row in data]
+
+    async def search_persons_page(
+        self, *, page_size: int, cursor: str, query: str, sort: list[str] | None = None
+    ) -> tuple[list[Person], str | None]:
+        """
+        Retrieve a page of persons matching a search query after a cursor,
+        see `SearchService.search_models_after`.
+        Returns the persons and the cursor of the next page, None after the last page.
+        """
+        data, next_cursor = await self.search_service.search_models_after(
+            index=settings.eks.persons_index,
+            page_size=page_size,
+            cursor=cursor,
+            query_match=self._full_name_query(query),
+            sort=sort,
+        )
+        return [Person(**row) for row in data], next_cursor
+
+    @staticmethod
+    def _full_name_query(query: str) -> dict[str, Any] | None:
+        if not query:
+            return None
+        return {
+            "multi_match": {
+                "query": query,
+                "fuzziness": "AUTO",
+                "fields": ["full_name^3"],
+                "operator": "and",
+            }
+        }
@@ -1,87 +1,397 @@
+import asyncio
 import hashlib
+import time
 from typing import Any, Awaitable, Callable
 
 import orjson
+from redis.exceptions import LockError
 
 from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.deadline import request_deadline
+from fastapi_service.src.core.logger import setup_logging
+from fastapi_service.src.core.timing import timed
 from fastapi_service.src.db.redis import get_redis
+from fastapi_service.src.services.redis.codec import CodecError, cache_codec
+from fastapi_service.src.services.redis.entry import CacheEntry
+from fastapi_service.src.services.redis.generation import index_generations
+from fastapi_service.src.services.redis.local_cache import CacheTierStats, LocalCache, local_cache
+from fastapi_service.src.services.redis.pipeline import cache_writer
+from fastapi_service.src.services.redis.response_cache import response_stats
+from fastapi_service.src.services.redis.single_flight import SingleFlight
+
+logger = setup_logging(logger_name=__name__)
 
 redis_client = get_redis
 
+redis_stats = CacheTierStats()
+
+
+def get_cache_stats() -> dict[str, Any]:
+    """
+    Return hit/miss counters of every cache tier of the current worker.
+    """
+    return {
+        "local": {"enabled": settings.cache.local_enabled, **local_cache.as_dict()},
+        "redis": redis_stats.as_dict(),
+        "response": {"enabled": settings.cache.response_enabled, **response_stats.as_dict()},
+        "writes": cache_writer.as_dict(),
+        "generations": index_generations.as_dict(),
+    }
+
 
 class BaseCacheService:
     """
     Base class for cache services.
+
+    Reads go through an optional in-process LRU tier (L1) before Redis (L2).
+    Concurrent misses for the same key are coalesced into one call of the wrapped
+    function per worker and, when the Redis lock is enabled, across workers.
+
+    Entries are fresh for `ttl` seconds and then served stale for up to `stale_ttl`
+    seconds while a background task refreshes them. Fresh entries may be refreshed
+    early, with a probability tuned by `beta`.
+
+    When `negative_ttl` is set, empty results are cached for that many seconds as
+    a one-byte sentinel. Exceptions raised by the wrapped function are never cached.
     """
 
-    @staticmethod
-    async def fetch_from_cache(key: str) -> dict[str, Any] | None:
+    def __init__(
+        self,
+        *,
+        local: bool = True,
+        ttl: int = settings.redis.cache_expiration,
+        stale_ttl: int = 0,
+        beta: float = settings.cache.early_refresh_beta,
+        negative_ttl: int = 0,
+    ):
+        self.local_cache: LocalCache | None = local_cache if local and settings.cache.local_enabled else None
+        self.in_flight = SingleFlight()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.beta = beta
+        self.negative_ttl = negative_ttl
+
+    async def fetch_from_cache(self, key: str) -> CacheEntry | None:
         """
         Retrieve cached data by key.
 
         :param key: cache key
-        :return: cached data
+        :return: cached entry
         """
-        adapter = await redis_client()
-        data = await adapter.get(key)
+        with timed("cache"):
+            if self.local_cache is not None:
+                entry = self.local_cache.get(key)
+                if entry is not None:
+                    return entry
+
+            adapter = await redis_client()
+            return self._decode_entry(key, await adapter.get(key))
+
+    async def fetch_many_from_cache(self, keys: list[str]) -> list[CacheEntry | None]:
+        """
+        Retrieve cached data for several keys with a single Redis MGET.
+
+        :param keys: cache keys
+        :return: cached entries in the order of `keys`, None for misses
+        """
+        with timed("cache"):
+            entries: list[CacheEntry | None] = [None] * len(keys)
+            if self.local_cache is not None:
+                entries = [self.local_cache.get(key) for key in keys]
+
+            positions = [position for position, entry in enumerate(entries) if entry is None]
+            if not positions:
+                return entries
+
+            adapter = await redis_client()
+            values = await adapter.mget([keys[position] for position in positions])
+            for position, data in zip(positions, values, strict=True):
+                entries[position] = self._decode_entry(keys[position], data)
+            return entries
+
+    def _decode_entry(self, key: str, data: bytes | None) -> CacheEntry | None:
         if not data:
+            redis_stats.misses += 1
             return None
-        return orjson.loads(data)
 
-    @staticmethod
-    async def store_in_cache(key: str, data: str) -> None:
+        if data == CacheEntry.NEGATIVE_PAYLOAD:
+            entry = CacheEntry.negative()
+        else:
+            try:
+                entry = CacheEntry.from_payload(cache_codec.decode(data))
+            except CodecError as e:
+                logger.warning(f"Ignoring undecodable cache entry {key}: {e}")
+                redis_stats.misses += 1
+                return None
+
+        redis_stats.hits += 1
+        if self.local_cache is not None:
+            self.local_cache.set(key, entry, size=len(data))
+        return entry
+
+    async def store_in_cache(self, key: str, data: Any, delta: float = 0.0) -> None:
         """
         Store data in the cache with a key.
 
         :param key: cache key
         :param data: data to store
+        :param delta: time in seconds it took to compute the data
         """
-        adapter = await redis_client()
-        await adapter.set(key, data, settings.redis.cache_expiration)
+        entry = CacheEntry.create(data, ttl=self.ttl, delta=delta)
+        await self._store_entry(key, entry, cache_codec.encode(entry.to_payload()), self.ttl + self.stale_ttl)
+
+    async def store_negative_in_cache(self, key: str) -> None:
+        """
+        Record in the cache that there is no data for a key.
+
+        :param key: cache key
+        """
+        await self._store_entry(key, CacheEntry.negative(), CacheEntry.NEGATIVE_PAYLOAD, self.negative_ttl)
+
+    async def store_many_in_cache(self, items: dict[str, Any], delta: float = 0.0) -> None:
+        """
+        Store several results, written to Redis in one pipelined batch.
+        Empty results are recorded as missing when `negative_ttl` is set and skipped otherwise.
+
+        :param items: data to store by cache key
+        :param delta: time in seconds it took to compute the data
+        """
+        written = None
+        for key, data in items.items():
+            if data:
+                entry = CacheEntry.create(data, ttl=self.ttl, delta=delta)
+                payload, ttl = cache_codec.encode(entry.to_payload()), self.ttl + self.stale_ttl
+            elif self.negative_ttl:
+                entry, payload, ttl = CacheEntry.negative(), CacheEntry.NEGATIVE_PAYLOAD, self.negative_ttl
+            else:
+                continue
+            written = self._write_entry(key, entry, payload, ttl)
+
+        if written is not None:
+            await self._wait_written(written)
+
+    async def _store_entry(self, key: str, entry: CacheEntry, payload: bytes, ttl: int) -> None:
+        await self._wait_written(self._write_entry(key, entry, payload, ttl))
+
+    def _write_entry(self, key: str, entry: CacheEntry, payload: bytes, ttl: int) -> asyncio.Future[None]:
+        if self.local_cache is not None:
+            self.local_cache.set(key, entry, size=len(payload), ttl=ttl)
+        return cache_writer.set(key, payload, ttl)
+
+    @staticmethod
+    async def _wait_written(written: asyncio.Future[None]) -> None:
+        """
+        Wait until a write reaches Redis, unless writes are behind.
+        Writes are always awaited with the Redis lock enabled, as other workers
+        read the entry as soon as the lock is released.
+        """
+        if not settings.cache.write_behind or settings.cache.lock_enabled:
+            await asyncio.shield(written)
 
     async def cached_result(
         self, cache_key: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
     ) -> Any:
-        result = await self.fetch_from_cache(cache_key)
+        entry = await self.fetch_from_cache(cache_key)
+        if entry is not None:
+            if not entry.is_negative and entry.needs_refresh(self.beta):
+                self._schedule_refresh(cache_key, func, *args, **kwargs)
+            return entry.value
+
+        if not settings.cache.single_flight:
+            return await self.populate_cache(cache_key, func, *args, **kwargs)
+
+        return await self.in_flight.do(cache_key, lambda: self.populate_cache(cache_key, func, *args, **kwargs))
+
+    async def populate_cache(
+        self, cache_key: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Call the wrapped function and store its result.
+
+        With the Redis lock enabled only the lock holder calls the function; other
+        workers wait for the holder to store the result and read it from the cache.
+        """
+        if not settings.cache.lock_enabled:
+            return await self._call_and_store(cache_key, func, *args, **kwargs)
+
+        adapter = await redis_client()
+        lock_name = f"lock:{cache_key}"
+        lock = adapter.lock(lock_name, timeout=settings.cache.lock_ttl, blocking=False)
+        if not await lock.acquire():
+            entry = await self._wait_for_cache(cache_key, lock_name)
+            if entry is not None:
+                return entry.value
+            return await self._call_and_store(cache_key, func, *args, **kwargs)
+
+        try:
+            entry = await self.fetch_from_cache(cache_key)
+            if entry is not None and entry.is_fresh():
+                return entry.value
+            return await self._call_and_store(cache_key, func, *args, **kwargs)
+        finally:
+            try:
+                await lock.release()
+            except LockError:
+                logger.warning(f"Cache lock for key {cache_key} expired before release.")
+
+    def _schedule_refresh(self, cache_key: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> None:
+        """
+        Refresh the entry in a background task unless a call for the key is already in flight.
+        """
+        self.in_flight.start(cache_key, lambda: self._refresh(cache_key, func, *args, **kwargs))
+
+    async def _refresh(self, cache_key: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        # The refresh outlives the request that triggered it, so it is not bound by its deadline.
+        request_deadline.set(None)
+        try:
+            return await self.populate_cache(cache_key, func, *args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Failed to refresh cache entry {cache_key}: {e}")
+            return None
+
+    async def _call_and_store(
+        self, cache_key: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        started = time.monotonic()
+        result = await func(*args, **kwargs)
         if not result:
-            result = await func(*args, **kwargs)
-            if not result:
-                return None
-            await self.store_in_cache(cache_key, orjson.dumps(result).decode("utf-8"))
+            if self.negative_ttl:
+                await self.store_negative_in_cache(cache_key)
+            return None
+        await self.store_in_cache(cache_key, result, delta=time.monotonic() - started)
         return result
 
+    async def _wait_for_cache(self, cache_key: str, lock_name: str) -> CacheEntry | None:
+        """
+        Poll the cache until another worker stores a fresh entry or releases its lock.
+        """
+        adapter = await redis_client()
+        deadline = time.monotonic() + settings.cache.lock_ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.cache.lock_poll_interval)
+            entry = await self.fetch_from_cache(cache_key)
+            if entry is not None and entry.is_fresh():
+                return entry
+            if not await adapter.exists(lock_name):
+                break
+        return None
+
 
 class ModelCacheDecorator(BaseCacheService):
     """Decorator that caches model data for database queries."""
 
-    def __init__(self, *, key: str = ""):
+    def __init__(self, *, key: str = "", **kwargs: Any):
+        super().__init__(**kwargs)
         self.key = key
 
+    @staticmethod
+    def make_key(model_id: str) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(bytes(model_id, "utf-8"))
+        return hasher.hexdigest()
+
     def __call__(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             cache_key = kwargs.get(self.key)
             if not cache_key:
                 cache_key = "".join(tuple(kwargs.values()))
 
-            hasher = hashlib.sha256()
-            hasher.update(bytes(cache_key, "utf-8"))
-            cache_key = hasher.hexdigest()
-
-            return await self.cached_result(cache_key, func, *args, **kwargs)
+            return await self.cached_result(self.make_key(cache_key), func, *args, **kwargs)
 
         return wrapper
 
+    async def cached_models(
+        self, model_ids: list[str], func: Callable[[list[str]], Awaitable[list[Any]]]
+    ) -> dict[str, Any]:
+        """
+        Resolve several models from the cache and fetch the misses with one call of `func`.
+        Stale models are served and refreshed in the background with one more call of `func`.
+
+        :param model_ids: unique model IDs
+        :param func: coroutine function returning the models for a list of IDs in the same order,
+            None for missing models
+        :return: models by ID, None for missing models
+        """
+        entries = await self.fetch_many_from_cache([self.make_key(model_id) for model_id in model_ids])
+
+        models: dict[str, Any] = {}
+        missing, stale = [], []
+        for model_id, entry in zip(model_ids, entries, strict=True):
+            if entry is None:
+                missing.append(model_id)
+                continue
+            models[model_id] = entry.value
+            if not entry.is_negative and entry.needs_refresh(self.beta):
+                stale.append(model_id)
+
+        if stale:
+            self.in_flight.start(self.make_key(",".join(stale)), lambda: self._refresh_models(stale, func))
+        if missing:
+            models.update(await self._call_and_store_models(missing, func))
+        return models
+
+    async def _refresh_models(self, model_ids: list[str], func: Callable[[list[str]], Awaitable[list[Any]]]) -> None:
+        request_deadline.set(None)
+        try:
+            await self._call_and_store_models(model_ids, func)
+        except Exception as e:
+            logger.exception(f"Failed to refresh {len(model_ids)} cached models: {e}")
+
+    async def _call_and_store_models(
+        self, model_ids: list[str], func: Callable[[list[str]], Awaitable[list[Any]]]
+    ) -> dict[str, Any]:
+        started = time.monotonic()
+        models = {model_id: model or None for model_id, model in zip(model_ids, await func(model_ids), strict=True)}
+        await self.store_many_in_cache(
+            {self.make_key(model_id): model for model_id, model in models.items()},
+            delta=time.monotonic() - started,
+        )
+        return models
+
 
 class QueryCacheDecorator(BaseCacheService):
-    """Decorator that caches query results."""
+    """
+    Decorator that caches query results.
+
+    The key includes the generation of the queried index, so bumping the generation
+    makes every cached query over the index unreachable at once, and the qualified
+    name of the decorated function, so functions called with equal arguments do
+    not share entries.
+    """
 
     def __call__(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            hasher = hashlib.sha256()
-            for arg in kwargs.values():
-                hasher.update(bytes(str(arg), "utf-8"))
-            cache_key = hasher.hexdigest()
-
+            index = kwargs.get("index")
+            generation = await index_generations.get(index) if index else 0
+            cache_key = self.make_key(func, generation, kwargs)
             return await self.cached_result(cache_key, func, *args, **kwargs)
 
         return wrapper
+
+    @staticmethod
+    def make_key(func: Callable[..., Awaitable[Any]], generation: int, kwargs: dict[str, Any]) -> str:
+        """
+        Hash the function, the index generation and the keyword arguments of a query.
+        Arguments are serialized with their names and sorted, so no two different calls map to the same key.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(bytes(f"{func.__qualname__}:{generation}:", "utf-8"))
+        hasher.update(orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS, default=str))
+        return hasher.hexdigest()
+
+
+async def invalidate_models(model_ids: list[str]) -> None:
+    """
+    Evict cached models by their IDs from Redis and the local tier of the current worker.
+
+    :param model_ids: IDs of changed models
+    """
+    if not model_ids:
+        return
+
+    keys = [ModelCacheDecorator.make_key(model_id) for model_id in model_ids]
+    for key in keys:
+        local_cache.delete(key)
+
+    adapter = await redis_client()
+    await adapter.delete(*keys)
@@ -0,0 +1,92 @@
+from typing import Any, Callable, Literal
+
+import lz4.frame
+import msgpack
+import orjson
+import zstandard
+
+from fastapi_service.src.core.config import settings
+
+Serializer = Literal["json", "msgpack"]
+Compression = Literal["none", "zstd", "lz4"]
+
+HEADER_MARKER = 0x80
+
+SERIALIZER_IDS: dict[str, int] = {"json": 0, "msgpack": 1}
+COMPRESSION_IDS: dict[str, int] = {"none": 0, "zstd": 1, "lz4": 2}
+
+SERIALIZERS: dict[int, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    0: (orjson.dumps, orjson.loads),
+    1: (msgpack.packb, msgpack.unpackb),
+}
+
+COMPRESSIONS: dict[int, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    0: (lambda body: body, lambda body: body),
+    1: (zstandard.ZstdCompressor(level=settings.cache.compression_level).compress, zstandard.decompress),
+    2: (lz4.frame.compress, lz4.frame.decompress),
+}
+
+
+class CodecError(ValueError):
+    """Raised when a cache payload cannot be decoded."""
+
+
+class CacheCodec:
+    """
+    Encodes cache values into Redis payloads.
+
+    A payload starts with a header byte identifying the serializer and compression,
+    so workers can decode payloads written with any codec and codecs can be switched
+    with a rolling deploy. The header has the high bit set, which never starts a JSON
+    document, followed by the serializer id in bits 2-3 and the compression id in bits 0-1.
+
+    Uncompressed JSON is written without a header so that workers predating the codec
+    layer can still read it. Bodies shorter than `compression_threshold` bytes are not
+    compressed.
+    """
+
+    def __init__(self, *, serializer: Serializer, compression: Compression, compression_threshold: int):
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+
+    def encode(self, value: Any) -> bytes:
+        serializer_id = SERIALIZER_IDS[self.serializer]
+        dumps, _ = SERIALIZERS[serializer_id]
+        body = dumps(value)
+
+        compression_id = COMPRESSION_IDS[self.compression] if len(body) >= self.compression_threshold else 0
+        if not serializer_id and not compression_id:
+            return body
+        compress, _ = COMPRESSIONS[compression_id]
+        return bytes((HEADER_MARKER | serializer_id << 2 | compression_id,)) + compress(body)
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        """
+        Decode a payload written with any codec.
+
+        :param data: payload read from Redis
+        :return: decoded value
+        """
+        header = data[0]
+        if not header & HEADER_MARKER:
+            serializer_id, compression_id, body = 0, 0, data
+        else:
+            serializer_id, compression_id, body = header >> 2 & 0b11, header & 0b11, data[1:]
+        if serializer_id not in SERIALIZERS or compression_id not in COMPRESSIONS:
+            raise CodecError(f"Unknown cache payload header: {header:#x}")
+
+        _, loads = SERIALIZERS[serializer_id]
+        _, decompress = COMPRESSIONS[compression_id]
+        try:
+            return loads(decompress(body))
+        except (ValueError, RuntimeError, zstandard.ZstdError) as e:
+            raise CodecError(f"Corrupted cache payload: {e}")
+
+
+cache_codec = CacheCodec(
+    serializer=settings.cache.serializer,
+    compression=settings.cache.compression,
+    compression_threshold=settings.cache.compression_threshold,
+)
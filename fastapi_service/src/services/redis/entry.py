@@ -0,0 +1,78 @@
+import math
+import random
+import time
+from typing import Any
+
+
+class CacheEntry:
+    """
+    Cached value with a soft expiry.
+
+    Redis keeps the entry until the hard expiry (soft expiry plus the stale window),
+    so readers can still serve the value while it is being refreshed.
+
+    Attributes:
+        value (Any): The cached value.
+        expires (float): Soft expiry as a Unix timestamp.
+        delta (float): Time in seconds it took to compute the value.
+    """
+
+    __slots__ = ("value", "expires", "delta")
+
+    NEGATIVE_PAYLOAD = b"\x00"
+
+    def __init__(self, value: Any, expires: float, delta: float = 0.0):
+        self.value = value
+        self.expires = expires
+        self.delta = delta
+
+    @classmethod
+    def create(cls, value: Any, *, ttl: float, delta: float) -> "CacheEntry":
+        return cls(value=value, expires=time.time() + ttl, delta=delta)
+
+    @classmethod
+    def negative(cls) -> "CacheEntry":
+        """
+        Entry recording that the wrapped function found nothing. Its value is None
+        and it lives for the negative TTL without soft expiry.
+        """
+        return cls(value=None, expires=math.inf)
+
+    @property
+    def is_negative(self) -> bool:
+        return self.value is None
+
+    @classmethod
+    def from_payload(cls, data: Any) -> "CacheEntry":
+        """
+        Build an entry from a decoded payload.
+
+        Payloads written before entries carried an expiry hold the bare value and
+        are treated as fresh until Redis expires them.
+        """
+        if isinstance(data, dict) and data.keys() == {"value", "expires", "delta"}:
+            return cls(value=data["value"], expires=data["expires"], delta=data["delta"])
+        return cls(value=data, expires=math.inf)
+
+    def to_payload(self) -> dict[str, Any]:
+        return {"value": self.value, "expires": self.expires, "delta": self.delta}
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def needs_refresh(self, beta: float) -> bool:
+        """
+        Decide whether the entry should be recomputed now.
+
+        Stale entries always need a refresh. Fresh entries are refreshed early with a
+        probability that grows as the expiry approaches and with the cost of computing
+        the value (XFetch), which spreads recomputation of hot keys over time.
+
+        :param beta: early refresh aggressiveness, 0 disables early refresh
+        """
+        now = time.time()
+        if now >= self.expires:
+            return True
+        if beta <= 0 or not self.delta:
+            return False
+        return now - self.delta * beta * math.log(1.0 - random.random()) >= self.expires
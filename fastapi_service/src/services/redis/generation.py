@@ -0,0 +1,104 @@
+import time
+from typing import NamedTuple
+
+import orjson
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.db.redis import get_redis
+
+
+class IndexVersion(NamedTuple):
+    generation: int
+    modified: float
+
+
+class IndexGenerations:
+    """
+    Generation counters of Elasticsearch indices, part of every query cache key.
+
+    Bumping the generation of an index makes all cached queries over it unreachable
+    in O(1); the old entries age out of Redis on their own TTL.
+
+    Each worker keeps the generations in memory. They are updated by change
+    notifications and re-read from Redis at most every `refresh_interval` seconds,
+    which bounds staleness if a notification is lost.
+
+    Along with the generation, the time of the last modification of each index is
+    kept, which serves as `Last-Modified` of the responses built from the index.
+    """
+
+    def __init__(self, *, key_prefix: str, refresh_interval: float):
+        self.key_prefix = key_prefix
+        self.refresh_interval = refresh_interval
+        self._versions: dict[str, tuple[IndexVersion, float]] = {}
+
+    def key(self, index: str) -> str:
+        return f"{self.key_prefix}{index}"
+
+    def modified_key(self, index: str) -> str:
+        return f"{self.key_prefix}{index}:modified"
+
+    async def get(self, index: str) -> int:
+        """
+        Return the current generation of an index.
+
+        :param index: index name
+        :return: generation, 0 if the index has never been bumped
+        """
+        return (await self.get_version(index)).generation
+
+    async def get_version(self, index: str) -> IndexVersion:
+        """
+        Return the current generation of an index with the time it was last modified.
+
+        :param index: index name
+        :return: generation and modification time, zeros if the index has never been bumped
+        """
+        cached = self._versions.get(index)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        adapter = await get_redis()
+        generation, modified = await adapter.mget(self.key(index), self.modified_key(index))
+        version = IndexVersion(int(generation) if generation else 0, float(modified) if modified else 0.0)
+        self._versions[index] = (version, time.monotonic() + self.refresh_interval)
+        return version
+
+    def update(self, index: str, generation: int, modified: float | None = None) -> None:
+        """
+        Record a generation of an index announced by a change notification.
+
+        :param index: index name
+        :param generation: new generation
+        :param modified: time the index was modified at, now if not announced
+        """
+        cached = self._versions.get(index)
+        if modified is None:
+            modified = cached[0].modified if cached and cached[0].generation == generation else time.time()
+        self._versions[index] = (IndexVersion(generation, modified), time.monotonic() + self.refresh_interval)
+
+    async def bump(self, index: str) -> int:
+        """
+        Increment the generation of an index and announce it to all workers.
+
+        :param index: index name
+        :return: new generation
+        """
+        adapter = await get_redis()
+        generation, modified = await adapter.incr(self.key(index)), time.time()
+        await adapter.set(self.modified_key(index), modified)
+        self.update(index, generation, modified)
+        await adapter.publish(
+            settings.cache.invalidation_channel,
+            orjson.dumps({"index": index, "ids": [], "generation": generation, "modified": modified}),
+        )
+        return generation
+
+    def as_dict(self) -> dict[str, int]:
+        return {index: version.generation for index, (version, _) in self._versions.items()}
+
+
+index_generations = IndexGenerations(
+    key_prefix=settings.cache.generation_key_prefix,
+    refresh_interval=settings.cache.generation_refresh_interval,
+)
@@ -0,0 +1,109 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable
+
+import orjson
+from redis.exceptions import RedisError
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.logger import setup_logging
+from fastapi_service.src.db.redis import get_pubsub_redis
+from fastapi_service.src.services.redis.cache import invalidate_models
+from fastapi_service.src.services.redis.generation import index_generations
+
+logger = setup_logging(logger_name=__name__)
+
+
+class CacheInvalidationListener:
+    """
+    Evicts cache entries on change notifications published by the ETL service.
+
+    Every worker runs its own listener, so the local cache tier of each worker is
+    evicted too. A notification is a JSON object with the changed `index`, the `ids`
+    of the documents written to it, the new `generation` of the index and the
+    time it was `modified` at.
+
+    Data held in memory by the worker, e.g. the genre catalogue, can subscribe to
+    the notifications of its index to be reloaded as soon as it changes.
+    """
+
+    def __init__(self, channel: str, reconnect_delay: float = 1.0):
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._task: asyncio.Task[None] | None = None
+        self._subscribers: dict[str, list[Callable[[], None]]] = defaultdict(list)
+
+    def subscribe(self, index: str, callback: Callable[[], None]) -> None:
+        """
+        Call `callback` on every change notification of an index.
+
+        :param index: index name
+        :param callback: function called with no arguments; must not block, its errors are logged
+        """
+        self._subscribers[index].append(callback)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+            logger.info(f"Listening for cache invalidations on channel {self.channel}.")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                redis = await get_pubsub_redis()
+                async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        await self.handle(message["data"])
+            except (RedisError, ConnectionError) as e:
+                logger.warning(f"Cache invalidation listener lost connection: {e}. Reconnecting...")
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def handle(self, data: bytes | str) -> None:
+        """
+        Evict the cache entries affected by a single change notification.
+
+        :param data: raw notification payload
+        """
+        try:
+            notification: dict[str, Any] = orjson.loads(data)
+            index = notification["index"]
+            ids = notification.get("ids", [])
+            generation = notification.get("generation")
+            if generation is not None:
+                generation = int(generation)
+            modified = notification.get("modified")
+            if modified is not None:
+                modified = float(modified)
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"Malformed cache invalidation notification {data!r}: {e}")
+            return
+
+        if generation is not None:
+            index_generations.update(index, generation, modified)
+
+        for callback in self._subscribers.get(index, ()):
+            try:
+                callback()
+            except Exception as e:
+                logger.exception(f"Cache invalidation subscriber of index {index} failed: {e}")
+
+        try:
+            await invalidate_models(ids)
+        except RedisError as e:
+            logger.error(f"Failed to invalidate cache for index {index}: {e}")
+            return
+
+        logger.debug(f"Invalidated cache for {len(ids)} documents of index {index}.")
+
+
+cache_invalidation_listener = CacheInvalidationListener(channel=settings.cache.invalidation_channel)
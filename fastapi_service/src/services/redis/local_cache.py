@@ -0,0 +1,128 @@
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from fastapi_service.src.core.config import settings
+
+
+class CacheTierStats:
+    """
+    Hit/miss counters of a single cache tier.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class _LocalCacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float
+
+
+class LocalCache:
+    """
+    In-process LRU cache bounded by entry count, total size and TTL.
+
+    Holds already-decoded objects, so callers must treat returned values as read-only.
+    The size of an entry is the length of its serialized payload, which is a cheap
+    and stable proxy for the memory the decoded object occupies.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheTierStats()
+        self.evictions = 0
+        self._entries: OrderedDict[str, _LocalCacheEntry] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Any | None:
+        """
+        Retrieve a value and mark it as most recently used.
+
+        :param key: cache key
+        :return: cached value or None if the key is missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, *, size: int, ttl: float | None = None) -> None:
+        """
+        Store a value, evicting least recently used entries when over budget.
+
+        :param key: cache key
+        :param value: decoded value
+        :param size: size of the serialized value in bytes
+        :param ttl: entry lifetime in seconds, defaults to the cache TTL
+        """
+        if size > self.max_bytes:
+            self.delete(key)
+            return
+
+        self.delete(key)
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = _LocalCacheEntry(value=value, size=size, expires_at=time.monotonic() + lifetime)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **self.stats.as_dict(),
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+local_cache = LocalCache(
+    max_entries=settings.cache.local_max_entries,
+    max_bytes=settings.cache.local_max_bytes,
+    ttl=settings.cache.local_ttl,
+)
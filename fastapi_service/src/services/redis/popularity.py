@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.logger import setup_logging
+from fastapi_service.src.db.redis import get_redis
+
+logger = setup_logging(logger_name=__name__)
+
+# Cleared by the cache warmer, so that warming does not count as popularity.
+popularity_tracking: ContextVar[bool] = ContextVar("popularity_tracking", default=True)
+
+
+class PopularityTracker:
+    """
+    Access frequencies of films and queries in Redis sorted sets, shared by all workers.
+
+    Accesses are counted in memory and added to the sorted sets every
+    `flush_interval` seconds with one pipeline, so recording an access costs no
+    Redis round trip. Each kind of access has a sorted set per time window of
+    `window` seconds; the top members are taken from the current and the
+    previous window, so popularity follows the traffic and old windows expire.
+    Every set is trimmed to its `max_members` most frequent members.
+    """
+
+    def __init__(self, *, key_prefix: str, window: int, max_members: int, flush_interval: float):
+        """
+        :param key_prefix: prefix of the sorted set keys
+        :param window: length of a counting window in seconds
+        :param max_members: maximum number of members kept per window
+        :param flush_interval: time in seconds between flushes of the counts to Redis
+        """
+        self.key_prefix = key_prefix
+        self.window = window
+        self.max_members = max_members
+        self.flush_interval = flush_interval
+        self.recorded = 0
+        self.failed_flushes = 0
+        self._counts: dict[str, Counter[str]] = defaultdict(Counter)
+        self._task: asyncio.Task[None] | None = None
+
+    def key(self, kind: str, window: int) -> str:
+        return f"{self.key_prefix}{kind}:{window}"
+
+    def record(self, kind: str, member: str) -> None:
+        """
+        Count an access.
+
+        :param kind: kind of access, e.g. `film`
+        :param member: accessed film ID or serialized query
+        """
+        if popularity_tracking.get():
+            self._counts[kind][member] += 1
+            self.recorded += 1
+
+    async def top(self, kind: str, n: int) -> list[str]:
+        """
+        Return the most frequently accessed members of a kind, the most frequent first.
+
+        :param kind: kind of access
+        :param n: maximum number of members
+        """
+        window = int(time.time() // self.window)
+        adapter = await get_redis()
+        members = await adapter.zunion([self.key(kind, window), self.key(kind, window - 1)], withscores=True)
+        ranked = sorted(members, key=lambda member: member[1], reverse=True)[:n]
+        return [member.decode() if isinstance(member, bytes) else member for member, _ in ranked]
+
+    async def flush(self) -> None:
+        """
+        Add the counted accesses to the sorted sets of the current window.
+        """
+        counts, self._counts = self._counts, defaultdict(Counter)
+        if not counts:
+            return
+
+        window = int(time.time() // self.window)
+        try:
+            adapter = await get_redis()
+            async with adapter.pipeline(transaction=False) as pipe:
+                for kind, members in counts.items():
+                    key = self.key(kind, window)
+                    for member, count in members.items():
+                        pipe.zincrby(key, count, member)
+                    pipe.zremrangebyrank(key, 0, -self.max_members - 1)
+                    pipe.expire(key, self.window * 2)
+                await pipe.execute()
+        except (RedisError, ConnectionError) as e:
+            self.failed_flushes += 1
+            logger.warning(f"Failed to flush access counts: {e}")
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "recorded": self.recorded,
+            "pending": sum(len(members) for members in self._counts.values()),
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+popularity_tracker = PopularityTracker(
+    key_prefix=settings.cache.popularity_key_prefix,
+    window=settings.cache.popularity_window,
+    max_members=settings.cache.popularity_max_members,
+    flush_interval=settings.cache.popularity_flush_interval,
+)
@@ -0,0 +1,315 @@
+import asyncio
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, NamedTuple
+from urllib.parse import parse_qsl, urlencode
+
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.core.logger import setup_logging
+from fastapi_service.src.core.timing import timed
+from fastapi_service.src.db.redis import get_redis
+from fastapi_service.src.services.redis.generation import IndexVersion, index_generations
+from fastapi_service.src.services.redis.local_cache import CacheTierStats, local_cache
+from fastapi_service.src.services.redis.pipeline import cache_writer
+
+logger = setup_logging(logger_name=__name__)
+
+
+class ResponseCacheStats(CacheTierStats):
+    """
+    Hit/miss counters of the response cache with the number of 304 responses.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.not_modified = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**super().as_dict(), "not_modified": self.not_modified}
+
+
+response_stats = ResponseCacheStats()
+
+RESPONSE_KEY_PREFIX = "response:"
+UNCACHED_QUERY_PARAMS = frozenset({"cursor"})
+
+
+class CachedRoute(NamedTuple):
+    index: str
+    max_age: int
+    related_indexes: tuple[str, ...] = ()
+
+
+def if_none_match_candidates(if_none_match: str | None) -> set[str]:
+    """
+    Split an If-None-Match header into its entity tags without the weak prefix.
+    """
+    if not if_none_match:
+        return set()
+    return {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """
+    Check an ETag against an If-None-Match header using the weak comparison of RFC 9110.
+
+    `*` is not matched here: it means that any representation exists, which is
+    unknown until the route has run or a cached body is found.
+    """
+    return etag.removeprefix("W/") in if_none_match_candidates(if_none_match)
+
+
+def not_modified_since(modified: float, if_modified_since: str | None) -> bool:
+    """
+    Check whether a resource modified at `modified` is unchanged since an If-Modified-Since date.
+    """
+    if not if_modified_since or not modified:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(modified) <= since.timestamp()
+
+
+class ResponseCacheMiddleware:
+    """
+    Conditional requests and caching of the rendered JSON bodies of GET responses of selected routes.
+
+    Validators are derived from the generations of the indices a route reads instead
+    of the body: the ETag is a digest of the index generations, the path and the
+    sorted query parameters, and `Last-Modified` is the time any of the indices was
+    last modified at. Both are known before the route runs, so requests whose
+    `If-None-Match` still matches get 304 Not Modified without touching Redis or
+    Elasticsearch: only a 200 response carries the ETag. Every response also carries
+    the `Cache-Control` max-age of its route, which lets browsers and the nginx proxy
+    cache reuse it.
+
+    With `store` enabled, the bodies are also cached in Redis and the local tier
+    under the same digest, and a hit is served straight from the stored bytes
+    without any Elasticsearch or model work. Bumping the generation of an index
+    invalidates both the validators and the cached bodies.
+
+    `If-None-Match: *` and `If-Modified-Since` say nothing about whether the
+    resource exists, so they get 304 only on a cache hit or once the route has
+    answered 200; missing resources and invalid queries still get their 404 or 422.
+
+    Excluded paths, cursor pages, non-200 and non-JSON responses pass through unchanged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        routes: dict[str, CachedRoute],
+        ttl: int,
+        store: bool = True,
+        exclude: tuple[str, ...] = (),
+    ):
+        """
+        :param app: ASGI application
+        :param routes: indices and Cache-Control max-age of the routes under each path prefix
+            or matching each path template such as `/persons/{person_id}/films`, templates first
+        :param ttl: lifetime of cached responses in seconds
+        :param store: whether to cache response bodies or only answer conditional requests
+        :param exclude: path prefixes within the routes that are neither cached nor answered with 304, e.g. streams
+        """
+        self.app = app
+        self.exclude = exclude
+        self.templates = [(compile_path(path)[0], route) for path, route in routes.items() if "{" in path]
+        self.routes = sorted(
+            ((path, route) for path, route in routes.items() if "{" not in path),
+            key=lambda route: len(route[0]),
+            reverse=True,
+        )
+        self.ttl = ttl
+        self.store = store
+        self.local_cache = local_cache if settings.cache.local_enabled else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        route = self._match_route(scope["path"])
+        query = parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+        if route is None or any(name in UNCACHED_QUERY_PARAMS for name, _ in query):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            versions = {
+                index: await index_generations.get_version(index) for index in (route.index, *route.related_indexes)
+            }
+        except (RedisError, ConnectionError) as e:
+            logger.warning(f"Response cache is unavailable: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        modified = max(version.modified for version in versions.values())
+        digest = self._make_digest(versions, scope["path"], query)
+        validators = self._make_validators(digest, modified, route.max_age)
+
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if etag_matches(validators["etag"], if_none_match):
+            response_stats.not_modified += 1
+            await self._send(send, HTTPStatus.NOT_MODIFIED, validators, b"")
+            return
+
+        not_modified = "*" in if_none_match_candidates(if_none_match) or (
+            if_none_match is None and not_modified_since(modified, request_headers.get("if-modified-since"))
+        )
+
+        if not self.store:
+            await self._call(scope, receive, send, validators, None, not_modified)
+            return
+
+        key = f"{RESPONSE_KEY_PREFIX}{digest}"
+        try:
+            with timed("response-cache"):
+                body = await self._fetch(key)
+        except (RedisError, ConnectionError) as e:
+            logger.warning(f"Response cache is unavailable: {e}")
+            await self._call(scope, receive, send, validators, None, not_modified)
+            return
+
+        if body is not None:
+            if not_modified:
+                response_stats.not_modified += 1
+                await self._send(send, HTTPStatus.NOT_MODIFIED, validators, b"")
+                return
+
+            response_stats.hits += 1
+            validators["content-type"] = "application/json"
+            validators["x-cache"] = "HIT"
+            await self._send(send, HTTPStatus.OK, validators, body)
+            return
+
+        response_stats.misses += 1
+        await self._call(scope, receive, send, validators, key, not_modified)
+
+    def _match_route(self, path: str) -> CachedRoute | None:
+        if any(path == prefix or path.startswith(f"{prefix}/") for prefix in self.exclude):
+            return None
+        for pattern, route in self.templates:
+            if pattern.match(path):
+                return route
+        for prefix, route in self.routes:
+            if path == prefix or path.startswith(f"{prefix}/"):
+                return route
+        return None
+
+    @staticmethod
+    def _make_digest(versions: dict[str, IndexVersion], path: str, query: list[tuple[str, str]]) -> str:
+        hasher = hashlib.sha256()
+        for index, version in versions.items():
+            hasher.update(bytes(f"{index}:{version.generation}:", "utf-8"))
+        hasher.update(bytes(f"{path}?{urlencode(sorted(query))}", "utf-8"))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _make_validators(digest: str, modified: float, max_age: int) -> MutableHeaders:
+        validators = MutableHeaders()
+        validators["etag"] = f'W/"{digest[:32]}"'
+        if modified:
+            validators["last-modified"] = formatdate(modified, usegmt=True)
+        validators["cache-control"] = f"public, max-age={max_age}"
+        return validators
+
+    async def _fetch(self, key: str) -> bytes | None:
+        if self.local_cache is not None:
+            body = self.local_cache.get(key)
+            if body is not None:
+                return body
+
+        adapter = await get_redis()
+        body = await adapter.get(key)
+        if not body:
+            return None
+
+        if self.local_cache is not None:
+            self.local_cache.set(key, body, size=len(body))
+        return body
+
+    def _store(self, key: str, body: bytes) -> asyncio.Future[None]:
+        if self.local_cache is not None:
+            self.local_cache.set(key, body, size=len(body), ttl=self.ttl)
+        return cache_writer.set(key, body, self.ttl)
+
+    async def _call(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        validators: MutableHeaders,
+        key: str | None,
+        not_modified: bool = False,
+    ) -> None:
+        """
+        Call the route, adding the validators to a cacheable response and storing its body
+        under `key` once it is complete. Other responses are streamed through unchanged.
+
+        :param key: cache key of the body, None not to store it; the body is written after it has been sent
+        :param not_modified: whether to answer a cacheable response with 304 instead of its body
+        """
+        start: Message | None = None
+        chunks: list[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                if message["status"] != HTTPStatus.OK or not content_type.startswith("application/json"):
+                    passthrough = True
+                    await send(message)
+                    return
+                headers = MutableHeaders(raw=list(message["headers"]))
+                headers.update(validators)
+                start = {**message, "headers": headers.raw}
+                if key is None and not not_modified:
+                    passthrough = True
+                    await send(start)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if key is None:
+                response_stats.not_modified += 1
+                await self._send(send, HTTPStatus.NOT_MODIFIED, validators, b"")
+                return
+
+            written = self._store(key, body)
+            if not_modified:
+                response_stats.not_modified += 1
+                await self._send(send, HTTPStatus.NOT_MODIFIED, validators, b"")
+                await asyncio.shield(written)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            headers["x-cache"] = "MISS"
+            await self._send(send, HTTPStatus.OK, headers, body)
+            await asyncio.shield(written)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    async def _send(send: Send, status: int, headers: MutableHeaders, body: bytes) -> None:
+        if status == HTTPStatus.OK:
+            headers["content-length"] = str(len(body))
+        await send({"type": "http.response.start", "status": status, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,48 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single in-flight call.
+
+    The call runs in its own task, so a cancelled caller (e.g. a dropped client
+    connection) does not cancel the call for the other callers awaiting it.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `func` unless a call for `key` is already in flight, then await its result.
+
+        :param key: key identifying the call
+        :param func: coroutine factory to run
+        :return: result of the in-flight call
+        """
+        return await asyncio.shield(self.start(key, func))
+
+    def start(self, key: str, func: Callable[[], Awaitable[Any]]) -> asyncio.Task[Any]:
+        """
+        Run `func` in the background unless a call for `key` is already in flight.
+
+        :param key: key identifying the call
+        :param func: coroutine factory to run
+        :return: task of the in-flight call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return task
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
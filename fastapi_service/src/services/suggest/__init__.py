@@ -0,0 +1,21 @@
+from functools import lru_cache
+from typing import Annotated
+
+from elasticsearch import AsyncElasticsearch
+from fastapi import Depends
+
+from fastapi_service.src.db.elasticsearch import get_elastic
+from fastapi_service.src.services.elasticsearch.client import ElasticsearchClient
+from fastapi_service.src.services.elasticsearch.search_service import SearchService
+from fastapi_service.src.services.suggest.service import SuggestService
+
+
+@lru_cache()
+def get_suggest_service(
+    elasticsearch_client: Annotated[AsyncElasticsearch, Depends(get_elastic)],
+) -> SuggestService:
+    """
+    Provider for SuggestService.
+    """
+    search_service = SearchService(ElasticsearchClient(elasticsearch_client))
+    return SuggestService(search_service=search_service)
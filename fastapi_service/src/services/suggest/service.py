@@ -0,0 +1,35 @@
+import asyncio
+
+from pydantic import TypeAdapter
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.models.suggestion import FilmSuggestion, PersonSuggestion, Suggestions
+from fastapi_service.src.services.elasticsearch.search_service import SearchService
+
+FILM_SUGGESTIONS_ADAPTER = TypeAdapter(list[FilmSuggestion])
+PERSON_SUGGESTIONS_ADAPTER = TypeAdapter(list[PersonSuggestion])
+
+
+class SuggestService:
+    """
+    Contains business logic for search box suggestions.
+    """
+
+    def __init__(self, search_service: SearchService):
+        self.search_service = search_service
+
+    async def suggest(self, *, prefix: str, size: int) -> Suggestions:
+        """
+        Retrieve films and persons whose title or full name matches the text typed so far.
+        Either list may be empty if nothing matches.
+        """
+        films, persons = await asyncio.gather(
+            self.search_service.suggest_models(index=settings.eks.films_index, field="title", prefix=prefix, size=size),
+            self.search_service.suggest_models(
+                index=settings.eks.persons_index, field="full_name", prefix=prefix, size=size
+            ),
+        )
+        return Suggestions(
+            films=FILM_SUGGESTIONS_ADAPTER.validate_python(films),
+            persons=PERSON_SUGGESTIONS_ADAPTER.validate_python(persons),
+        )
@@ -0,0 +1,334 @@
+"""
+Latency benchmark of the movies API endpoints, run in-process without any network.
+
+The app is driven through httpx's ASGI transport. Elasticsearch is replaced by an
+in-memory client implementing ElasticsearchClientProtocol over the test fixtures,
+with a fixed simulated latency per call, and Redis by fakeredis. Each scenario
+starts with empty caches, is warmed up, and then requested by a fixed number of
+concurrent clients; it reports throughput, latency percentiles and the peak memory
+allocated per request, measured in a separate sequential pass under tracemalloc.
+
+Results are written as JSON; pass a previous result to compare against it:
+
+    python -m tests.fastapi_service.benchmarks.bench_api --label "$(git rev-parse --short HEAD)" \
+        --output after.json --baseline before.json
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import fakeredis
+import httpx
+import orjson
+from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig
+from elasticsearch import NotFoundError
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.db import redis
+from fastapi_service.src.main import app
+from fastapi_service.src.services.elasticsearch.client import SearchAfterPage
+from fastapi_service.src.services.elasticsearch.model_service import ModelService
+from fastapi_service.src.services.elasticsearch.search_service import SearchService
+from fastapi_service.src.services.film import FilmService, get_film_service
+from fastapi_service.src.services.genre import GenreService, get_genre_service
+from fastapi_service.src.services.person import PersonService, get_person_service
+from fastapi_service.src.services.redis.local_cache import local_cache
+from tests.fastapi_service.testdata.film import film_data
+from tests.fastapi_service.testdata.genre import genre_data
+from tests.fastapi_service.testdata.person import person_data
+
+NOT_FOUND_META = ApiResponseMeta(
+    status=404, http_version="1.1", headers=HttpHeaders(), duration=0.0, node=NodeConfig("http", "localhost", 9200)
+)
+
+
+class FakeElasticsearchClient:
+    """
+    In-memory stand-in of ElasticsearchClient over a few indices of documents.
+
+    Supports the queries the services build closely enough to return realistic
+    pages: `term`, `terms`, `multi_match` as a case-insensitive substring match,
+    sorting on one or more fields and nested inner hits. Every call sleeps
+    `latency` seconds, the simulated network and search time.
+    """
+
+    def __init__(self, indices: dict[str, list[dict[str, Any]]], latency: float):
+        self.indices = {
+            index: {document["id"]: document for document in documents} for index, documents in indices.items()
+        }
+        self.latency = latency
+        self.calls = 0
+
+    async def _wait(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+    def _documents(self, index: str) -> dict[str, dict[str, Any]]:
+        if index not in self.indices:
+            raise NotFoundError(message=f"no such index [{index}]", meta=NOT_FOUND_META, body={})
+        return self.indices[index]
+
+    async def get(self, index: str, id_: str) -> dict[str, Any]:
+        await self._wait()
+        document = self._documents(index).get(id_)
+        if document is None:
+            raise NotFoundError(message=f"document {id_} not found", meta=NOT_FOUND_META, body={})
+        return {"_id": id_, "_source": document}
+
+    async def mget(self, index: str, ids: list[str]) -> list[dict[str, Any] | None]:
+        await self._wait()
+        documents = self._documents(index)
+        return [documents.get(id_) for id_ in ids]
+
+    async def search(
+        self,
+        index: str,
+        query: dict[str, Any],
+        sort: list[str],
+        size: int,
+        from_: int,
+        source_includes: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        await self._wait()
+        hits = self._sorted(self._match(self._documents(index).values(), query), sort)
+        page = hits[from_ or 0 : (from_ or 0) + size]
+        if source_includes is None:
+            return page
+        return [{field: document[field] for field in source_includes if field in document} for document in page]
+
+    async def search_inner_hits(
+        self, index: str, query: dict[str, Any], path: str, size: int, from_: int, sort: list[str] | None = None
+    ) -> list[dict[str, Any]] | None:
+        await self._wait()
+        hits = self._match(self._documents(index).values(), query)
+        if not hits:
+            return None
+        return self._sorted(hits[0].get(path, []), sort)[from_ : from_ + size]
+
+    async def open_point_in_time(self, index: str, keep_alive: str) -> str:
+        await self._wait()
+        return index
+
+    async def close_point_in_time(self, pit_id: str) -> None:
+        await self._wait()
+
+    async def search_after(
+        self,
+        query: dict[str, Any] | None,
+        sort: list[str],
+        size: int,
+        pit_id: str,
+        keep_alive: str,
+        search_after: list[Any] | None,
+        source_includes: list[str] | None = None,
+    ) -> SearchAfterPage:
+        offset = search_after[0] if search_after else 0
+        documents = await self.search(pit_id, query or {}, sort, size, offset, source_includes)
+        return SearchAfterPage(documents=documents, pit_id=pit_id, search_after=[offset + len(documents)])
+
+    @staticmethod
+    def _match(documents: Any, query: dict[str, Any] | None) -> list[dict[str, Any]]:
+        if not query:
+            return list(documents)
+        if "term" in query:
+            ((field, value),) = query["term"].items()
+            return [document for document in documents if document.get(field) == value]
+        if "terms" in query:
+            ((field, values),) = query["terms"].items()
+            values = set(values) if isinstance(values, list) else {values}
+            return [document for document in documents if values & set(document.get(field, []))]
+        if "multi_match" in query:
+            text = query["multi_match"]["query"].casefold()
+            fields = [field.split("^")[0].split(".")[0] for field in query["multi_match"]["fields"]]
+            return [
+                document
+                for document in documents
+                if any(text in str(document.get(field, "")).casefold() for field in fields)
+            ]
+        return list(documents)
+
+    @staticmethod
+    def _sorted(documents: list[dict[str, Any]], sort: list[str] | None) -> list[dict[str, Any]]:
+        for item in reversed(sort or []):
+            field, _, order = item.partition(":")
+            if field.startswith("_"):
+                continue
+            documents = sorted(
+                documents,
+                key=lambda document: (document.get(field) is None, document.get(field) or 0),
+                reverse=order == "desc",
+            )
+        return documents
+
+
+@dataclasses.dataclass
+class Scenario:
+    name: str
+    url: Callable[[random.Random], str]
+
+
+SCENARIOS = [
+    Scenario("film detail", lambda rng: f"/api/v1/films/{rng.choice(film_data)['id']}"),
+    Scenario("film list", lambda rng: f"/api/v1/films?page_size=50&page_number={rng.randint(1, 2)}"),
+    Scenario("film list by genre", lambda rng: f"/api/v1/films?genre={rng.choice(film_data)['genres_names'][0]}"),
+    Scenario("film search", lambda rng: f"/api/v1/films/search?query={rng.choice(['best', 'score', 'born'])}"),
+    Scenario("genre list", lambda rng: "/api/v1/genres?page_size=50"),
+    Scenario("genre detail", lambda rng: f"/api/v1/genres/{rng.choice(genre_data)['id']}"),
+    Scenario("person detail", lambda rng: f"/api/v1/persons/{rng.choice(person_data)['id']}"),
+    Scenario("person films", lambda rng: f"/api/v1/persons/{rng.choice(person_data)['id']}/films"),
+    Scenario("person search", lambda rng: f"/api/v1/persons/search?query={rng.choice(person_data)['full_name']}"),
+]
+
+
+def install_stand_ins(latency: float) -> FakeElasticsearchClient:
+    """
+    Replace Elasticsearch and Redis by the in-memory stand-ins.
+    """
+    client = FakeElasticsearchClient(
+        {
+            settings.eks.films_index: film_data,
+            settings.eks.genres_index: genre_data,
+            settings.eks.persons_index: person_data,
+        },
+        latency=latency,
+    )
+    model_service, search_service = ModelService(client), SearchService(client)
+    # The genre catalogue is loaded in the lifespan, which the ASGI transport does not run,
+    # so genres are read through the caches.
+    app.dependency_overrides[get_film_service] = lambda: FilmService(model_service, search_service)
+    app.dependency_overrides[get_genre_service] = lambda: GenreService(model_service, search_service)
+    app.dependency_overrides[get_person_service] = lambda: PersonService(model_service, search_service)
+    redis.redis = fakeredis.FakeAsyncRedis()
+    return client
+
+
+async def reset_caches() -> None:
+    await redis.redis.flushall()
+    local_cache.clear()
+
+
+def percentile(latencies: list[float], q: int) -> float:
+    return statistics.quantiles(latencies, n=100)[q - 1] * 1e3
+
+
+async def run_scenario(
+    http: httpx.AsyncClient, scenario: Scenario, *, concurrency: int, requests: int, warmup: int, seed: int
+) -> dict[str, Any]:
+    rng = random.Random(seed)
+    await reset_caches()
+    for _ in range(warmup):
+        response = await http.get(scenario.url(rng))
+        response.raise_for_status()
+
+    urls = [scenario.url(rng) for _ in range(requests)]
+    latencies: list[float] = []
+    queue = iter(urls)
+
+    async def worker() -> None:
+        for url in queue:
+            started = time.perf_counter()
+            response = await http.get(url)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    peaks = []
+    tracemalloc.start()
+    for url in urls[: max(requests // 10, 1)]:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await http.get(url)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    return {
+        "requests": requests,
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(max(latencies) * 1e3, 3),
+        "peak_alloc_kib": round(statistics.mean(peaks) / 1024, 1),
+    }
+
+
+def print_results(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]] | None) -> None:
+    columns = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms", "peak_alloc_kib")
+    print(f"{'scenario':<22}" + "".join(f"{column:>18}" for column in columns))
+    for name, result in results.items():
+        cells = []
+        for column in columns:
+            cell = f"{result[column]:.1f}" if column.endswith(("rps", "kib")) else f"{result[column]:.2f}"
+            if baseline and name in baseline and baseline[name].get(column):
+                cell += f" ({(result[column] / baseline[name][column] - 1) * 100:+.0f}%)"
+            cells.append(f"{cell:>18}")
+        print(f"{name:<22}" + "".join(cells))
+
+
+async def bench(args: argparse.Namespace) -> None:
+    client = install_stand_ins(args.es_latency)
+    results: dict[str, dict[str, Any]] = {}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as http:
+        for scenario in SCENARIOS:
+            results[scenario.name] = await run_scenario(
+                http,
+                scenario,
+                concurrency=args.concurrency,
+                requests=args.requests,
+                warmup=args.warmup,
+                seed=args.seed,
+            )
+
+    report = {
+        "label": args.label,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "es_latency": args.es_latency,
+            "seed": args.seed,
+            "es_calls": client.calls,
+        },
+        "scenarios": results,
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "rb") as file:
+            baseline = orjson.loads(file.read())["scenarios"]
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        print(f"\nResults written to {args.output}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=32, help="number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=2000, help="number of measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=100, help="number of warm-up requests per scenario")
+    parser.add_argument("--es-latency", type=float, default=0.002, help="simulated Elasticsearch latency in seconds")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the request sequence")
+    parser.add_argument("--label", help="label stored with the results, e.g. the commit")
+    parser.add_argument("--output", help="path of the JSON results")
+    parser.add_argument("--baseline", help="path of previous JSON results to compare against")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(bench(parse_args()))
@@ -0,0 +1,48 @@
+"""
+Micro-benchmark of the movies API cache codecs on the test fixtures.
+
+Run from the repository root:
+
+    python -m tests.fastapi_service.benchmarks.bench_codecs
+"""
+
+import timeit
+from typing import Any
+
+from fastapi_service.src.services.redis.codec import CacheCodec
+from fastapi_service.src.services.redis.entry import CacheEntry
+from tests.fastapi_service.testdata.film import film_data
+from tests.fastapi_service.testdata.person import person_data
+
+CODECS = [(serializer, compression) for serializer in ("json", "msgpack") for compression in ("none", "zstd", "lz4")]
+
+PAYLOADS: dict[str, Any] = {
+    "film": film_data[-1],
+    "person": person_data[-1],
+    "films page (50)": film_data[:50],
+}
+
+NUMBER = 2000
+
+
+def bench(name: str, value: Any) -> None:
+    payload = CacheEntry.create(value, ttl=300, delta=0.01).to_payload()
+    print(f"\n{name}")
+    print(f"{'codec':<18}{'bytes':>10}{'ratio':>8}{'encode, us':>12}{'decode, us':>12}")
+    baseline = None
+    for serializer, compression in CODECS:
+        codec = CacheCodec(serializer=serializer, compression=compression, compression_threshold=0)
+        encoded = codec.encode(payload)
+        assert codec.decode(encoded) == payload
+        baseline = baseline or len(encoded)
+        encode_us = timeit.timeit(lambda codec=codec: codec.encode(payload), number=NUMBER) / NUMBER * 1e6
+        decode_us = timeit.timeit(lambda encoded=encoded: CacheCodec.decode(encoded), number=NUMBER) / NUMBER * 1e6
+        print(
+            f"{serializer + '+' + compression:<18}{len(encoded):>10}{len(encoded) / baseline:>8.2f}"
+            f"{encode_us:>12.1f}{decode_us:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    for name, value in PAYLOADS.items():
+        bench(name, value)
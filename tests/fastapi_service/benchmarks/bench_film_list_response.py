@@ -0,0 +1,59 @@
+"""
+Micro-benchmark of the CPU spent turning a page of 50 film documents into a response.
+
+Compares the validating path (model per document, response model per item, FastAPI
+response model validation) with the fast path used by the film list endpoints
+(one TypeAdapter call per page, plain dicts rendered by ORJSONResponse).
+
+Run from the repository root:
+
+    python -m tests.fastapi_service.benchmarks.bench_film_list_response
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from fastapi_service.src.api.v1.models_response.film import DefaultFilmResponse
+from fastapi_service.src.api.v1.transformers.film_transromer import DefaultFilmTransformer
+from fastapi_service.src.models.film import FilmListItem
+from fastapi_service.src.services.film.service import FILM_LIST_ADAPTER, FILM_LIST_FIELDS
+from tests.fastapi_service.testdata.film import film_data
+
+PAGE = [{field: film[field] for field in FILM_LIST_FIELDS} for film in film_data[:50]]
+
+NUMBER = 2000
+
+response_field = create_response_field(name="Response_get_films", type_=list[DefaultFilmResponse])
+
+
+async def validating_path(rows: list[dict[str, Any]]) -> bytes:
+    films = [FilmListItem(**row) for row in rows]
+    items = [DefaultFilmResponse(uuid=film.id, title=film.title, imdb_rating=film.imdb_rating) for film in films]
+    content = await serialize_response(field=response_field, response_content=items)
+    return ORJSONResponse(content=content).body
+
+
+async def fast_path(rows: list[dict[str, Any]]) -> bytes:
+    films = FILM_LIST_ADAPTER.validate_python(rows)
+    return ORJSONResponse(content=DefaultFilmTransformer().to_content_list(films)).body
+
+
+async def bench() -> None:
+    assert orjson.loads(await validating_path(PAGE)) == orjson.loads(await fast_path(PAGE))
+
+    print(f"{'path':<16}{'CPU per request, us':>22}")
+    for name, path in (("validating", validating_path), ("fast", fast_path)):
+        started = time.process_time()
+        for _ in range(NUMBER):
+            await path(PAGE)
+        print(f"{name:<16}{(time.process_time() - started) / NUMBER * 1e6:>22.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(bench())
@@ -0,0 +1,90 @@
+"""
+Load-test scenario of the cache write path against a running Redis.
+
+Simulates concurrent API requests that miss the cache: each one calls a cached
+function that takes `BACKEND_LATENCY` seconds, as an Elasticsearch query would,
+and stores its result. The request latency distribution is compared for:
+
+- awaited: every write is its own awaited SET round trip, the former write path
+- pipelined: concurrent writes share one awaited pipeline
+- write-behind: pipelined writes are not awaited by the request
+
+each with a small and a large connection pool.
+
+Uses the REDIS_* settings of the service; the written entries expire after a minute.
+E.g. with the Redis of docker-compose:
+
+    REDIS_HOST=localhost python -m tests.fastapi_service.benchmarks.load_cache_writes
+"""
+
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Any
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.db import redis
+from fastapi_service.src.services.redis.cache import QueryCacheDecorator
+from fastapi_service.src.services.redis.pipeline import cache_writer
+
+CLIENTS = 200
+REQUESTS_PER_CLIENT = 50
+BACKEND_LATENCY = 0.002
+PAYLOAD = [{"id": str(uuid.uuid4()), "title": "Star Wars", "imdb_rating": 8.6} for _ in range(50)]
+
+SCENARIOS = [
+    # name, max connections, write batch size, write behind
+    ("awaited, pool 20", 20, 1, False),
+    ("pipelined, pool 20", 20, 256, False),
+    ("write-behind, pool 20", 20, 256, True),
+    ("awaited, pool 200", 200, 1, False),
+    ("pipelined, pool 200", 200, 256, False),
+    ("write-behind, pool 200", 200, 256, True),
+]
+
+
+@QueryCacheDecorator(local=False, ttl=60)
+async def search(*, index: str, query: str) -> list[dict[str, Any]]:
+    await asyncio.sleep(BACKEND_LATENCY)
+    return PAYLOAD
+
+
+async def client(run_id: str, client_id: int, latencies: list[float]) -> None:
+    for request_id in range(REQUESTS_PER_CLIENT):
+        started = time.perf_counter()
+        await search(index="load-test", query=f"{run_id}:{client_id}:{request_id}")
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_scenario(max_connections: int, batch_size: int, write_behind: bool) -> list[float]:
+    settings.redis.max_connections = max_connections
+    settings.cache.write_behind = write_behind
+    cache_writer.max_batch_size = batch_size
+    await redis.redis_open()
+
+    latencies: list[float] = []
+    run_id = uuid.uuid4().hex
+    await asyncio.gather(*(client(run_id, client_id, latencies) for client_id in range(CLIENTS)))
+
+    await cache_writer.flush()
+    await (await redis.get_redis()).aclose()
+    return latencies
+
+
+async def load_test() -> None:
+    print(f"{CLIENTS} clients x {REQUESTS_PER_CLIENT} cache misses, backend latency {BACKEND_LATENCY * 1e3:.0f} ms")
+    print(f"{'scenario':<26}{'p50, ms':>10}{'p99, ms':>10}{'max, ms':>10}{'writes/batch':>14}")
+    for name, max_connections, batch_size, write_behind in SCENARIOS:
+        batches, writes = cache_writer.batches, cache_writer.writes
+        latencies = await run_scenario(max_connections, batch_size, write_behind)
+        quantiles = statistics.quantiles(latencies, n=100)
+        per_batch = (cache_writer.writes - writes) / max(cache_writer.batches - batches, 1)
+        print(
+            f"{name:<26}{quantiles[49] * 1e3:>10.2f}{quantiles[98] * 1e3:>10.2f}"
+            f"{max(latencies) * 1e3:>10.2f}{per_batch:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(load_test())
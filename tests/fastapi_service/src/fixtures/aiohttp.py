@@ -1,15 +1,46 @@
+from http import HTTPStatus
 from typing import Any
 
 import aiohttp
+import orjson
 import pytest_asyncio
 
 
 @pytest_asyncio.fixture(scope="module", name="make_get_request")
 def make_get_request():
+    async def inner(url: str, query_data: dict[str, Any] | None = None, headers: dict[str, str] | None = None):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, params=query_data, headers=headers) as response:
+                body = await response.json() if response.status != HTTPStatus.NOT_MODIFIED else None
+                headers = response.headers
+                status = response.status
+
+        return body, headers, status
+
+    return inner
+
+
+@pytest_asyncio.fixture(scope="module", name="make_post_request")
+def make_post_request():
+    async def inner(url: str, json_data: Any | None = None):
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, json=json_data) as response:
+                body = await response.json()
+                headers = response.headers
+                status = response.status
+
+        return body, headers, status
+
+    return inner
+
+
+@pytest_asyncio.fixture(scope="module", name="make_get_ndjson_request")
+def make_get_ndjson_request():
     async def inner(url: str, query_data: dict[str, Any] | None = None):
         async with aiohttp.ClientSession() as session:
             async with session.get(url, params=query_data) as response:
-                body = await response.json()
+                text = await response.text()
+                body = [orjson.loads(line) for line in text.splitlines()] if response.status == HTTPStatus.OK else None
                 headers = response.headers
                 status = response.status
 
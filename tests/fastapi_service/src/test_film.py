@@ -1,3 +1,4 @@
+from collections import Counter
 from http import HTTPStatus
 
 import pytest
@@ -8,6 +9,8 @@ from tests.fastapi_service.testdata.film import STATIC_FILM_ID, STATIC_FILM_TITL
 
 fake = Faker()
 
+UNKNOWN_FILM_ID = fake.uuid4()
+
 
 @pytest.mark.parametrize(
     "query_data, expected_answer, expected_data",
@@ -159,6 +162,34 @@ async def test_film_not_found_by_uuid(make_get_request, uuid, expected_status):
     assert status == expected_status
 
 
+@pytest.mark.parametrize(
+    "ids, expected_status, expected_found",
+    [
+        ([STATIC_FILM_ID, film_data[0]["id"]], HTTPStatus.OK, [True, True]),
+        ([film_data[1]["id"], UNKNOWN_FILM_ID, film_data[1]["id"]], HTTPStatus.OK, [True, False, True]),
+        ([], HTTPStatus.UNPROCESSABLE_ENTITY, None),
+    ],
+)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_films_batch(make_post_request, ids, expected_status, expected_found):
+    """
+    Films batch
+    """
+    url = config.infra.api.dsn + "/api/v1/films/batch"
+    body, _, status = await make_post_request(url, {"ids": ids})
+
+    assert status == expected_status
+
+    if expected_found is not None:
+        assert [item["uuid"] for item in body] == ids
+        assert [item["found"] for item in body] == expected_found
+        for item in body:
+            assert (item["film"] is not None) == item["found"]
+            if item["found"]:
+                assert item["film"]["uuid"] == item["uuid"]
+
+
 @pytest.mark.parametrize(
     "query_data, expected_answer",
     [
@@ -196,3 +227,164 @@ async def test_film_by_uuid_from_cache(make_get_request, uuid, expected_status):
 
     assert status == expected_status
     assert body["uuid"] == uuid
+
+
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        ({"page_size": 25, "sort": "-imdb_rating"}, {"status": HTTPStatus.OK, "length": len(film_data)}),
+        ({"page_size": 25, "sort": "imdb_rating"}, {"status": HTTPStatus.OK, "length": len(film_data)}),
+    ],
+)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_films_cursor(make_get_request, query_data, expected_answer):
+    """
+    Films list with cursor pagination
+    """
+    url = config.infra.api.dsn + "/api/v1/films"
+    film_ids = []
+    cursor = "*"
+    while cursor:
+        body, headers, status = await make_get_request(url, {**query_data, "cursor": cursor})
+        assert status == expected_answer["status"]
+        film_ids.extend(film["uuid"] for film in body)
+        cursor = headers.get("X-Next-Cursor")
+
+    assert len(film_ids) == expected_answer["length"]
+    assert len(set(film_ids)) == expected_answer["length"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_films_invalid_cursor(make_get_request):
+    """
+    Films list with an invalid cursor
+    """
+    url = config.infra.api.dsn + "/api/v1/films"
+    _, _, status = await make_get_request(url, {"cursor": "invalid"})
+
+    assert status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "url_path",
+    [
+        "/api/v1/films",
+        "/api/v1/films/" + STATIC_FILM_ID,
+    ],
+)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_films_not_modified(make_get_request, url_path):
+    """
+    Conditional requests
+    """
+    url = config.infra.api.dsn + url_path
+    _, headers, status = await make_get_request(url)
+
+    assert status == HTTPStatus.OK
+    assert "max-age" in headers["Cache-Control"]
+
+    body, _, status = await make_get_request(url, headers={"If-None-Match": headers["ETag"]})
+
+    assert status == HTTPStatus.NOT_MODIFIED
+    assert body is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_film_not_found_if_none_match_any(make_get_request):
+    """
+    A missing film is not found even when any representation is accepted as not modified
+    """
+    url = config.infra.api.dsn + "/api/v1/films/" + fake.uuid4()
+    _, _, status = await make_get_request(url, headers={"If-None-Match": "*"})
+
+    assert status == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    "query_data, expected_answer",
+    [
+        ({"query": STATIC_FILM_TITLE[:3], "size": 3}, {"status": HTTPStatus.OK, "length": 3}),
+        ({"query": STATIC_FILM_TITLE[:3], "size": 100}, {"status": HTTPStatus.UNPROCESSABLE_ENTITY, "length": None}),
+        ({"query": ""}, {"status": HTTPStatus.UNPROCESSABLE_ENTITY, "length": None}),
+    ],
+)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_suggest_films(make_get_request, query_data, expected_answer):
+    """
+    Film suggestions
+    """
+    url = config.infra.api.dsn + "/api/v1/suggest"
+    body, _, status = await make_get_request(url, query_data)
+
+    assert status == expected_answer["status"]
+
+    if expected_answer["length"] is not None:
+        assert len(body["films"]) == expected_answer["length"]
+        for film in body["films"]:
+            assert set(film) == {"uuid", "title"}
+
+
+@pytest.mark.parametrize(
+    "query_data, expected_data",
+    [
+        ({"page_size": 10}, film_data),
+        (
+            {"page_size": 10, "genre": STATIC_GENRE},
+            [film for film in film_data if STATIC_GENRE in film["genres_names"]],
+        ),
+    ],
+)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_films_facets(make_get_request, query_data, expected_data):
+    """
+    Films with facets
+    """
+    url = config.infra.api.dsn + "/api/v1/films"
+    body, _, status = await make_get_request(url, {**query_data, "facets": "true"})
+
+    assert status == HTTPStatus.OK
+    assert len(body["films"]) == query_data["page_size"]
+
+    genres = Counter(genre for film in expected_data for genre in film["genres_names"])
+    assert {facet["name"]: facet["count"] for facet in body["facets"]["genres"]} == genres
+    assert sum(facet["count"] for facet in body["facets"]["imdb_rating"]) == len(expected_data)
+    assert all(facet["uuid"] and facet["name"] for facet in body["facets"]["directors"])
+
+    _, _, status = await make_get_request(url, {"facets": "true", "cursor": "*"})
+
+    assert status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_films_data")
+async def test_films_export(make_get_ndjson_request):
+    """
+    Films export
+    """
+    url = config.infra.api.dsn + "/api/v1/films/export"
+    body, headers, status = await make_get_ndjson_request(url)
+
+    assert status == HTTPStatus.OK
+    assert headers["Content-Type"].startswith("application/x-ndjson")
+    assert sorted(film["id"] for film in body) == sorted(film["id"] for film in film_data)
+
+    updated_since = sorted(film["updated_at"] for film in film_data)[len(film_data) // 2]
+    body, _, status = await make_get_ndjson_request(
+        url, {"fields": ["id", "updated_at"], "updated_since": updated_since}
+    )
+
+    assert status == HTTPStatus.OK
+    assert sorted(film["id"] for film in body) == sorted(
+        film["id"] for film in film_data if film["updated_at"] >= updated_since
+    )
+    assert all(set(film) == {"id", "updated_at"} for film in body)
+
+    _, _, status = await make_get_ndjson_request(url, {"fields": ["unknown"]})
+
+    assert status == HTTPStatus.BAD_REQUEST
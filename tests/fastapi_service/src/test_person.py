@@ -124,3 +124,25 @@ async def test_persons_films(make_get_request, uuid, expected_status):
 
     assert status == expected_status
     assert len(body) == STATIC_PERSON_NUMBER_OF_FILMS
+
+
+@pytest.mark.parametrize(
+    "uuid, query_data, expected_length",
+    [
+        (STATIC_PERSON_ID, {"page_size": 2, "page_number": 1}, 2),
+        (STATIC_PERSON_ID, {"page_size": 2, "page_number": 3}, STATIC_PERSON_NUMBER_OF_FILMS - 4),
+        (STATIC_PERSON_ID, {"page_size": 2, "page_number": 4}, 0),
+    ],
+)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("prepare_persons_data")
+async def test_persons_films_paging(make_get_request, uuid, query_data, expected_length):
+    """
+    Person films are paged
+    """
+    url = config.infra.api.dsn + f"/api/v1/persons/{uuid}/films"
+    body, _, status = await make_get_request(url, query_data)
+
+    assert status == HTTPStatus.OK
+    assert len(body) == expected_length
+    assert all(film["imdb_rating"] is not None for film in body)
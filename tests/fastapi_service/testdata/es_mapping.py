@@ -29,14 +29,19 @@ MOVIES_MAPPING = {
         "properties": {
             "id": {"type": "keyword"},
             "imdb_rating": {"type": "float"},
-            "title": {"type": "text", "analyzer": "ru_en", "fields": {"raw": {"type": "keyword"}}},
+            "updated_at": {"type": "date"},
+            "title": {
+                "type": "text",
+                "analyzer": "ru_en",
+                "fields": {"raw": {"type": "keyword"}, "suggest": {"type": "search_as_you_type"}},
+            },
             "description": {"type": "text", "analyzer": "ru_en"},
             "genres": {
                 "type": "nested",
                 "dynamic": "strict",
                 "properties": {"id": {"type": "keyword"}, "name": {"type": "text", "analyzer": "ru_en"}},
             },
-            "genres_names": {"type": "keyword"},
+            "genres_names": {"type": "text", "analyzer": "ru_en", "fields": {"raw": {"type": "keyword"}}},
             "directors": {
                 "type": "nested",
                 "dynamic": "strict",
@@ -129,7 +134,7 @@ PERSONS_MAPPING = {
         "dynamic": "strict",
         "properties": {
             "id": {"type": "keyword"},
-            "full_name": {"type": "text", "analyzer": "ru_en"},
+            "full_name": {"type": "text", "analyzer": "ru_en", "fields": {"suggest": {"type": "search_as_you_type"}}},
             "films": {
                 "type": "nested",
                 "dynamic": "strict",
@@ -66,6 +66,8 @@ class Film(BaseModel):
     writers: list[FilmPerson]
     writers_names: list[str]
 
+    updated_at: str
+
 
 class FilmEntity(BaseEntity):
     @property
@@ -82,6 +84,7 @@ class FilmEntity(BaseEntity):
             "actors_names": people.get("actors"),
             "writers": self.create_uuids_and_names_list(people.get("writers"), FilmPerson),
             "writers_names": people.get("writers"),
+            "updated_at": fake.date_time_this_year().isoformat(),
         }
 
 
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from fastapi_service.src.core.exceptions import ServiceUnavailableError
+from fastapi_service.src.services.elasticsearch.breaker import AdaptiveTimeout, CircuitBreaker, CircuitState, Operation
+
+
+async def slow_call() -> dict:
+    await asyncio.sleep(1)
+    return {}
+
+
+async def fast_call() -> dict:
+    return {}
+
+
+@pytest.mark.asyncio
+async def test_breaker_times_out_and_opens():
+    """
+    Calls exceeding the timeout fail with 503 and open the circuit after the threshold
+    """
+    breaker = CircuitBreaker(
+        failure_threshold=2, recovery_timeout=60, timeout=AdaptiveTimeout(minimum=0.01, maximum=0.01)
+    )
+
+    for _ in range(2):
+        with pytest.raises(ServiceUnavailableError, match="timed out"):
+            await breaker.call(slow_call)
+
+    assert breaker.timeouts == 2
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(ServiceUnavailableError, match="circuit is open"):
+        await breaker.call(slow_call)
+
+    assert breaker.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_breaker_times_heavy_operations_apart():
+    """
+    Heavy calls have a timeout of their own and their timeouts do not open the circuit
+    """
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=60,
+        timeout=AdaptiveTimeout(minimum=0.001, maximum=5),
+        operation_timeouts={Operation.AGGREGATE: AdaptiveTimeout(minimum=0.01, maximum=0.01)},
+    )
+
+    for _ in range(10):
+        await breaker.call(fast_call)
+
+    assert breaker.timeout.value < 0.01
+    assert breaker.operation_timeouts[Operation.AGGREGATE].latency is None
+
+    for _ in range(3):
+        with pytest.raises(ServiceUnavailableError, match="timed out"):
+            await breaker.call(slow_call, Operation.AGGREGATE)
+
+    assert breaker.timeouts == 3
+    assert breaker.state == CircuitState.CLOSED
+    assert await breaker.call(fast_call) == {}
@@ -0,0 +1,112 @@
+import asyncio
+
+import orjson
+import pytest
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.db import redis
+from fastapi_service.src.services.redis import invalidation
+from fastapi_service.src.services.redis.invalidation import CacheInvalidationListener
+
+
+def encode(*items: bytes | int) -> bytes:
+    parts = [f"*{len(items)}\r\n".encode()]
+    for item in items:
+        if isinstance(item, int):
+            parts.append(f":{item}\r\n".encode())
+        else:
+            parts.append(f"${len(item)}\r\n".encode() + item + b"\r\n")
+    return b"".join(parts)
+
+
+class StubRedis:
+    """
+    Minimal RESP server: acknowledges any command and subscriptions, and publishes on demand.
+    """
+
+    def __init__(self) -> None:
+        self.subscriptions = 0
+        self.subscribed = asyncio.Event()
+        self.writers: list[asyncio.StreamWriter] = []
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while line := await reader.readline():
+            if not line.startswith(b"*"):
+                continue
+            command = []
+            for _ in range(int(line[1:])):
+                length = int((await reader.readline())[1:])
+                command.append((await reader.readexactly(length + 2))[:-2])
+            if command[0].upper() == b"SUBSCRIBE":
+                self.subscriptions += 1
+                self.writers.append(writer)
+                writer.write(encode(b"subscribe", command[1], 1))
+                self.subscribed.set()
+            else:
+                writer.write(b"+OK\r\n")
+            await writer.drain()
+
+    def publish(self, channel: bytes, data: bytes) -> None:
+        for writer in self.writers:
+            writer.write(encode(b"message", channel, data))
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listener_outlives_socket_timeout(monkeypatch):
+    """
+    An idle subscription is kept past the socket timeout of the shared pool and still gets notifications
+    """
+    stub = StubRedis()
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(settings.redis, "host", "127.0.0.1")
+    monkeypatch.setattr(settings.redis, "port", port)
+    monkeypatch.setattr(settings.redis, "socket_timeout", 0.1)
+    monkeypatch.setattr(settings.redis, "protocol", 2)
+
+    evicted = []
+
+    async def invalidate_models(ids):
+        evicted.extend(ids)
+
+    monkeypatch.setattr(invalidation, "invalidate_models", invalidate_models)
+    listener = CacheInvalidationListener(channel="invalidation", reconnect_delay=0.01)
+
+    await redis.redis_open()
+    try:
+        await listener.start()
+        await asyncio.wait_for(stub.subscribed.wait(), 1)
+        await asyncio.sleep(0.5)
+        stub.publish(b"invalidation", orjson.dumps({"index": "movies", "ids": ["42"]}))
+        await asyncio.sleep(0.1)
+    finally:
+        await listener.stop()
+        await redis.redis_close()
+        server.close()
+
+    assert stub.subscriptions == 1
+    assert evicted == ["42"]
+
+
+def test_invalidation_survives_failing_subscriber(monkeypatch):
+    """
+    A subscriber that raises does not keep the other subscribers or the eviction from running
+    """
+    evicted = []
+    called = []
+
+    async def invalidate_models(ids):
+        evicted.extend(ids)
+
+    def failing():
+        raise RuntimeError("reload failed")
+
+    monkeypatch.setattr(invalidation, "invalidate_models", invalidate_models)
+    listener = CacheInvalidationListener(channel="invalidation")
+    listener.subscribe("genres", failing)
+    listener.subscribe("genres", lambda: called.append(True))
+
+    asyncio.run(listener.handle(orjson.dumps({"index": "genres", "ids": ["42"]})))
+
+    assert called == [True]
+    assert evicted == ["42"]
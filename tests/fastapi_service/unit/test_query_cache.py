@@ -0,0 +1,30 @@
+from fastapi_service.src.services.redis.cache import QueryCacheDecorator
+
+
+async def search(**kwargs):
+    return kwargs
+
+
+async def suggest(**kwargs):
+    return kwargs
+
+
+def test_query_cache_keys_do_not_collide():
+    """
+    Query cache keys tell apart arguments whose string forms concatenate equally
+    """
+    first = QueryCacheDecorator.make_key(search, 0, {"index": "movies", "page_number": 1, "page_size": 12})
+    second = QueryCacheDecorator.make_key(search, 0, {"index": "movies", "page_number": 11, "page_size": 2})
+
+    assert first != second
+
+
+def test_query_cache_keys_include_function():
+    """
+    Query cache keys of different functions called with equal arguments differ
+    """
+    kwargs = {"index": "movies", "page_number": 1, "page_size": 10}
+
+    assert QueryCacheDecorator.make_key(search, 0, kwargs) != QueryCacheDecorator.make_key(suggest, 0, kwargs)
+    assert QueryCacheDecorator.make_key(search, 0, kwargs) == QueryCacheDecorator.make_key(search, 0, dict(kwargs))
+    assert QueryCacheDecorator.make_key(search, 0, kwargs) != QueryCacheDecorator.make_key(search, 1, kwargs)
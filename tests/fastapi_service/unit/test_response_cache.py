@@ -0,0 +1,100 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from fastapi_service.src.services.redis import response_cache
+from fastapi_service.src.services.redis.generation import IndexVersion
+from fastapi_service.src.services.redis.response_cache import CachedRoute, ResponseCacheMiddleware, etag_matches
+
+SINCE = "Wed, 01 Jan 2100 00:00:00 GMT"
+
+
+async def app(scope, receive, send):
+    pass
+
+
+def test_etag_matches_ignores_any():
+    """
+    If-None-Match `*` does not match before a representation is known to exist
+    """
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('W/"abc"', 'W/"xyz", W/"abc"')
+    assert not etag_matches('W/"abc"', "*")
+
+
+def test_response_cache_matches_templates_first():
+    """
+    Path templates take precedence over the path prefixes they are nested in
+    """
+    persons = CachedRoute(index="persons", max_age=60)
+    person_films = CachedRoute(index="persons", max_age=60, related_indexes=("movies",))
+    middleware = ResponseCacheMiddleware(
+        app,
+        routes={"/api/v1/persons": persons, "/api/v1/persons/{person_id}/films": person_films},
+        ttl=60,
+    )
+
+    assert middleware._match_route("/api/v1/persons/42/films") is person_films
+    assert middleware._match_route("/api/v1/persons/42") is persons
+    assert middleware._match_route("/api/v1/persons") is persons
+    assert middleware._match_route("/api/v1/films") is None
+
+
+async def get_film(request):
+    if request.path_params["film_id"] == "missing":
+        return JSONResponse({"detail": "Not found"}, status_code=HTTPStatus.NOT_FOUND)
+    return JSONResponse({"uuid": request.path_params["film_id"]})
+
+
+async def export_films(request):
+    async def lines():
+        yield b"{}\n"
+
+    return StreamingResponse(lines(), media_type="application/json")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def get_version(index):
+        return IndexVersion(generation=1, modified=1000.0)
+
+    monkeypatch.setattr(response_cache.index_generations, "get_version", get_version)
+    films = Starlette(routes=[Route("/api/v1/films/export", export_films), Route("/api/v1/films/{film_id}", get_film)])
+    middleware = ResponseCacheMiddleware(
+        films,
+        routes={"/api/v1/films": CachedRoute(index="movies", max_age=60)},
+        ttl=60,
+        store=False,
+        exclude=("/api/v1/films/export",),
+    )
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://testserver")
+
+
+@pytest.mark.parametrize("headers", [{"If-Modified-Since": SINCE}, {"If-None-Match": "*"}])
+@pytest.mark.asyncio
+async def test_response_cache_not_modified_only_after_route(client, headers):
+    """
+    Conditions that do not name a representation get 304 only when the route finds the resource
+    """
+    assert (await client.get("/api/v1/films/missing", headers=headers)).status_code == HTTPStatus.NOT_FOUND
+
+    response = await client.get("/api/v1/films/42", headers=headers)
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.content == b""
+    assert "etag" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_excluded_paths(client):
+    """
+    Excluded paths are streamed even when the index has not been modified
+    """
+    response = await client.get("/api/v1/films/export", headers={"If-Modified-Since": SINCE})
+
+    assert response.status_code == HTTPStatus.OK
+    assert "etag" not in response.headers
@@ -0,0 +1,41 @@
+import pytest
+
+from fastapi_service.src.core.exceptions import ServiceUnavailableError
+from fastapi_service.src.services.elasticsearch.cursor import FIRST_PAGE_CURSOR
+from fastapi_service.src.services.elasticsearch.search_service import SearchService
+
+
+class FailingClient:
+    def __init__(self, error: Exception):
+        self.error = error
+        self.closed: list[str] = []
+
+    async def open_point_in_time(self, index, keep_alive):
+        return "pit"
+
+    async def search_after(self, **kwargs):
+        raise self.error
+
+    async def close_point_in_time(self, pit_id):
+        self.closed.append(pit_id)
+
+
+@pytest.mark.asyncio
+async def test_first_page_failure_closes_point_in_time():
+    """
+    A point in time opened for a first page that fails is closed
+    """
+    client = FailingClient(ServiceUnavailableError(message="Elasticsearch timed out"))
+
+    with pytest.raises(ServiceUnavailableError):
+        await SearchService(client).search_models_after(index="movies", page_size=10, cursor=FIRST_PAGE_CURSOR)
+
+    assert client.closed == ["pit"]
+
+    client = FailingClient(RuntimeError("boom"))
+
+    assert await SearchService(client).search_models_after(index="movies", page_size=10, cursor=FIRST_PAGE_CURSOR) == (
+        [],
+        None,
+    )
+    assert client.closed == ["pit"]
@@ -0,0 +1,47 @@
+import pytest
+
+from fastapi_service.src.core.config import settings
+from fastapi_service.src.models.film import FilmListItem
+from fastapi_service.src.services.film.warmer import TOP_RATED_SORT, FilmCacheWarmer
+
+
+class EmptyPopularity:
+    async def top(self, kind, n):
+        return []
+
+
+class RecordingFilmService:
+    def __init__(self):
+        self.lists: list[dict] = []
+        self.batches: list[list[str]] = []
+
+    async def get_films(self, **params):
+        self.lists.append(params)
+        return [FilmListItem(id="1", title="First", imdb_rating=9.0), FilmListItem(id="2", title="Second")]
+
+    async def get_films_by_ids(self, film_ids):
+        self.batches.append(film_ids)
+        return []
+
+
+@pytest.mark.asyncio
+async def test_warmer_falls_back_to_top_rated_films():
+    """
+    With the popularity ranking lost, the best rated films and the default film list are warmed
+    """
+    film_service = RecordingFilmService()
+    warmer = FilmCacheWarmer(
+        popularity=EmptyPopularity(), top_n=2, concurrency=1, batch_size=10, interval=0, lock_name="lock"
+    )
+
+    await warmer.warm(film_service)
+
+    assert film_service.batches == [["1", "2"]]
+    assert film_service.lists[0] == {"page_size": 2, "page_number": 1, "sort": TOP_RATED_SORT}
+    assert film_service.lists[1] == {
+        "page_size": settings.api.default_page_size,
+        "page_number": settings.api.default_page_number,
+        "sort": TOP_RATED_SORT,
+        "genre": None,
+    }
+    assert warmer.warmed == 2